@@ -0,0 +1,102 @@
+"""Rendering benchmarks for tuible.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_render.py
+"""
+
+import io
+import threading
+import time
+from contextlib import redirect_stdout
+
+from tuible.concurrent import ConcurrentTable
+from tuible.params import TuibleParams
+from tuible.table import TuibleTable
+
+
+def build_params(rows: int, cols: int) -> TuibleParams:
+    """Build params for a rows x cols table with short cells."""
+    params = TuibleParams()
+    params.size = -1
+    params.plain = False
+    params.mode_stack = ['top', 'head', 'body', 'bot']
+    params.column_count = cols
+    params.mode_columns['head'] = [[f"col{c}"] for c in range(cols)]
+    params.mode_columns['body'] = [[f"r{r}c{c}" for r in range(rows)] for c in range(cols)]
+    return params
+
+
+def render(params: TuibleParams) -> str:
+    """Render a table into a string."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        TuibleTable(params).execute()
+    return buffer.getvalue()
+
+
+def legacy_row_bytes(table: TuibleTable, is_head: bool, col_count: int) -> int:
+    """Bytes of a row template as the per-cell renderer wrote it.
+
+    That renderer sent the edge color before every edge and each cell
+    style followed by a reset, and did not reset at the end of the row.
+    """
+    edge, index_style, cell_style, _, border, left_border = table._row_style(is_head, col_count)
+    edge_text = f"\x1b[{edge[0]}m{edge[1]}"
+    parts = [edge_text] if left_border else []
+    if index_style is not None:
+        parts += [f"\x1b[{index_style}m{{}}\x1b[0m"] + ([edge_text] if border else [])
+    parts += ([f"\x1b[{cell_style}m{{}}\x1b[0m"] + ([edge_text] if border else [])) * col_count
+    return len(''.join(parts).encode())
+
+
+def bench_sgr_coalescing(rows: int = 2000, cols: int = 8) -> None:
+    """Report bytes saved by SGR coalescing and the render time."""
+    params = build_params(rows, cols)
+    start = time.perf_counter()
+    output = render(params)
+    elapsed = time.perf_counter() - start
+
+    table = TuibleTable(params)
+    escape_bytes = {}
+    for is_head in (True, False):
+        legacy = legacy_row_bytes(table, is_head, cols)
+        coalesced = len(''.join(table._row_template(is_head, cols)[:2]).encode())
+        escape_bytes[is_head] = legacy - coalesced
+    legacy_total = len(output.encode()) + escape_bytes[True] + escape_bytes[False] * rows
+
+    written = len(output.encode())
+    print(f"sgr coalescing: {rows}x{cols} table in {elapsed * 1000:.1f} ms")
+    print(f"  per-cell bytes:  {legacy_total}")
+    print(f"  coalesced bytes: {written}")
+    print(f"  reduction:       {100 * (legacy_total - written) / legacy_total:.1f}%")
+
+
+def bench_concurrent_table(producers: int = 32, rows_per_producer: int = 5000) -> None:
+    """Report the throughput of ConcurrentTable with many producer threads."""
+    output = io.StringIO()
+    table = ConcurrentTable(['producer', 'row', 'value'], colsize=[8, 6, 10], plain=False, stream=output)
+
+    def produce(producer: int) -> None:
+        for row in range(rows_per_producer):
+            table.submit_row([producer, row, row * producer])
+
+    threads = [threading.Thread(target=produce, args=(p,)) for p in range(producers)]
+    start = time.perf_counter()
+    with table:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        submitted = time.perf_counter() - start
+    elapsed = time.perf_counter() - start
+
+    total = producers * rows_per_producer
+    print(f"concurrent table: {producers} producers x {rows_per_producer} rows")
+    print(f"  submit:  {submitted * 1000:.1f} ms ({total / submitted:,.0f} rows/s)")
+    print(f"  written: {elapsed * 1000:.1f} ms ({total / elapsed:,.0f} rows/s, {table.batches_written} writes)")
+
+
+if __name__ == '__main__':
+    bench_sgr_coalescing()
+    bench_concurrent_table()
@@ -2,8 +2,9 @@
 
 __version__ = "0.2.0"
 
-from .core import print_line, print_block, print_table
+from .concurrent import ConcurrentTable
+from .core import print_arrow, print_line, print_block, print_cursor, print_table
 from .params import TuibleParams
 from .table import TuibleTable
 
-__all__ = ['print_line', 'print_block', 'print_table', 'TuibleTable', 'TuibleParams', '__version__']
+__all__ = ['print_line', 'print_block', 'print_table', 'print_cursor', 'print_arrow', 'TuibleTable', 'TuibleParams', 'ConcurrentTable', '__version__']
@@ -0,0 +1,108 @@
+"""Streaming column aggregates for footer rows."""
+
+from typing import Any, List, Optional, Tuple, Union
+
+
+# Aggregate functions accepted by -agg
+AGGREGATE_FUNCTIONS = ('sum', 'min', 'max', 'mean', 'count')
+
+
+def parse_agg_spec(spec: str) -> List[Tuple[int, str]]:
+    """Parse an aggregate specification like '2:sum,3:mean'.
+
+    Columns start at 1.
+
+    Returns:
+        List of (column number, function name) pairs.
+    """
+    aggregates = []
+    for part in spec.split(','):
+        if not part.strip():
+            continue
+        column, _, function = part.partition(':')
+        try:
+            number = int(column)
+        except ValueError:
+            raise Exception(f"Invalid aggregate specification: {spec}")
+        function = function.strip().lower()
+        if number < 1 or function not in AGGREGATE_FUNCTIONS:
+            raise Exception(f"Invalid aggregate specification: {spec}")
+        aggregates.append((number, function))
+    if not aggregates:
+        raise Exception(f"Invalid aggregate specification: {spec}")
+    return aggregates
+
+
+def _number(value: Any) -> Optional[Union[int, float]]:
+    """Return the number in a cell, or None if the cell is not numeric."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    text = str(value).strip()
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def format_number(value: Union[int, float]) -> str:
+    """Format an aggregate result; integral values are shown without decimals."""
+    if isinstance(value, float):
+        if value.is_integer():
+            return str(int(value))
+        return str(round(value, 4))
+    return str(value)
+
+
+class ColumnAggregate:
+    """Running aggregate of one column with O(1) state.
+
+    Cells that are not numbers are skipped by every function except
+    ``count``, which counts the non-empty cells.
+    """
+    __slots__ = ('function', 'count', 'total', 'low', 'high')
+
+    def __init__(self, function: str):
+        if function not in AGGREGATE_FUNCTIONS:
+            raise Exception(f"Unknown aggregate function: {function}")
+        self.function = function
+        self.count = 0
+        self.total: Union[int, float] = 0
+        self.low: Optional[Union[int, float]] = None
+        self.high: Optional[Union[int, float]] = None
+
+    def add(self, value: Any) -> None:
+        """Add one cell to the aggregate."""
+        if self.function == 'count':
+            if value is not None and value != "":
+                self.count += 1
+            return
+        number = _number(value)
+        if number is None:
+            return
+        self.count += 1
+        if self.function == 'min':
+            if self.low is None or number < self.low:
+                self.low = number
+        elif self.function == 'max':
+            if self.high is None or number > self.high:
+                self.high = number
+        else:
+            self.total += number
+
+    def result(self) -> str:
+        """Return the formatted result ('' when no numbers were added)."""
+        if self.function == 'count':
+            return str(self.count)
+        if not self.count:
+            return ""
+        if self.function == 'min':
+            return format_number(self.low)
+        if self.function == 'max':
+            return format_number(self.high)
+        if self.function == 'mean':
+            return format_number(self.total / self.count)
+        return format_number(self.total)
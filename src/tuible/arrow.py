@@ -0,0 +1,92 @@
+"""Apache Arrow input: widths from compute kernels, text converted batch by batch.
+
+``pyarrow`` is optional; it is imported only when Arrow data is printed.
+"""
+
+from collections import Counter
+from itertools import islice, repeat
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def is_arrow(value: Any) -> bool:
+    """Return True for Arrow tables, record batches and readers, without importing pyarrow."""
+    return type(value).__module__.split('.')[0] == 'pyarrow' and hasattr(value, 'schema')
+
+
+def arrow_batches(data: Any, head: Optional[int] = None) -> Tuple[Any, List[Any], int]:
+    """Split Arrow data into record batches, keeping only the first ``head`` rows.
+
+    Tables and batches are sliced without copying; a ``RecordBatchReader``
+    is read into a table first, since widths need a pass over all rows.
+
+    Returns:
+        (schema, record batches, number of rows)
+    """
+    import pyarrow
+
+    if isinstance(data, pyarrow.RecordBatchReader):
+        data = data.read_all()
+    if head is not None:
+        data = data.slice(0, max(0, head))
+    batches = [data] if isinstance(data, pyarrow.RecordBatch) else data.to_batches()
+    return data.schema, batches, data.num_rows
+
+
+def numeric_columns(schema: Iterable[Any]) -> List[int]:
+    """Positions of the integer, floating point and decimal fields of a schema."""
+    import pyarrow.types as types
+
+    return [position for position, field in enumerate(schema)
+            if types.is_integer(field.type) or types.is_floating(field.type) or types.is_decimal(field.type)]
+
+
+def text_column(column: Any) -> Any:
+    """Cast an Arrow column to strings, with nulls as ''.
+
+    Types without a string cast (nested types, invalid UTF-8 binaries)
+    fall back to ``str`` per value.
+    """
+    import pyarrow
+    import pyarrow.compute as compute
+
+    try:
+        text = compute.cast(column, pyarrow.string())
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError):
+        text = pyarrow.array([None if value is None else str(value) for value in column.to_pylist()],
+                             pyarrow.string())
+    return compute.fill_null(text, '')
+
+
+def length_counts(batches: Iterable[Any], num_cols: int) -> List[Dict[int, int]]:
+    """Count the cells of each text length per column with Arrow kernels.
+
+    Only the distinct lengths and their counts are turned into Python
+    objects; the cells themselves stay in Arrow buffers.
+    """
+    import pyarrow.compute as compute
+
+    counts: List[Dict[int, int]] = [Counter() for _ in range(num_cols)]
+    for batch in batches:
+        for col in range(num_cols):
+            lengths = compute.value_counts(compute.utf8_length(text_column(batch.column(col))))
+            for length, count in zip(lengths.field('values').to_pylist(), lengths.field('counts').to_pylist()):
+                counts[col][length] += count
+    return counts
+
+
+def arrow_rows(batches: Iterable[Any],
+               visible_columns: Callable[[], Optional[List[int]]]) -> Iterator[Tuple[str, ...]]:
+    """Yield the rows of record batches as text cells, one batch at a time.
+
+    Each batch is cast to strings by Arrow and turned into Python strings
+    only when its rows are reached, so rows that are never rendered are
+    never materialized. Columns outside the column window (as reported by
+    ``visible_columns`` once rendering starts) are left as ''.
+    """
+    for batch in batches:
+        visible = visible_columns()
+        shown = range(batch.num_columns) if visible is None else visible
+        columns: List[Iterable[str]] = [repeat('')] * batch.num_columns
+        for col in shown:
+            columns[col] = text_column(batch.column(col)).to_pylist()
+        yield from islice(zip(*columns), batch.num_rows)
@@ -0,0 +1,243 @@
+"""Output backends turning a table layout into ANSI, plain, Markdown or HTML text."""
+
+import dataclasses
+import html
+from typing import Any, List, Optional, Sequence
+
+from .encoding import EncodedColumn
+from .layout import TableLayout
+
+
+# Output formats accepted by -format; None picks ansi or plain automatically
+OUTPUT_FORMATS = ('ansi', 'plain', 'markdown', 'html')
+
+
+def parse_output_format(name: str) -> str:
+    """Validate an output format name."""
+    name = name.lower()
+    if name not in OUTPUT_FORMATS:
+        raise Exception(f"Unknown output format: {name} (use {', '.join(OUTPUT_FORMATS)})")
+    return name
+
+
+class TextBackend:
+    """ANSI or plain text from the table's precompiled row templates (the default).
+
+    Unlike the Markdown and HTML backends, this backend does not consume
+    ``TableLayout``: borders and rows are emitted by the table's own
+    ``_format_border`` and ``_format_cells``, whose compiled templates
+    carry the widths, alignments and SGR styles, so ANSI and plain output
+    keep the row cache and the style caches. The layout resolves the same
+    widths and alignments for the other backends.
+    """
+
+    def __init__(self, table: Any):
+        self.table = table
+
+    def top(self) -> Optional[str]:
+        edge = self.table.params.format_edge
+        return self.table._format_border(edge['symbol_topleft'], edge['symbol_topmiddle'], edge['symbol_topright'])
+
+    def bottom(self) -> Optional[str]:
+        edge = self.table.params.format_edge
+        return self.table._format_border(edge['symbol_bottomleft'], edge['symbol_bottommiddle'],
+                                         edge['symbol_bottomright'])
+
+    def head_row(self, cells: Sequence[str], index_cell: str) -> Optional[str]:
+        return self.table._format_cells(cells, is_head=True, index_cell=index_cell)
+
+    def body_row(self, cells: Sequence[str], index_cell: str) -> Optional[str]:
+        return self.table._format_cells(cells, is_head=False, index_cell=index_cell)
+
+    def footer(self, cells: Sequence[str]) -> Optional[str]:
+        return self.table._format_footer(cells)
+
+    def finish(self) -> Optional[str]:
+        return None
+
+
+class MarkdownBackend:
+    """GitHub-flavored Markdown table; cells are padded but never truncated.
+
+    The first head row becomes the Markdown header (an empty one is written
+    if the table has no head); further head rows and the footer follow as
+    ordinary rows. Column alignments come from the body alignment and the
+    per-column overrides of the layout.
+    """
+
+    def __init__(self, table: Any):
+        self.table = table
+        self._layout: Optional[TableLayout] = None
+        self._header_written = False
+
+    def _load(self) -> TableLayout:
+        """Take the table layout, widening columns to the 3 characters a rule needs.
+
+        Columns are also widened by the escapes of the pipes in their cells,
+        so escaped cells stay aligned.
+        """
+        if self._layout is None:
+            layout = self.table.layout()
+            escaped = self._escaped_widths(len(layout.widths))
+            self._layout = dataclasses.replace(
+                layout, widths=[max(3, width, extra) for width, extra in zip(layout.widths, escaped)],
+                index_width=max(3, layout.index_width) if layout.index_width else 0)
+        return self._layout
+
+    def _escaped_widths(self, col_count: int) -> List[int]:
+        """Width of the cells with pipes of each data column, counting their escapes."""
+        widths = [0] * col_count
+        for mode, columns in self.table.params.mode_columns.items():
+            if mode == 'idx':
+                continue
+            for col, column in enumerate(columns[:col_count]):
+                cells = column.values if isinstance(column, EncodedColumn) else column
+                widths[col] = max(widths[col], max(
+                    (len(cell) + cell.count('|') for cell in map(str, cells) if '|' in cell), default=0))
+        return widths
+
+    @staticmethod
+    def _cell(text: str, width: int, align: str) -> str:
+        text = text.replace('|', '\\|')
+        if align == 'right':
+            return text.rjust(width)
+        if align == 'center':
+            return text.center(width)
+        return text.ljust(width)
+
+    @staticmethod
+    def _rule_cell(width: int, align: str) -> str:
+        if align == 'right':
+            return '-' * (width - 1) + ':'
+        if align == 'center':
+            return ':' + '-' * (width - 2) + ':'
+        return ':' + '-' * (width - 1)
+
+    def _row(self, cells: Sequence[str], index_cell: str, align: str, by_column: bool = True) -> str:
+        layout = self._load()
+        overrides = layout.column_align if by_column else {}
+        parts = []
+        if layout.index_width:
+            parts.append(self._cell(index_cell, layout.index_width, layout.index_align))
+        parts.extend(self._cell(cell, width, overrides.get(i, align))
+                     for i, (cell, width) in enumerate(zip(cells, layout.widths)))
+        return '| ' + ' | '.join(parts) + ' |'
+
+    def _header(self, cells: Optional[Sequence[str]], index_cell: str) -> str:
+        """Return the header row and the alignment rule below it."""
+        layout = self._load()
+        self._header_written = True
+        if cells is None:
+            cells = [""] * len(layout.widths)
+        rules = [self._rule_cell(layout.index_width, layout.index_align)] if layout.index_width else []
+        rules.extend(self._rule_cell(width, layout.column_align.get(i, layout.body_align))
+                     for i, width in enumerate(layout.widths))
+        return self._row(cells, index_cell, layout.head_align, False) + '\n| ' + ' | '.join(rules) + ' |'
+
+    def top(self) -> Optional[str]:
+        return None
+
+    def bottom(self) -> Optional[str]:
+        return None
+
+    def head_row(self, cells: Sequence[str], index_cell: str) -> Optional[str]:
+        if not self._header_written:
+            return self._header(cells, index_cell)
+        return self._row(cells, index_cell, self._load().head_align, False)
+
+    def body_row(self, cells: Sequence[str], index_cell: str) -> Optional[str]:
+        line = self._row(cells, index_cell, self._load().body_align)
+        if not self._header_written:
+            return self._header(None, "") + '\n' + line
+        return line
+
+    def footer(self, cells: Sequence[str]) -> Optional[str]:
+        line = self._row(cells, "", self._load().foot_align)
+        if not self._header_written:
+            return self._header(None, "") + '\n' + line
+        return line
+
+    def finish(self) -> Optional[str]:
+        self._header_written = False
+        return None
+
+
+class HtmlBackend:
+    """HTML ``<table>`` with ``thead``, ``tbody`` and ``tfoot`` sections.
+
+    Cells are escaped and never truncated; alignments other than left are
+    written as ``text-align`` styles and index cells as row headers.
+    """
+
+    def __init__(self, table: Any):
+        self.table = table
+        self._layout: Optional[TableLayout] = None
+        self._section: Optional[str] = None
+        self._open = False
+
+    def _enter(self, section: str) -> str:
+        """Return the tags that close the current section and open ``section``."""
+        if self._layout is None:
+            self._layout = self.table.layout()
+        tags = []
+        if not self._open:
+            tags.append('<table>')
+            self._open = True
+        if self._section != section:
+            if self._section is not None:
+                tags.append(f'</{self._section}>')
+            tags.append(f'<{section}>')
+            self._section = section
+        return '\n'.join(tags) + '\n'
+
+    @staticmethod
+    def _cell(tag: str, text: str, align: str) -> str:
+        style = f' style="text-align: {align}"' if align in ('center', 'right') else ''
+        return f'<{tag}{style}>{html.escape(text)}</{tag}>'
+
+    def _row(self, cells: Sequence[str], index_cell: Optional[str], tag: str, align: str,
+             by_column: bool = True) -> str:
+        layout = self._layout
+        overrides = layout.column_align if by_column else {}
+        parts = []
+        if layout.index_width:
+            parts.append(self._cell('th', index_cell or "", layout.index_align))
+        parts.extend(self._cell(tag, cell, overrides.get(i, align)) for i, cell in enumerate(cells))
+        return '<tr>' + ''.join(parts) + '</tr>'
+
+    def top(self) -> Optional[str]:
+        return None
+
+    def bottom(self) -> Optional[str]:
+        return self.finish()
+
+    def head_row(self, cells: Sequence[str], index_cell: str) -> Optional[str]:
+        prefix = self._enter('thead')
+        return prefix + self._row(cells, index_cell, 'th', self._layout.head_align, False)
+
+    def body_row(self, cells: Sequence[str], index_cell: str) -> Optional[str]:
+        prefix = self._enter('tbody') if self._section != 'tbody' else ''
+        return prefix + self._row(cells, index_cell, 'td', self._layout.body_align)
+
+    def footer(self, cells: Sequence[str]) -> Optional[str]:
+        prefix = self._enter('tfoot')
+        return prefix + self._row(cells, "", 'td', self._layout.foot_align)
+
+    def finish(self) -> Optional[str]:
+        if not self._open:
+            return None
+        tags: List[str] = []
+        if self._section is not None:
+            tags.append(f'</{self._section}>')
+        tags.append('</table>')
+        self._section = None
+        self._open = False
+        return '\n'.join(tags)
+
+
+BACKENDS = {'ansi': TextBackend, 'plain': TextBackend, 'markdown': MarkdownBackend, 'html': HtmlBackend}
+
+
+def create_backend(output_format: Optional[str], table: Any) -> Any:
+    """Create the backend for an output format (None: ANSI or plain text)."""
+    return BACKENDS[output_format or 'ansi'](table)
@@ -0,0 +1,205 @@
+"""Thread-safe table rendering rows submitted from many threads."""
+
+import heapq
+import queue
+import sys
+import threading
+from typing import Any, List, Optional, Sequence, TextIO, Tuple, Union
+
+from .params import TuibleParams
+from .table import TuibleTable, stream_supports_color
+
+
+# Queue item that tells the writer thread to finish
+_CLOSE = object()
+
+ORDERS = ('arrival', 'sequence')
+
+
+class ConcurrentTable:
+    """Table whose rows may be submitted from any thread.
+
+    Producers only put rows on a ``queue.SimpleQueue``; a single writer
+    thread drains the queue in batches, renders the rows and writes every
+    batch with one call, so lines of different threads never interleave.
+    Widths are fixed up front because rows are written as they arrive.
+
+    Args:
+        heads: Head cells.
+        colsize: Column size(s). If int, applies to all columns. If list, per column.
+        order: 'arrival' writes rows in the order they are dequeued;
+            'sequence' writes them by the number passed to ``submit_row``
+            (starting at 0), holding rows back until all lower numbers were
+            written.
+        batch_size: Maximum number of rows rendered per write.
+        index: Add an auto-numbered index column.
+        expected_rows: Expected number of rows, used to size the index column.
+        plain: Force plain output without ANSI escapes (True) or colored output
+            (False). None detects it from the stream and NO_COLOR.
+        stream: Output stream (default: sys.stdout).
+
+    Usage:
+        with ConcurrentTable(['worker', 'result'], colsize=[8, 12]) as table:
+            # from any thread
+            table.submit_row([name, value])
+    """
+
+    def __init__(
+        self,
+        heads: Optional[List[str]] = None,
+        colsize: Union[int, List[int]] = 25,
+        order: str = 'arrival',
+        batch_size: int = 256,
+        index: bool = False,
+        expected_rows: Optional[int] = None,
+        plain: Optional[bool] = None,
+        stream: Optional[TextIO] = None
+    ):
+        if order not in ORDERS:
+            raise Exception(f"Unknown row order: {order}")
+        if heads:
+            num_cols = len(heads)
+        elif isinstance(colsize, list):
+            num_cols = len(colsize)
+        else:
+            raise Exception("ConcurrentTable needs heads or a list of column sizes.")
+
+        self.order = order
+        self.batch_size = max(1, batch_size)
+        self.stream = stream if stream is not None else sys.stdout
+        self.rows_written = 0
+        self.batches_written = 0
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._thread: Optional[threading.Thread] = None
+        self._num_cols = num_cols
+
+        params = TuibleParams()
+        params.plain = not stream_supports_color(self.stream) if plain is None else plain
+        params.fit = False
+        params.mode_stack = ['top', 'head', 'body', 'bot']
+        params.column_count = num_cols
+        if isinstance(colsize, int):
+            params.size = colsize
+        if heads:
+            params.mode_columns['head'] = [[str(cell)] for cell in heads]
+        if index:
+            params.mode_columns['idx'] = []
+            params.index_auto_numbering = True
+            params.expected_rows = expected_rows
+            params.column_count += 1
+        self._table = TuibleTable(params)
+        if isinstance(colsize, list):
+            index_widths = [self._table._natural_index_width()] if index else []
+            self._table.params.column_widths = index_widths + list(colsize)
+
+    def start(self) -> "ConcurrentTable":
+        """Start the writer thread, which writes the top border and the head."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='tuible-writer', daemon=True)
+            self._thread.start()
+        return self
+
+    def submit_row(self, row: Sequence[Any], seq: Optional[int] = None) -> None:
+        """Queue a row for writing; safe to call from any thread.
+
+        Args:
+            row: Cell values of the row.
+            seq: Sequence number of the row (required for 'sequence' order).
+        """
+        if self._closed:
+            raise Exception("Cannot submit rows to a closed table.")
+        if self.order == 'sequence' and seq is None:
+            raise Exception("Rows need a sequence number in 'sequence' order.")
+        self._queue.put((seq, row))
+
+    def close(self) -> None:
+        """Write the remaining rows and the bottom border, then stop the writer.
+
+        Rows still held back in 'sequence' order are written in sequence
+        order. Errors raised in the writer thread are re-raised here.
+        """
+        if not self._closed:
+            self._closed = True
+            self.start()
+            self._queue.put(_CLOSE)
+            self._thread.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def __enter__(self) -> "ConcurrentTable":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _row_line(self, position: int, row: Sequence[Any]) -> str:
+        """Render one body row numbered by its position."""
+        count = len(row)
+        cells = tuple([str(row[i]) if i < count else "" for i in range(self._num_cols)])
+        table = self._table
+        return table._format_cells(cells, is_head=False, index_cell=table._get_index_value(position))
+
+    def _write(self, lines: List[str]) -> None:
+        """Write lines with a single call and flush."""
+        if lines:
+            self.stream.write('\n'.join(lines) + '\n')
+            self.stream.flush()
+            self.batches_written += 1
+
+    def _run(self) -> None:
+        """Writer thread: drain the queue in batches and write them."""
+        try:
+            table = self._table
+            table._check_layout()
+            edge = table.params.format_edge
+            lines = [table._format_border(edge['symbol_topleft'], edge['symbol_topmiddle'], edge['symbol_topright'])]
+            head = table.params.mode_columns.get('head')
+            if head:
+                for row_idx, cells in enumerate(zip(*head)):
+                    lines.append(table._format_cells(cells, is_head=True, index_cell=table._get_index_value(row_idx, is_head=True)))
+            self._write([line for line in lines if line is not None])
+
+            pending: List[Tuple[int, int, Sequence[Any]]] = []
+            next_seq = 0
+            arrivals = 0
+            closed = False
+            while not closed:
+                batch = [self._queue.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                lines = []
+                for item in batch:
+                    if item is _CLOSE:
+                        closed = True
+                        continue
+                    seq, row = item
+                    if self.order == 'arrival':
+                        lines.append(self._row_line(self.rows_written, row))
+                        self.rows_written += 1
+                        continue
+                    heapq.heappush(pending, (seq, arrivals, row))
+                    arrivals += 1
+                    while pending and pending[0][0] <= next_seq:
+                        seq, _, row = heapq.heappop(pending)
+                        lines.append(self._row_line(seq, row))
+                        self.rows_written += 1
+                        next_seq = seq + 1
+                if closed:
+                    while pending:
+                        seq, _, row = heapq.heappop(pending)
+                        lines.append(self._row_line(seq, row))
+                        self.rows_written += 1
+                    bottom = table._format_border(edge['symbol_bottomleft'], edge['symbol_bottommiddle'],
+                                                  edge['symbol_bottomright'])
+                    if bottom is not None:
+                        lines.append(bottom)
+                self._write(lines)
+        except BaseException as error:
+            self._error = error
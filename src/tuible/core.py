@@ -1,17 +1,156 @@
 """Core functions for printing CLI tables."""
 
-from typing import List, Union, Any, Optional
+from typing import Dict, Iterable, Iterator, List, Sequence, TextIO, Tuple, Union, Any, Optional
+from .aggregate import ColumnAggregate, parse_agg_spec
+from .arrow import arrow_batches, arrow_rows, numeric_columns
+from .arrow import length_counts as arrow_length_counts
+from .encoding import EncodedColumn
+from .engine import PROBE_ROWS, EngineChoice, SpilledRows, choose_engine
+from .instrumentation import record_engine_choice
+from .lazy import LazyColumn
+from .numeric import detect_type, is_ndarray, number_formatter, parse_type, parse_type_spec
 from .params import TuibleParams
+from .rows import limit_rows, parse_sort_spec, sort_rows
 from .table import TuibleTable
 
 
+def _body_columns(
+    params: TuibleParams,
+    rows: Iterable[Sequence[Any]],
+    num_cols: int,
+    types: Union[str, Dict[int, str], None] = None,
+    encode: bool = False
+) -> List[List[Any]]:
+    """Transpose rows into columns, padding short rows with ''.
+
+    Cells are converted to text lazily (``LazyColumn``), so columns and
+    rows that are never measured or rendered are never converted. Numeric
+    columns, declared in ``types`` or detected because they hold nothing
+    but ints, floats or Decimals, keep their raw values for the table's
+    numeric formatters and are recorded in ``params.column_types``.
+    NumPy arrays are split into column arrays without visiting the cells.
+    With ``encode`` every column is built as an ``EncodedColumn`` one at a
+    time, and types are detected and converted over its distinct values.
+    """
+    if isinstance(types, str):
+        declared = parse_type_spec(types)
+    else:
+        declared = [parse_type(column, kind) for column, kind in (types or {}).items()]
+    if is_ndarray(rows):
+        body_cols: List[Any] = list(rows.T[:num_cols])
+    elif encode:
+        body_cols = [EncodedColumn([row[i] if i < len(row) else "" for row in rows]) for i in range(num_cols)]
+    else:
+        body_cols = [[] for _ in range(num_cols)]
+        for row in rows:
+            for i in range(num_cols):
+                body_cols[i].append(row[i] if i < len(row) else "")
+
+    known = {column for column, _, _ in declared}
+    column_types = list(declared)
+    for i, column in enumerate(body_cols):
+        encoded = isinstance(column, EncodedColumn)
+        kind = None if i + 1 in known else detect_type(column.values if encoded else column)
+        if kind is not None:
+            column_types.append((i + 1, kind, None))
+        elif i + 1 in known:
+            continue
+        elif encoded:
+            body_cols[i] = column.map(str)
+        else:
+            body_cols[i] = LazyColumn(column.tolist() if is_ndarray(column) else column)
+    params.column_types = column_types or None
+    return body_cols
+
+
+def _prepare_body(
+    params: TuibleParams,
+    rows: Iterable[Sequence[Any]],
+    head: Optional[int],
+    tail: Optional[int],
+    top: Optional[int],
+    by: int,
+    sort: Union[str, Sequence[int], None],
+    sort_buffer: int,
+    sample: Optional[int],
+    engine: Optional[str] = None,
+    memory_budget: Optional[int] = None,
+    latency: str = 'throughput',
+    expected_rows: Optional[int] = None
+) -> Tuple[List[Sequence[Any]], Optional[Iterator[Sequence[Any]]], EngineChoice]:
+    """Sort and limit body rows, pick the layout engine and split off the rows to stream.
+
+    Limits record the original row positions for the index and always lay
+    out in memory. Otherwise the engine comes from ``choose_engine`` (a
+    ``sample`` requests the sample engine): 'sample' and 'two-pass' read
+    only the first rows up front and return the remaining rows as an
+    iterator to stream (two-pass spills them in ``_spill_stream``). The
+    choice is recorded for ``last_engine_choice()``.
+
+    Returns:
+        (rows measured for the layout, rows to stream or None, engine choice)
+    """
+    if sort:
+        rows = sort_rows(rows, parse_sort_spec(sort) if isinstance(sort, str) else sort, sort_buffer)
+    if head is not None or tail is not None or top is not None:
+        selected = limit_rows(rows, head=head, tail=tail, top=top, by=by)
+        params.body_positions = [position for position, _ in selected]
+        choice = EngineChoice('memory', 'row limits', len(selected), memory_budget=memory_budget)
+        record_engine_choice(choice)
+        return [row for _, row in selected], None, choice
+    if sample is not None:
+        engine = 'sample'
+    array = is_ndarray(rows)
+    if engine == 'memory' or (engine is None and (array or (memory_budget is None and latency == 'throughput'))):
+        rows = rows if array else list(rows)
+        reason = 'requested' if engine else 'array input' if array else 'no memory budget'
+        choice = EngineChoice('memory', reason, len(rows), memory_budget=memory_budget)
+        record_engine_choice(choice)
+        return rows, None, choice
+    choice, probe, rest = choose_engine(rows, memory_budget, latency, engine, expected_rows,
+                                        PROBE_ROWS if sample is None else sample)
+    record_engine_choice(choice)
+    if choice.engine == 'memory':
+        probe.extend(rest)
+        return probe, None, choice
+    return probe, rest, choice
+
+
+def _spill_stream(params: TuibleParams, stream: Iterable[Sequence[Any]], num_cols: int) -> SpilledRows:
+    """Run the first pass of the two-pass engine over the streamed rows.
+
+    The rows are spilled to a temporary file while their cells are measured
+    with the formatters the table renders them with; the length counts go
+    to ``params.stream_lengths``. The footer aggregates are fed in the same
+    pass and go to ``params.stream_aggregates``, so the footer is measured
+    with its final values.
+    """
+    formatters = {column - 1: number_formatter(kind, precision, params.thousands)
+                  for column, kind, precision in params.column_types or []}
+    aggregates = [(column - 1, ColumnAggregate(function)) for column, function in params.aggregates or []]
+    spilled = SpilledRows(stream, [formatters.get(i, str) for i in range(num_cols)], aggregates)
+    params.stream_lengths = spilled.length_counts
+    if aggregates:
+        params.stream_aggregates = aggregates
+    return spilled
+
+
+def _aggregates(agg: Union[str, Sequence[Tuple[int, str]], None]) -> Optional[List[Tuple[int, str]]]:
+    """Normalize an aggregate specification to (column, function) pairs."""
+    if not agg:
+        return None
+    return parse_agg_spec(agg) if isinstance(agg, str) else [(column, function) for column, function in agg]
+
+
 def print_line(
     columns: List[Any],
     colsize: Union[int, List[int]] = 25,
     color1: str = '36',
     color2: str = '35',
     format_style: str = '',
-    is_centered: bool = False
+    is_centered: bool = False,
+    plain: Optional[bool] = None,
+    file: Optional[TextIO] = None
 ) -> None:
     """
     Print a single line of table columns with formatting.
@@ -23,8 +162,12 @@ def print_line(
         color2: ANSI color code for body (default: '35' magenta).
         format_style: Additional style for body (e.g., '4;' for underline).
         is_centered: Whether to center-align the body.
+        plain: Force plain output without ANSI escapes (True) or colored output
+            (False). None detects it from stdout and NO_COLOR.
+        file: Output stream (default: the current sys.stdout).
     """
     params = TuibleParams()
+    params.plain = plain
     params.format_edge['color'] = color1
     params.format_body['color'] = color2
     params.format_body['esc'] = format_style
@@ -41,7 +184,7 @@ def print_line(
     params.mode_stack = ['body']
     params.mode_columns['body'] = [[str(col)] for col in columns]
     
-    table = TuibleTable(params)
+    table = TuibleTable(params, file=file)
     table.execute()
 
 
@@ -52,36 +195,116 @@ def print_block(
     color2: str = '35',
     format_style: str = '',
     format_head: str = '4;',
-    is_centered: bool = False
+    is_centered: bool = False,
+    plain: Optional[bool] = None,
+    window_start: Optional[int] = None,
+    frozen_columns: int = 0,
+    head: Optional[int] = None,
+    tail: Optional[int] = None,
+    top: Optional[int] = None,
+    by: int = 1,
+    sort: Union[str, Sequence[int], None] = None,
+    sort_buffer: int = 100000,
+    sample: Optional[int] = None,
+    agg: Union[str, Sequence[Tuple[int, str]], None] = None,
+    output_format: Optional[str] = None,
+    types: Union[str, Dict[int, str], None] = None,
+    thousands: bool = False,
+    encode: bool = False,
+    engine: Optional[str] = None,
+    memory_budget: Optional[int] = None,
+    latency: str = 'throughput',
+    pipelined: bool = False,
+    file: Optional[TextIO] = None
 ) -> None:
     """
     Print a block of table rows with formatting.
 
     Args:
-        rows: List of rows, each row is a list of columns.
+        rows: Rows (any iterable), each row is a list of columns. The first
+            row is the head row.
         colsize: Column size. -1 for auto-size based on longest entry.
         color1: ANSI color code for borders (default: '36' cyan).
         color2: ANSI color code for body (default: '35' magenta).
         format_style: Additional style for body rows.
         format_head: Style for head row (default: '4;' underline).
         is_centered: Whether to center-align the body.
+        plain: Force plain output without ANSI escapes (True) or colored output
+            (False). None detects it from stdout and NO_COLOR.
+        window_start: Render only the columns from this data column on that
+            fit the terminal width (None renders all columns).
+        frozen_columns: Number of leading columns kept visible in the window.
+        head: Show only the first N body rows (stops reading rows early).
+        tail: Show only the last N body rows.
+        top: Show only the N largest body rows by column ``by``.
+        by: Column number (starting at 1) compared for ``top``; numbers
+            compare numerically.
+        sort: Sort body rows by columns, e.g. '2,-3' or [2, -3] (starting at
+            1, negative for descending; numbers compare numerically).
+        sort_buffer: Rows sorted in memory; larger inputs are sorted in runs
+            spilled to temporary files and merged.
+        sample: Measure column widths on the first N body rows only and
+            stream the remaining rows (ignored with head/tail/top).
+        agg: Footer aggregates per column, e.g. '2:sum,3:mean' or
+            [(2, 'sum'), (3, 'mean')] (sum, min, max, mean or count),
+            computed while the rows are read.
+        output_format: 'ansi', 'plain', 'markdown' or 'html' (None picks
+            ansi or plain like ``plain``).
+        types: Numeric column types, e.g. '2:int,3:float:2' or
+            {2: 'int', 3: 'percent:1'} (int, float, decimal or percent with
+            optional digits after the point). Other columns holding only
+            ints, floats or Decimals are detected. Numeric columns are
+            aligned right.
+        thousands: Show thousands separators in numeric columns.
+        encode: Dictionary-encode the body columns: each distinct value is
+            stored, measured and aligned once and cells keep 4-byte codes
+            (for columns with few distinct values).
+        engine: Layout engine: 'memory' (exact widths, rows held in memory),
+            'two-pass' (exact widths, rows spilled to a temporary file) or
+            'sample' (widths from the first rows, the rest streamed). None
+            picks one from the input size, ``memory_budget`` and ``latency``;
+            the choice is reported by
+            ``tuible.instrumentation.last_engine_choice()``.
+        memory_budget: Bytes the body rows may take in memory before the
+            automatic choice avoids the in-memory engine.
+        latency: 'throughput' or 'interactive' (prefers streaming so the
+            first rows appear early).
+        pipelined: Render the lines in chunks while a background thread
+            writes the previous chunks (for slow terminals and pipes).
+        file: Output stream (default: the current sys.stdout).
     """
-    if not rows:
-        return
+    if is_ndarray(rows):
+        if not len(rows):
+            return
+        head_row, rows = rows[0], rows[1:]
+    else:
+        rows = iter(rows)
+        head_row = next(rows, None)
+        if head_row is None:
+            return
 
     params = TuibleParams()
+    params.plain = plain
+    params.window_start = window_start
+    params.frozen_columns = frozen_columns
     params.format_edge['color'] = color1
     params.format_body['color'] = color2
     params.format_body['esc'] = format_style
     params.format_body['align'] = 'center' if is_centered else 'left'
     params.format_head['esc'] = format_head
+    params.format_foot['color'] = color2
     params.size = colsize
+    params.aggregates = _aggregates(agg)
+    params.output_format = output_format
+    params.thousands = thousands
+    params.encode_columns = encode
+    params.pipelined = pipelined
     
     # In TuibleParams, body is stored as columns: List[List[str]]
     # We need to transpose rows to columns
-    num_cols = len(rows[0])
-    head_row = rows[0]
-    body_rows = rows[1:]
+    num_cols = len(head_row)
+    body_rows, stream, choice = _prepare_body(params, rows, head, tail, top, by, sort, sort_buffer, sample,
+                                              engine, memory_budget, latency)
     
     params.mode_stack = ['head', 'body']
     
@@ -89,61 +312,282 @@ def print_block(
     params.mode_columns['head'] = [[str(cell)] for cell in head_row]
     
     # body columns
-    body_cols = [[] for _ in range(num_cols)]
-    for row in body_rows:
-        for i in range(num_cols):
-            val = str(row[i]) if i < len(row) else ""
-            body_cols[i].append(val)
-    params.mode_columns['body'] = body_cols
+    params.mode_columns['body'] = _body_columns(params, body_rows, num_cols, types, encode)
+    if choice.engine == 'two-pass' and stream is not None:
+        stream = _spill_stream(params, stream, num_cols)
     
     # Set column count for proper width calculation
     params.column_count = num_cols
 
 
-    table = TuibleTable(params)
+    table = TuibleTable(params, body_stream=stream, file=file)
     table.execute()
 
 
 def print_table(
     heads: Optional[List[str]] = None,
-    body: Optional[List[List[str]]] = None,
-    colsize: int = -1
+    body: Optional[Iterable[Sequence[Any]]] = None,
+    colsize: int = -1,
+    plain: Optional[bool] = None,
+    window_start: Optional[int] = None,
+    frozen_columns: int = 0,
+    head: Optional[int] = None,
+    tail: Optional[int] = None,
+    top: Optional[int] = None,
+    by: int = 1,
+    index: bool = False,
+    sort: Union[str, Sequence[int], None] = None,
+    sort_buffer: int = 100000,
+    sample: Optional[int] = None,
+    agg: Union[str, Sequence[Tuple[int, str]], None] = None,
+    index_start: Optional[int] = None,
+    index_step: int = 1,
+    expected_rows: Optional[int] = None,
+    output_format: Optional[str] = None,
+    types: Union[str, Dict[int, str], None] = None,
+    thousands: bool = False,
+    encode: bool = False,
+    engine: Optional[str] = None,
+    memory_budget: Optional[int] = None,
+    latency: str = 'throughput',
+    pipelined: bool = False,
+    file: Optional[TextIO] = None
 ) -> None:
     """
     Print a complete table with optional heads, body, and borders.
 
     Args:
         heads: List of head strings
-        body: List of body rows
+        body: Body rows (any iterable)
         colsize: Column size (-1 for auto)
+        plain: Force plain output without ANSI escapes (True) or colored output
+            (False). None detects it from stdout and NO_COLOR.
+        window_start: Render only the columns from this data column on that
+            fit the terminal width (None renders all columns).
+        frozen_columns: Number of leading columns kept visible in the window.
+        head: Show only the first N body rows (stops reading rows early).
+        tail: Show only the last N body rows.
+        top: Show only the N largest body rows by column ``by``.
+        by: Column number (starting at 1) compared for ``top``; numbers
+            compare numerically.
+        index: Add an auto-numbered index column; limited rows keep the
+            number of their original position.
+        sort: Sort body rows by columns, e.g. '2,-3' or [2, -3] (starting at
+            1, negative for descending; numbers compare numerically).
+        sort_buffer: Rows sorted in memory; larger inputs are sorted in runs
+            spilled to temporary files and merged.
+        sample: Measure column widths on the first N body rows only and
+            stream the remaining rows (ignored with head/tail/top).
+        agg: Footer aggregates per column, e.g. '2:sum,3:mean' or
+            [(2, 'sum'), (3, 'mean')] (sum, min, max, mean or count),
+            computed while the rows are read.
+        index_start: Number of the first body row (default 1).
+        index_step: Step between numbered body rows.
+        expected_rows: Expected number of body rows, used to size the index
+            column when rows are streamed from an iterator without a length.
+        output_format: 'ansi', 'plain', 'markdown' or 'html' (None picks
+            ansi or plain like ``plain``).
+        types: Numeric column types, e.g. '2:int,3:float:2' or
+            {2: 'int', 3: 'percent:1'} (int, float, decimal or percent with
+            optional digits after the point). Other columns holding only
+            ints, floats or Decimals are detected. Numeric columns are
+            aligned right.
+        thousands: Show thousands separators in numeric columns.
+        encode: Dictionary-encode the body columns: each distinct value is
+            stored, measured and aligned once and cells keep 4-byte codes
+            (for columns with few distinct values).
+        engine: Layout engine: 'memory' (exact widths, rows held in memory),
+            'two-pass' (exact widths, rows spilled to a temporary file) or
+            'sample' (widths from the first rows, the rest streamed). None
+            picks one from the input size, ``memory_budget`` and ``latency``;
+            the choice is reported by
+            ``tuible.instrumentation.last_engine_choice()``.
+        memory_budget: Bytes the body rows may take in memory before the
+            automatic choice avoids the in-memory engine.
+        latency: 'throughput' or 'interactive' (prefers streaming so the
+            first rows appear early).
+        pipelined: Render the lines in chunks while a background thread
+            writes the previous chunks (for slow terminals and pipes).
+        file: Output stream (default: the current sys.stdout).
     """
-    rows = []
-    if heads:
-        rows.append(heads)
-    if body:
-        rows.extend(body)
-    
-    if not rows:
+    params = TuibleParams()
+    body_rows: List[Sequence[Any]] = []
+    stream = None
+    choice = None
+    if body is not None:
+        body_rows, stream, choice = _prepare_body(params, body, head, tail, top, by, sort, sort_buffer, sample,
+                                                  engine, memory_budget, latency, expected_rows)
+    if not heads and not len(body_rows):
         return
 
-    params = TuibleParams()
     params.size = colsize
+    params.plain = plain
+    params.window_start = window_start
+    params.frozen_columns = frozen_columns
+    params.aggregates = _aggregates(agg)
+    params.output_format = output_format
+    params.thousands = thousands
+    params.encode_columns = encode
+    params.pipelined = pipelined
     params.mode_stack = ['top', 'head', 'body', 'bot']
     
-    num_cols = len(rows[0])
+    num_cols = len(heads) if heads else len(body_rows[0])
     params.column_count = num_cols
+
+    if index:
+        params.mode_columns['idx'] = []
+        params.index_auto_numbering = True
+        params.index_start = index_start
+        params.index_step = index_step
+        params.expected_rows = expected_rows
+        params.column_count += 1
     
     if heads:
         params.mode_columns['head'] = [[str(cell)] for cell in heads]
     
-    if body:
-        body_cols = [[] for _ in range(num_cols)]
-        for row in body:
-            for i in range(num_cols):
-                val = str(row[i]) if i < len(row) else ""
-                body_cols[i].append(val)
-        params.mode_columns['body'] = body_cols
+    body_columns = _body_columns(params, body_rows, num_cols, types, encode)
+    if len(body_rows):
+        params.mode_columns['body'] = body_columns
+    if choice is not None and choice.engine == 'two-pass' and stream is not None:
+        stream = _spill_stream(params, stream, num_cols)
+
+
+    table = TuibleTable(params, body_stream=stream, file=file)
+    table.execute()
+
+
+def _fetch_rows(cursor: Any, batch_size: int) -> Iterator[Sequence[Any]]:
+    """Yield the rows of a DB-API cursor, fetched ``batch_size`` rows at a time."""
+    fetchmany = cursor.fetchmany
+    while True:
+        batch = fetchmany(batch_size)
+        if not batch:
+            return
+        yield from batch
+
+
+def print_cursor(
+    cursor: Any,
+    batch_size: int = 1000,
+    sample: Optional[int] = None,
+    colsize: int = -1,
+    plain: Optional[bool] = None,
+    index: bool = False,
+    agg: Union[str, Sequence[Tuple[int, str]], None] = None,
+    expected_rows: Optional[int] = None,
+    output_format: Optional[str] = None,
+    types: Union[str, Dict[int, str], None] = None,
+    thousands: bool = False,
+    pipelined: bool = False,
+    file: Optional[TextIO] = None
+) -> None:
+    """
+    Print the result set of an executed DB-API cursor as a table.
+
+    Head cells come from ``cursor.description``. Rows are pulled with
+    ``fetchmany(batch_size)`` and streamed: column widths and types are
+    taken from the first ``sample`` rows (default: the first batch), so
+    memory stays bounded by the batch and sample size for any result size.
+
+    Args:
+        cursor: DB-API 2.0 cursor after ``execute()``.
+        batch_size: Rows fetched per ``fetchmany`` call.
+        sample: Rows measured for the column widths (default: batch_size).
+        colsize: Column size (-1 for auto)
+        plain: Force plain output without ANSI escapes (True) or colored output
+            (False). None detects it from stdout and NO_COLOR.
+        index: Add an auto-numbered index column.
+        agg: Footer aggregates per column, e.g. '2:sum,3:mean'.
+        expected_rows: Expected number of rows, used to size the index
+            column (default: ``cursor.rowcount`` when the driver knows it).
+        output_format: 'ansi', 'plain', 'markdown' or 'html'.
+        types: Numeric column types, e.g. '2:int,3:float:2'.
+        thousands: Show thousands separators in numeric columns.
+        pipelined: Render the lines in chunks while a background thread
+            writes the previous chunks.
+        file: Output stream (default: the current sys.stdout).
+    """
+    if batch_size < 1:
+        raise Exception("Batch size must be at least 1.")
+    if cursor.description is None:
+        raise Exception("The cursor has no result set.")
+    heads = [column[0] for column in cursor.description]
+    if expected_rows is None:
+        rowcount = getattr(cursor, 'rowcount', -1)
+        expected_rows = rowcount if isinstance(rowcount, int) and rowcount >= 0 else None
+    print_table(
+        heads, _fetch_rows(cursor, batch_size), colsize=colsize, plain=plain, index=index,
+        sample=batch_size if sample is None else sample, agg=agg, expected_rows=expected_rows,
+        output_format=output_format, types=types, thousands=thousands, pipelined=pipelined, file=file)
+
+
+def print_arrow(
+    data: Any,
+    heads: Optional[List[str]] = None,
+    colsize: int = -1,
+    plain: Optional[bool] = None,
+    window_start: Optional[int] = None,
+    frozen_columns: int = 0,
+    head: Optional[int] = None,
+    index: bool = False,
+    index_start: Optional[int] = None,
+    index_step: int = 1,
+    output_format: Optional[str] = None,
+    pipelined: bool = False,
+    file: Optional[TextIO] = None
+) -> None:
+    """
+    Print an Apache Arrow table, record batch or record batch reader.
+
+    Column widths are measured with Arrow compute kernels (cast to string,
+    UTF-8 length, value counts) over the record batches, so no cell becomes
+    a Python object for the layout. Rows are then rendered batch by batch;
+    only the rows printed (the first ``head`` rows) of the displayed
+    columns are converted to Python strings. Numeric columns are aligned
+    right. Requires ``pyarrow``.
+
+    Args:
+        data: ``pyarrow.Table``, ``RecordBatch`` or ``RecordBatchReader``.
+        heads: Head cells (default: the schema's column names).
+        colsize: Column size (-1 for auto)
+        plain: Force plain output without ANSI escapes (True) or colored output
+            (False). None detects it from stdout and NO_COLOR.
+        window_start: Render only the columns from this data column on that
+            fit the terminal width (None renders all columns).
+        frozen_columns: Number of leading columns kept visible in the window.
+        head: Show only the first N rows (sliced without copying).
+        index: Add an auto-numbered index column.
+        index_start: Number of the first body row (default 1).
+        index_step: Step between numbered body rows.
+        output_format: 'ansi', 'plain', 'markdown' or 'html'.
+        pipelined: Render the lines in chunks while a background thread
+            writes the previous chunks.
+        file: Output stream (default: the current sys.stdout).
+    """
+    schema, batches, num_rows = arrow_batches(data, head)
+    num_cols = len(schema)
+
+    params = TuibleParams()
+    params.size = colsize
+    params.plain = plain
+    params.window_start = window_start
+    params.frozen_columns = frozen_columns
+    params.output_format = output_format
+    params.pipelined = pipelined
+    params.mode_stack = ['top', 'head', 'body', 'bot']
+    params.column_count = num_cols
+    params.mode_columns['head'] = [[str(cell)] for cell in heads or schema.names]
+    params.stream_lengths = arrow_length_counts(batches, num_cols)
 
+    if index:
+        params.mode_columns['idx'] = []
+        params.index_auto_numbering = True
+        params.index_start = index_start
+        params.index_step = index_step
+        params.expected_rows = num_rows
+        params.column_count += 1
 
-    table = TuibleTable(params)
+    table = TuibleTable(params, body_stream=arrow_rows(batches, lambda: table.visible_columns), file=file)
+    # cells arrive as text from Arrow; the identity formatters only align the numeric columns
+    table.column_formatters.update(dict.fromkeys(numeric_columns(schema), str))
     table.execute()
@@ -0,0 +1,95 @@
+"""Dictionary-encoded body columns for low-cardinality data."""
+
+from array import array
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Union
+
+
+class EncodedColumn:
+    """Body column storing each distinct value once plus a code per cell.
+
+    Codes are kept in a compact ``array('I')`` (4 bytes per cell) that
+    indexes ``values``. The column behaves like a read-only list of its
+    cells, so every row stage works on it unchanged, while widths are
+    measured over the distinct values and their aligned texts are cached
+    per width and alignment. Memory and render work therefore scale with
+    the number of distinct values rather than with the number of rows.
+
+    Args:
+        cells: Cell values; cells of different types never share a code
+            (1, 1.0 and True stay apart) and unhashable cells are stored
+            as their text.
+    """
+    __slots__ = ('values', 'codes', '_aligned')
+
+    def __init__(self, cells: Iterable[Any] = (), values: Union[List[Any], None] = None,
+                 codes: Union[array, None] = None):
+        if values is not None and codes is not None:
+            self.values = values
+            self.codes = codes
+        else:
+            self.values, self.codes = self._encode(list(cells))
+        self._aligned: Dict[Tuple[int, Callable[[str, int], str]], List[str]] = {}
+
+    @staticmethod
+    def _encode(cells: List[Any]) -> Tuple[List[Any], array]:
+        """Return the distinct values in order of appearance and the code of every cell."""
+        if len(set(map(type, cells))) <= 1:
+            # one type: bulk encode in C; unhashable cells or NaNs (never
+            # equal to themselves) fall back to the general path
+            try:
+                values = list(dict.fromkeys(cells))
+                lookup = {value: code for code, value in enumerate(values)}
+                return values, array('I', map(lookup.__getitem__, cells))
+            except (KeyError, TypeError):
+                pass
+        keys = []
+        for cell in cells:
+            try:
+                hash(cell)
+            except TypeError:
+                cell = str(cell)
+            keys.append(cell if type(cell) is str else (type(cell), cell))
+        codes: Dict[Any, int] = {}
+        array_codes = array('I', [codes.setdefault(key, len(codes)) for key in keys])
+        return [key if type(key) is str else key[1] for key in codes], array_codes
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, position: Union[int, slice]) -> Any:
+        if isinstance(position, slice):
+            return [self.values[code] for code in self.codes[position]]
+        return self.values[self.codes[position]]
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self.values.__getitem__, self.codes)
+
+    def map(self, function: Callable[[Any], Any]) -> "EncodedColumn":
+        """Return a column whose distinct values went through ``function``; codes are shared."""
+        return EncodedColumn(values=list(map(function, self.values)), codes=self.codes)
+
+    def length_counts(self) -> Dict[int, int]:
+        """Return how many cells have each text length, counted over the codes."""
+        counts: Dict[int, int] = {}
+        for code, count in Counter(self.codes).items():
+            length = len(self.values[code])
+            counts[length] = counts.get(length, 0) + count
+        return counts
+
+    def max_length(self) -> int:
+        """Length of the longest distinct value."""
+        return max(map(len, self.values), default=0)
+
+    def aligned(self, width: int, align: Callable[[str, int], str]) -> List[str]:
+        """Return the distinct values aligned to a width, computed once per width and aligner."""
+        key = (width, align)
+        texts = self._aligned.get(key)
+        if texts is None:
+            texts = [align(value, width) for value in self.values]
+            self._aligned[key] = texts
+        return texts
+
+    def aligned_cells(self, width: int, align: Callable[[str, int], str]) -> Iterator[str]:
+        """Yield the aligned text of every cell by looking up its code."""
+        return map(self.aligned(width, align).__getitem__, self.codes)
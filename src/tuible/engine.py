@@ -0,0 +1,178 @@
+"""Selection of the layout engine from input size, memory budget and latency."""
+
+import operator
+import os
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .aggregate import ColumnAggregate
+from .rows import read_spilled_rows, spill_rows
+
+
+# Layout engines: exact widths over rows kept in memory, exact widths over
+# rows spilled to a temporary file, or widths measured on a sample
+ENGINES = ('memory', 'two-pass', 'sample')
+
+# Latency preferences: the whole table at once, or the first rows early
+LATENCIES = ('throughput', 'interactive')
+
+# Rows read up front to estimate the row size (and the sample size)
+PROBE_ROWS = 1000
+
+# Bytes of a list slot holding a cell, on top of the cell object
+SLOT_BYTES = 8
+
+
+@dataclass(frozen=True)
+class EngineChoice:
+    """Layout engine picked for a table and why.
+
+    Attributes:
+        engine: 'memory', 'two-pass' or 'sample'.
+        reason: Short explanation of the choice.
+        rows: Known or estimated number of body rows (None if unknown).
+        row_bytes: Estimated memory of one body row held for layout.
+        memory_budget: Memory budget in bytes the choice was made for.
+    """
+    engine: str
+    reason: str
+    rows: Optional[int] = None
+    row_bytes: int = 0
+    memory_budget: Optional[int] = None
+
+    @property
+    def estimated_bytes(self) -> Optional[int]:
+        """Estimated memory of all body rows held for layout (None if unknown)."""
+        return None if self.rows is None else self.rows * self.row_bytes
+
+
+def _row_bytes(rows: Sequence[Sequence[Any]]) -> int:
+    """Average memory of the probed rows: the cell objects plus their list slots."""
+    if not rows:
+        return 0
+    getsizeof = sys.getsizeof
+    total = sum(sum(map(getsizeof, row)) + SLOT_BYTES * len(row) for row in rows)
+    return total // len(rows)
+
+
+def _text_size(row: Any) -> int:
+    """Approximate characters of a row in a text file (lines count as they are)."""
+    if isinstance(row, str):
+        return len(row)
+    return sum(len(cell) + 1 if isinstance(cell, str) else SLOT_BYTES for cell in row)
+
+
+def _input_rows(rows: Iterable[Sequence[Any]], probe: Sequence[Sequence[Any]],
+                expected_rows: Optional[int]) -> Optional[int]:
+    """Number of body rows from ``__len__``, the length hint, the file size or ``expected_rows``."""
+    if hasattr(rows, '__len__'):
+        return len(rows)
+    hint = operator.length_hint(rows, 0)
+    if hint:
+        return len(probe) + hint
+    fileno = getattr(rows, 'fileno', None)
+    if fileno is not None and probe:
+        try:
+            size = os.fstat(fileno()).st_size
+        except (OSError, ValueError):
+            size = 0
+        chars = sum(map(_text_size, probe))
+        if size and chars:
+            return max(len(probe), size * len(probe) // chars)
+    return expected_rows
+
+
+def choose_engine(
+    rows: Iterable[Sequence[Any]],
+    memory_budget: Optional[int] = None,
+    latency: str = 'throughput',
+    engine: Optional[str] = None,
+    expected_rows: Optional[int] = None,
+    probe_rows: int = PROBE_ROWS
+) -> Tuple[EngineChoice, List[Sequence[Any]], Iterator[Sequence[Any]]]:
+    """Pick the layout engine for body rows.
+
+    The first ``probe_rows`` rows are read to estimate the memory of a row;
+    the row count comes from ``__len__``, the length hint, the size of a
+    file the rows are read from, or ``expected_rows``. Inputs that fit the
+    probe or the ``memory_budget`` are laid out in memory. Otherwise an
+    'interactive' latency streams the rows with widths from the probe, and
+    'throughput' keeps them in memory without a budget or measures them in
+    two passes over a temporary file. An explicit ``engine`` overrides the
+    choice.
+
+    Returns:
+        (choice, probed rows, iterator over the remaining rows)
+    """
+    if engine is not None and engine not in ENGINES:
+        raise Exception(f"Invalid engine: {engine}")
+    if latency not in LATENCIES:
+        raise Exception(f"Invalid latency: {latency}")
+    iterator = iter(rows)
+    probe = list(islice(iterator, probe_rows))
+    row_bytes = _row_bytes(probe)
+    count = len(probe) if len(probe) < probe_rows else _input_rows(rows, probe, expected_rows)
+
+    if engine is not None:
+        reason = 'requested'
+    elif len(probe) < probe_rows:
+        engine, reason = 'memory', 'input fits in the probe'
+    elif memory_budget is not None and count is not None and count * row_bytes <= memory_budget:
+        engine, reason = 'memory', 'estimated size fits the memory budget'
+    elif latency == 'interactive':
+        engine, reason = 'sample', 'interactive latency'
+    elif memory_budget is None:
+        engine, reason = 'memory', 'no memory budget'
+    elif count is None:
+        engine, reason = 'two-pass', 'unknown input size with a memory budget'
+    else:
+        engine, reason = 'two-pass', 'estimated size exceeds the memory budget'
+    return EngineChoice(engine, reason, count, row_bytes, memory_budget), probe, iterator
+
+
+class SpilledRows:
+    """Body rows written to a temporary file while their cell lengths are counted.
+
+    The first pass reads the input once, pickles every row to an anonymous
+    temporary file and counts the text lengths of each column, so the
+    layout is exact without holding the rows in memory. Iterating reads
+    the rows back for the render pass; the file is closed at the end.
+
+    Args:
+        rows: Body rows; cells must be picklable.
+        converters: Text conversion of each data column, as used to render.
+        aggregates: Footer aggregates fed with the raw cells during the
+            first pass, so the footer is final before the layout is made.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]], converters: Sequence[Callable[[Any], str]],
+                 aggregates: Sequence[Tuple[int, ColumnAggregate]] = ()):
+        self.count = 0
+        self.length_counts: List[Dict[int, int]] = [Counter() for _ in converters]
+        self._file = spill_rows(self._measure(rows, converters, aggregates))
+
+    def _measure(self, rows: Iterable[Sequence[Any]], converters: Sequence[Callable[[Any], str]],
+                 aggregates: Sequence[Tuple[int, ColumnAggregate]]) -> Iterator[Sequence[Any]]:
+        """Pass the rows through, counting them and the text lengths of their cells."""
+        columns = list(zip(self.length_counts, converters))
+        for row in rows:
+            count = len(row)
+            for col, (lengths, convert) in enumerate(columns):
+                lengths[len(convert(row[col])) if col < count else 0] += 1
+            for col, aggregate in aggregates:
+                aggregate.add(row[col] if col < count else "")
+            self.count += 1
+            yield row
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Sequence[Any]]:
+        try:
+            yield from read_spilled_rows(self._file)
+        finally:
+            self._file.close()
+
@@ -0,0 +1,86 @@
+"""Index column labels addressed by global row position."""
+
+from typing import List, Optional
+
+
+def label_width(number: int) -> int:
+    """Number of characters of an integer label, sign included."""
+    width = 1 if number >= 0 else 2
+    number = abs(number)
+    while number >= 10:
+        number //= 10
+        width += 1
+    return width
+
+
+class RowIndex:
+    """Labels of the index column.
+
+    Auto-numbered body rows are labelled ``start + step * position``, where
+    position is the global position of the row among all body rows. Explicit
+    labels are looked up by position. Both are O(1) per row and independent
+    of which rows were rendered before, so tables rendered in chunks or pages
+    only need to know the position of their first row.
+
+    Args:
+        auto: Number the rows instead of using explicit labels.
+        head_rows: Number of head rows.
+        header_values: Explicit labels of the head rows; labels beyond the
+            head rows continue into the body rows.
+        body_values: Explicit labels of the body rows.
+        start: Label of the first body row. None continues after the head
+            rows (or starts at 1 without head rows).
+        step: Difference between the labels of consecutive body rows.
+        no_header_index: Leave the head row labels empty when numbering.
+    """
+
+    def __init__(
+        self,
+        auto: bool,
+        head_rows: int = 0,
+        header_values: Optional[List[str]] = None,
+        body_values: Optional[List[str]] = None,
+        start: Optional[int] = None,
+        step: int = 1,
+        no_header_index: bool = False
+    ):
+        self.auto = auto
+        self.head_rows = head_rows
+        self.header_values = header_values or []
+        self.body_values = body_values or []
+        self.start = start if start is not None else (head_rows if head_rows > 0 else 1)
+        self.step = step
+        self.no_header_index = no_header_index
+
+    def head_label(self, row: int) -> str:
+        """Label of a head row."""
+        if self.auto:
+            return "" if self.no_header_index else str(row)
+        return self.header_values[row] if row < len(self.header_values) else ""
+
+    def body_label(self, position: int) -> str:
+        """Label of the body row at a global position."""
+        if self.auto:
+            return str(self.start + self.step * position)
+        if position < len(self.body_values):
+            return self.body_values[position]
+        extra = self.head_rows + position
+        if extra < len(self.header_values):
+            return self.header_values[extra]
+        return ""
+
+    def width(self, row_count: int, minimum: int = 1) -> int:
+        """Width of the widest label for ``row_count`` body rows.
+
+        Auto-numbered labels grow monotonically, so only the first and the
+        last label are measured; explicit labels are measured once each.
+        """
+        if not self.auto:
+            labels = self.header_values + self.body_values
+            return max(minimum, max((len(label) for label in labels), default=0))
+        width = label_width(self.start)
+        if row_count > 1:
+            width = max(width, label_width(self.start + self.step * (row_count - 1)))
+        if self.head_rows and not self.no_header_index:
+            width = max(width, label_width(self.head_rows - 1))
+        return max(minimum, width)
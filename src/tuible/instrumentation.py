@@ -0,0 +1,52 @@
+"""Instrumentation helpers for tuible caches and renderers."""
+
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics in the shape of ``functools.lru_cache().cache_info()``."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 without lookups)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+# Process-wide caches by name (functions decorated with functools.lru_cache)
+_CACHES: Dict[str, Any] = {}
+
+
+def register_cache(name: str, cached: Any) -> None:
+    """Register an ``lru_cache`` function for style_cache_info()."""
+    _CACHES[name] = cached
+
+
+def style_cache_info() -> Dict[str, CacheInfo]:
+    """Report hits, misses and size of each process-wide style cache."""
+    return {name: CacheInfo(*cached.cache_info()) for name, cached in _CACHES.items()}
+
+
+def clear_style_caches() -> None:
+    """Empty all process-wide style caches."""
+    for cached in _CACHES.values():
+        cached.cache_clear()
+
+
+# Layout engine picked for the most recently prepared table
+_LAST_ENGINE_CHOICE: Optional[Any] = None
+
+
+def record_engine_choice(choice: Any) -> None:
+    """Record the ``EngineChoice`` of a table for last_engine_choice()."""
+    global _LAST_ENGINE_CHOICE
+    _LAST_ENGINE_CHOICE = choice
+
+
+def last_engine_choice() -> Optional[Any]:
+    """Report the layout engine picked for the most recent table, and why (None before any)."""
+    return _LAST_ENGINE_CHOICE
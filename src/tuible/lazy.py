@@ -0,0 +1,53 @@
+"""Body columns that convert their cells to text on first use."""
+
+from itertools import chain
+from typing import Any, Iterator, List, Union
+
+
+# Cells converted at once while a column is iterated
+BLOCK_SIZE = 256
+
+
+class LazyColumn:
+    """Body column of raw cell values, each converted with ``str`` once when needed.
+
+    Cells are replaced by their text in place, so the text is memoized
+    without a second list and ``__str__`` runs at most once per cell.
+    Indexing converts a single cell; iterating converts block by block, so
+    a consumer that stops early (a row limit or a partially read table)
+    only pays for the blocks it reached. Columns that are never measured
+    or rendered, like those outside a column window, are never converted.
+
+    Args:
+        cells: Raw cell values; the list is taken over and converted in place.
+    """
+    __slots__ = ('cells', '_converted')
+
+    def __init__(self, cells: List[Any]):
+        self.cells = cells
+        self._converted = 0    # length of the converted prefix
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, position: Union[int, slice]) -> Any:
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self.cells)))]
+        cell = self.cells[position]
+        if type(cell) is not str:
+            cell = self.cells[position] = str(cell)
+        return cell
+
+    def _block(self, start: int) -> List[str]:
+        """Convert and return the cells of the block starting at ``start``."""
+        end = start + BLOCK_SIZE
+        texts = list(map(str, self.cells[start:end]))
+        self.cells[start:end] = texts
+        if start <= self._converted:
+            self._converted = max(self._converted, end)
+        return texts
+
+    def __iter__(self) -> Iterator[str]:
+        if self._converted >= len(self.cells):
+            return iter(self.cells)
+        return chain.from_iterable(map(self._block, range(0, len(self.cells), BLOCK_SIZE)))
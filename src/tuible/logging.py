@@ -0,0 +1,153 @@
+"""Logging handler that writes records as tuible table rows."""
+
+import logging
+import logging.handlers
+import sys
+import threading
+import time
+from typing import List, Optional, Sequence, TextIO, Tuple
+
+from .params import TuibleParams
+from .table import TuibleTable, stream_supports_color
+
+
+# (record attribute, width) pairs; None widths are learned from the first flush
+DEFAULT_COLUMNS: List[Tuple[str, Optional[int]]] = [
+    ('asctime', 23), ('levelname', 8), ('name', None), ('message', None)]
+
+_DEFAULT_FORMATTER = logging.Formatter()
+
+
+class TableHandler(logging.handlers.BufferingHandler):
+    """Buffer log records and write them as aligned table rows.
+
+    Records are buffered like in ``MemoryHandler`` and written in one call
+    when ``capacity`` records are buffered, when a record of ``flush_level``
+    or above arrives, or ``flush_interval`` seconds after the oldest
+    buffered record, from a timer thread when no other record arrives in
+    time. Rows are formatted with a precompiled row template, so the cost
+    per record is a template ``format`` call.
+
+    Args:
+        columns: (attribute, width) pairs. Attributes are LogRecord
+            attributes; 'message' and 'asctime' are formatted by the handler
+            (times and exceptions with the handler's formatter, if set).
+            A None width is learned from the records of the first flush
+            (capped at ``max_learned_width``) and kept stable afterwards.
+        capacity: Number of buffered records that triggers a flush.
+        flush_level: Records at or above this level flush the buffer at once.
+        flush_interval: Seconds after the oldest buffered record at which the
+            buffer is flushed (None disables the time threshold).
+        show_head: Write a head row with the attribute names first.
+        max_learned_width: Largest width learned for a column.
+        plain: Force plain output without ANSI escapes (True) or colored output
+            (False). None detects it from the stream and NO_COLOR.
+        stream: Output stream (default: sys.stderr).
+    """
+
+    def __init__(
+        self,
+        columns: Optional[Sequence[Tuple[str, Optional[int]]]] = None,
+        capacity: int = 100,
+        flush_level: int = logging.ERROR,
+        flush_interval: Optional[float] = 1.0,
+        show_head: bool = True,
+        max_learned_width: int = 40,
+        plain: Optional[bool] = None,
+        stream: Optional[TextIO] = None
+    ):
+        super().__init__(capacity)
+        self.columns = list(columns or DEFAULT_COLUMNS)
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self.show_head = show_head
+        self.max_learned_width = max_learned_width
+        self.plain = plain
+        self.stream = stream if stream is not None else sys.stderr
+        self._table: Optional[TuibleTable] = None
+        self._buffer_start: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        """Flush on capacity, on ``flush_level`` or after ``flush_interval``.
+
+        When the records stay buffered, a timer is started with the time
+        left until ``flush_interval``, so they are written even if no
+        further record arrives.
+        """
+        if self._buffer_start is None:
+            self._buffer_start = time.monotonic()
+        if len(self.buffer) >= self.capacity or record.levelno >= self.flush_level:
+            return True
+        if self.flush_interval is None:
+            return False
+        remaining = self.flush_interval - (time.monotonic() - self._buffer_start)
+        if remaining <= 0:
+            return True
+        if self._timer is None:
+            self._timer = threading.Timer(remaining, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+        return False
+
+    def _cells(self, record: logging.LogRecord) -> Tuple[str, ...]:
+        """Return the cell values of a record."""
+        formatter = self.formatter or _DEFAULT_FORMATTER
+        cells = []
+        for attribute, _ in self.columns:
+            if attribute == 'message':
+                value = record.getMessage()
+            elif attribute == 'asctime':
+                value = formatter.formatTime(record, formatter.datefmt)
+            else:
+                value = getattr(record, attribute, "")
+            cells.append(str(value).replace('\n', ' '))
+        return tuple(cells)
+
+    def _build_table(self, rows: List[Tuple[str, ...]]) -> TuibleTable:
+        """Create the table with fixed widths and learn the missing ones from rows."""
+        widths = []
+        for col, (attribute, width) in enumerate(self.columns):
+            if width is None:
+                learned = max((len(row[col]) for row in rows), default=0)
+                if self.show_head:
+                    learned = max(learned, len(attribute))
+                width = max(1, min(learned, self.max_learned_width))
+            widths.append(width)
+
+        params = TuibleParams()
+        params.plain = not stream_supports_color(self.stream) if self.plain is None else self.plain
+        params.fit = False
+        params.column_count = len(self.columns)
+        params.mode_columns['head'] = [[attribute] for attribute, _ in self.columns]
+        table = TuibleTable(params)
+        table.params.column_widths = widths
+        table._check_layout()
+        return table
+
+    def flush(self) -> None:
+        """Render the buffered records and write them with a single call."""
+        self.acquire()
+        try:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self.buffer:
+                return
+            rows = [self._cells(record) for record in self.buffer]
+            lines = []
+            if self._table is None:
+                self._table = self._build_table(rows)
+                if self.show_head:
+                    lines.append(self._table._format_cells(tuple(attribute for attribute, _ in self.columns),
+                                                           is_head=True))
+            for row, record in zip(rows, self.buffer):
+                lines.append(self._table._format_cells(row))
+                if record.exc_info:
+                    lines.append((self.formatter or _DEFAULT_FORMATTER).formatException(record.exc_info))
+            self.stream.write('\n'.join(lines) + '\n')
+            self.stream.flush()
+            self.buffer.clear()
+            self._buffer_start = None
+        finally:
+            self.release()
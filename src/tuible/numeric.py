@@ -0,0 +1,180 @@
+"""Typed numeric columns: detection, precompiled formatters and widths."""
+
+import numbers
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .index import label_width
+
+
+# Column types accepted by -types
+NUMERIC_TYPES = ('int', 'float', 'decimal', 'percent')
+
+# Digits after the decimal point when a percent column declares no precision
+PERCENT_PRECISION = 1
+
+
+def _to_int(value: Any) -> int:
+    """Convert text or an integral number to int; fractions raise ValueError instead of being cut off."""
+    number = int(value)
+    if not isinstance(value, str) and number != value:
+        raise ValueError(f"Not an integer: {value!r}")
+    return number
+
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    'int': _to_int, 'float': float, 'decimal': lambda value: Decimal(str(value).strip()), 'percent': float}
+
+
+def parse_type_spec(spec: str) -> List[Tuple[int, str, Optional[int]]]:
+    """Parse a column type specification like '2:int,3:float:2,4:percent'.
+
+    Columns start at 1; the optional third part is the number of digits
+    after the decimal point.
+
+    Returns:
+        List of (column number, type, precision or None) triples.
+    """
+    types = []
+    for part in spec.split(','):
+        if not part.strip():
+            continue
+        column, _, kind = part.partition(':')
+        kind, _, precision = kind.partition(':')
+        try:
+            number = int(column)
+            digits = int(precision) if precision.strip() else None
+        except ValueError:
+            raise Exception(f"Invalid type specification: {spec}")
+        kind = kind.strip().lower()
+        if number < 1 or kind not in NUMERIC_TYPES or (digits is not None and digits < 0):
+            raise Exception(f"Invalid type specification: {spec}")
+        types.append((number, kind, digits))
+    if not types:
+        raise Exception(f"Invalid type specification: {spec}")
+    return types
+
+
+def parse_type(column: int, kind: str) -> Tuple[int, str, Optional[int]]:
+    """Parse one declared type like 'float:2' of a column (starting at 1)."""
+    return parse_type_spec(f"{column}:{kind}")[0]
+
+
+def is_ndarray(value: Any) -> bool:
+    """Return True for NumPy arrays, without importing NumPy."""
+    return type(value).__module__ == 'numpy' and hasattr(value, 'ndim') and hasattr(value, 'dtype')
+
+
+def detect_type(values: Sequence[Any]) -> Optional[str]:
+    """Detect the numeric type of a column from its values.
+
+    Only the distinct value types are inspected, so text columns and the
+    strings of the command line are never parsed. NumPy arrays are typed
+    by their dtype.
+
+    Returns:
+        'int', 'float' or 'decimal', or None for columns that are not
+        entirely numeric (booleans count as text).
+    """
+    if is_ndarray(values):
+        return {'i': 'int', 'u': 'int', 'f': 'float'}.get(values.dtype.kind)
+    kinds = set(map(type, values))
+    if not kinds:
+        return None
+    detected = 'int'
+    for kind in kinds:
+        if issubclass(kind, bool):
+            return None
+        if issubclass(kind, numbers.Integral):
+            continue
+        if issubclass(kind, Decimal):
+            detected = 'float' if detected == 'float' else 'decimal'
+        elif issubclass(kind, numbers.Real):
+            detected = 'float'
+        else:
+            return None
+    return detected
+
+
+@lru_cache(maxsize=None)
+def number_formatter(kind: str, precision: Optional[int] = None, thousands: bool = False) -> Callable[[Any], str]:
+    """Return a shared formatter turning a cell of a typed column into text.
+
+    The format spec is compiled into a bound ``str.format`` once per type,
+    precision and separator setting. Numbers are formatted directly;
+    strings (e.g. from the command line) are converted to the column type
+    first, and integral floats in int columns are formatted as ints. Any
+    other cell, such as '3.7' or 3.7 in an int column or 'n/a', is shown
+    as ``str(value)``, so no value is cut short.
+    """
+    separator = ',' if thousands else ''
+    if kind == 'int':
+        spec = f'{separator}d'
+    elif kind == 'percent':
+        spec = f'{separator}.{PERCENT_PRECISION if precision is None else precision}%'
+    elif precision is None:
+        spec = separator
+    else:
+        spec = f'{separator}.{precision}f'
+    render = ('{:' + spec + '}').format
+    convert = _CONVERTERS[kind]
+
+    def format_cell(value: Any) -> str:
+        try:
+            return render(value)
+        except (TypeError, ValueError):
+            pass
+        if isinstance(value, str) or (kind == 'int' and isinstance(value, numbers.Real)):
+            try:
+                return render(convert(value))
+            except (ArithmeticError, TypeError, ValueError):
+                pass
+        return str(value)
+
+    return format_cell
+
+
+def int_width(number: int, thousands: bool = False) -> int:
+    """Number of characters of a formatted integer, counted from its digits."""
+    width = label_width(number)
+    if thousands:
+        digits = width - (number < 0)
+        width += (digits - 1) // 3
+    return width
+
+
+def format_column(
+    values: Sequence[Any],
+    kind: str,
+    precision: Optional[int] = None,
+    thousands: bool = False
+) -> Tuple[List[str], Optional[int]]:
+    """Format the cells of a typed column.
+
+    NumPy arrays are formatted with vectorized ``numpy.char`` operations
+    (thousands separators fall back to the per-cell formatter). Columns of
+    integers get their width from the digit counts of their smallest and
+    largest value, without measuring the strings.
+
+    Returns:
+        (cell texts, width of the widest cell or None if not known)
+    """
+    width = None
+    if is_ndarray(values):
+        import numpy
+
+        if kind == 'int' and values.dtype.kind in 'iu' and len(values):
+            width = max(int_width(int(values.min()), thousands), int_width(int(values.max()), thousands))
+        if not thousands and values.dtype.kind in 'iuf':
+            if width is not None:
+                return numpy.char.mod('%d', values).tolist(), width
+            if kind == 'percent':
+                digits = PERCENT_PRECISION if precision is None else precision
+                return numpy.char.mod(f'%.{digits}f%%', values * 100).tolist(), None
+            if kind in ('float', 'decimal') and precision is not None:
+                return numpy.char.mod(f'%.{precision}f', values).tolist(), None
+        values = values.tolist()
+    elif kind == 'int' and values and set(map(type, values)) == {int}:
+        width = max(int_width(min(values), thousands), int_width(max(values), thousands))
+    return list(map(number_formatter(kind, precision, thousands), values)), width
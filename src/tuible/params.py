@@ -3,7 +3,94 @@
 import sys
 import os
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Union, Any
+from itertools import chain
+from typing import Iterable, Iterator, List, Dict, Optional, TextIO, Tuple, Union, Any
+from .aggregate import ColumnAggregate, parse_agg_spec
+from .backends import parse_output_format
+from .numeric import parse_type_spec
+from .rows import parse_sort_spec
+
+
+# Mode names (and aliases) that switch the current mode of the argument stream
+MODES: Dict[str, str] = {'body': 'body', 'head': 'head', 'top': 'top', 'bot': 'bot',
+                         'idx': 'idx', 'index': 'idx'}
+
+# Options without a value: option -> (field, dict key or None, value to set)
+ALONE_OPTIONS: Dict[str, tuple] = {
+    '-fhc': ('format_head', 'align', 'center'),
+    '-fhl': ('format_head', 'align', 'left'),
+    '-fhr': ('format_head', 'align', 'right'),
+    '-fbc': ('format_body', 'align', 'center'),
+    '-fbl': ('format_body', 'align', 'left'),
+    '-fbr': ('format_body', 'align', 'right'),
+    '-fic': ('format_index', 'align', 'center'),
+    '-fil': ('format_index', 'align', 'left'),
+    '-fir': ('format_index', 'align', 'right'),
+    '-fnc': ('number_align', None, 'center'),
+    '-fnl': ('number_align', None, 'left'),
+    '-fnr': ('number_align', None, 'right'),
+    '-nhi': ('no_header_index', None, True),
+    '-nb':  ('no_border', None, True),
+    '-nib': ('no_index_border', None, True),
+    '-nc':  ('plain', None, True),
+    '-fit': ('fit', None, True),
+    '-ts':  ('thousands', None, True),
+    '-enc': ('encode_columns', None, True),
+    '-pipe': ('pipelined', None, True),
+    '-h':   None,
+    '--help': None,
+}
+
+# Options taking a value: option -> (field, dict key or None, value converter)
+VALUE_OPTIONS: Dict[str, tuple] = {
+    '-ce':    ('format_edge', 'color', str),     # edge color
+    '-cb':    ('format_body', 'color', str),     # body color
+    '-ch':    ('format_head', 'color', str),     # head color
+    '-ci':    ('format_index', 'color', str),    # index color
+    '-cf':    ('format_foot', 'color', str),     # footer color
+    '-fb':    ('format_body', 'esc', str),       # body format/escape codes
+    '-fh':    ('format_head', 'esc', str),       # head format/escape codes
+    '-fi':    ('format_index', 'esc', str),      # index format/escape codes
+    '-ff':    ('format_foot', 'esc', str),       # footer format/escape codes
+    '-size':  ('size', None, int),               # column width
+    '-width': ('max_width', None, int),          # total table width for fitting
+    '-win':   ('window_start', None, int),       # first column of the column window
+    '-frz':   ('frozen_columns', None, int),     # frozen columns in the column window
+    '-head':  ('limit_head', None, int),         # show only the first N body rows
+    '-tail':  ('limit_tail', None, int),         # show only the last N body rows
+    '-top':   ('limit_top', None, int),          # show only the N largest body rows
+    '-by':    ('limit_by', None, int),           # column compared by -top
+    '-sort':  ('sort_columns', None, parse_sort_spec),  # sort body rows by columns
+    '-sortbuf': ('sort_buffer', None, int),      # rows sorted in memory before spilling
+    '-agg':   ('aggregates', None, parse_agg_spec),  # footer aggregates per column
+    '-istart': ('index_start', None, int),       # label of the first auto-numbered body row
+    '-istep': ('index_step', None, int),         # step between auto-numbered body rows
+    '-format': ('output_format', None, parse_output_format),  # ansi, plain, markdown or html
+    '-types': ('column_types', None, parse_type_spec),  # numeric column types
+}
+
+# Edge characters set by -fe, in order
+EDGE_SYMBOLS = ('symbol_leftright', 'symbol_topbottom', 'symbol_topleft', 'symbol_topright',
+                'symbol_bottomleft', 'symbol_bottomright', 'symbol_topmiddle', 'symbol_bottommiddle',
+                'symbol_middleleft', 'symbol_middleright', 'symbol_middle')
+
+
+def read_tokens(stream: TextIO, delimiter: str = '\n', chunk_size: int = 1 << 16) -> Iterator[str]:
+    """Yield delimiter-separated tokens from a text stream, chunk by chunk.
+
+    A trailing delimiter does not produce an extra empty token, so both
+    newline-terminated files and ``find -print0`` style output work.
+    """
+    pending = ''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        parts = (pending + chunk).split(delimiter)
+        pending = parts.pop()
+        yield from parts
+    if pending:
+        yield pending
 
 
 @dataclass
@@ -48,6 +135,8 @@ Index column formatting:
    -fic         - center-align the index column
    -fil         - left-align the index column
    -fir         - right-align the index column (default)
+   -istart <n>  - number of the first body row (default: continues after the head rows)
+   -istep <n>   - step between numbered body rows (default 1)
 
 Head & body formatting:
    -ch <color>  - header color
@@ -56,13 +145,39 @@ Head & body formatting:
    -fb <style>  - body style
    -fhc/-fhl/-fhr - align headers (center/left/right)
    -fbc/-fbl/-fbr - align body text (center/left/right)
+   -fnc/-fnl/-fnr - align numeric columns (center/left/right, default right)
+   -types <spec>  - numeric column types, e.g. 2:int,3:float:2,4:percent
+                    (int/float/decimal/percent, optional digits after the point)
+   -ts            - thousands separators in numeric columns
 
 Layout & borders:
      -size <num>  - column width (-1 for dynamic sizing)
-     -fe <chars>  - edge characters (8 chars: lr, tb, corners, middle)
+     -fe <chars>  - edge characters (8 chars: lr, tb, corners, middle;
+                    3 more set the footer rule: left, right, crossing)
      -nb          - hide left/right borders for a compact display
      -nhi         - hide the auto-generated header index when auto-numbering is enabled
      -nib         - no index border (removes separator between index and data columns)
+     -fit         - fit the columns into the terminal width (automatic for -size -1
+                    on an interactive terminal)
+     -width <num> - fit the columns into <num> characters
+     -win <num>   - column window: show the columns from data column <num> (0-based)
+                    on that fit the terminal width
+     -frz <num>   - keep the first <num> data columns visible in the column window
+     -head <num>  - show only the first <num> body rows
+     -tail <num>  - show only the last <num> body rows
+     -top <num>   - show only the <num> largest body rows ...
+     -by <col>    - ... compared by column <col> (starting at 1, numbers numerically)
+     -sort <cols> - sort body rows by columns, e.g. 2,-3 (minus sorts descending)
+     -sortbuf <n> - rows sorted in memory before spilling to temp files (100000)
+     -agg <spec>  - footer aggregates, e.g. 2:sum,3:mean (sum/min/max/mean/count)
+     -cf <color>  - footer color
+     -ff <style>  - footer style
+     -enc         - dictionary-encode body columns: distinct values are stored,
+                    measured and aligned once (for columns with few distinct values)
+     -nc          - plain output without ANSI escapes (automatic when stdout is not
+                    a terminal or NO_COLOR is set)
+     -format <f>  - output format: ansi, plain, markdown or html
+     -pipe        - pipelined output: render while a background thread writes
 
 ------------------------
 ⚙️ Environment variables
@@ -95,14 +210,19 @@ Try this:
 * tuible idx head col1 col2 body b1 :b11 b2 :b21 -nhi -ch 32 -fh '2;3;4;9;' -nib
 
 
+📥 Token input
+--------------
+   @<file>               - read further arguments from <file>, one per line
+   --tokens-from <file>  - same as @<file>; use - for stdin
+   -0                    - read NUL-delimited arguments from stdin (e.g. find -print0)
+   @@<text>              - literal argument starting with @
+
 Usage: tuible [options] <mode> [<mode arguments>] ... [options]
 Use -h or --help for this message.
 """
 
     mode_columns:   Dict[str, List[List[str]]] = field(default_factory=dict)
-    alone_args:     List[str]       = field(default_factory=lambda: ["-fhc", "-fhl", "-fhr", "-fbc",
-                                                                       "-fbl", "-fbr", "-fic", "-fil", "-fir",
-                                                                       "-nhi", "-nb", "-nib", "-h", "--help"])
+    alone_args:     List[str]       = field(default_factory=lambda: list(ALONE_OPTIONS))
     mode_stack:     List[str]       = field(default_factory=list)
     columns:        List[List[str]] = field(default_factory=list)
     current_mode:   str             = ""
@@ -112,14 +232,44 @@ Use -h or --help for this message.
     column_count:   Optional[int]   = None
     column_widths:  List[int]       = field(default_factory=list)
     no_border:      bool            = False
+    plain:          Optional[bool]  = None
+    fit:            Optional[bool]  = None
+    max_width:      Optional[int]   = None
+    window_start:   Optional[int]   = None
+    frozen_columns: int             = 0
+    row_cache_size: int             = 1024
+    limit_head:     Optional[int]   = None
+    limit_tail:     Optional[int]   = None
+    limit_top:      Optional[int]   = None
+    limit_by:       int             = 1
+    body_positions: Optional[List[int]] = None
+    sort_columns:   Optional[List[int]] = None
+    sort_buffer:    int             = 100000
+    aggregates:     Optional[List[Tuple[int, str]]] = None
+    index_start:    Optional[int]   = None
+    index_step:     int             = 1
+    index_offset:   int             = 0
+    expected_rows:  Optional[int]   = None
+    output_format:  Optional[str]   = None
+    column_types:   Optional[List[Tuple[int, str, Optional[int]]]] = None
+    thousands:      bool            = False
+    number_align:   str             = 'right'
+    body_widths:    Dict[int, int]  = field(default_factory=dict)
+    encode_columns: bool            = False
+    stream_lengths: Optional[List[Dict[int, int]]] = None
+    stream_aggregates: Optional[List[Tuple[int, ColumnAggregate]]] = None
+    pipelined:      bool            = False
     format_head:  Dict            = field(default_factory=lambda: {
                                       'color': '104', 'esc': '1;3;4;', 'align': 'center' })
     format_body:    Dict            = field(default_factory=lambda: {
                                       'color': '96', 'esc': '', 'align': 'left' })
+    format_foot:    Dict            = field(default_factory=lambda: {
+                                      'color': '96', 'esc': '1;', 'align': 'left' })
     format_edge:    Dict            = field(default_factory=lambda: {
                                        'color': '93', 'symbol_leftright': '┃', 'symbol_topbottom': '━',
                                        'symbol_topleft': '┏', 'symbol_topright': '┓', 'symbol_bottomleft': '┗',
-                                       'symbol_bottomright': '┛', 'symbol_topmiddle': '┳', 'symbol_bottommiddle': '┻' })
+                                       'symbol_bottomright': '┛', 'symbol_topmiddle': '┳', 'symbol_bottommiddle': '┻',
+                                       'symbol_middleleft': '┣', 'symbol_middleright': '┫', 'symbol_middle': '╋' })
     format_index:   Dict            = field(default_factory=lambda: {
                                           'color': '31', 'esc': '3;', 'align': 'right', 'size': 3 })
     no_header_index: bool            = False
@@ -137,76 +287,85 @@ Use -h or --help for this message.
     
     @classmethod
     def createFromArguments(cls) -> Optional["TuibleParams"]:
-        """Create TuibleParams from command line arguments and environment variables."""
-        sys_argv = sys.argv[1:]
-        os_env = os.environ.items()
+        """Create TuibleParams from command line arguments and environment variables.
 
+        Environment defaults and command line arguments are parsed in a single
+        pass; a usage message is printed when no mode is given.
+        """
         # check for help
         if len(sys.argv) == 2 and sys.argv[1] in ["-h", "--help"]:
             cls.print_help()
             return None
 
+        params = cls()
+        params.parseArguments(chain(params._environmentArguments(), params._expandArguments(sys.argv[1:])))
+
         # check minimum arguments - at least one mode must be present
-        mode_found = False
-        i = 0
-        while i < len(sys_argv):
-            arg = sys_argv[i]
-            if arg.startswith('-'):
-                # Skip option and its value (if not a standalone option)
-                if arg not in ["-fhc", "-fhl", "-fhr", "-fbc", "-fbl", "-fbr", "-fic", "-fil", "-fir", "-nb", "-h", "--help"]:
-                    i += 2  # skip option and value
-                else:
-                    i += 1  # skip standalone option
-            else:
-                # Found a non-option argument
-                if arg in ["body", "head", "top", "bot", "idx", "index"]:
-                    mode_found = True
-                    break
-                i += 1
-        
-        if not mode_found:
+        if not params.mode_stack:
             print("Usage: tuible body|head|top|bot|idx [body...] [options]")
             return None
 
-        params = cls()
+        return params
 
-        # Parse environment variables
+    def _environmentArguments(self) -> Iterator[str]:
+        """Yield arguments for 'TUIBLE_' prefixed environment variables."""
         env_prefix = 'TUIBLE_'
-        env_argv = []
-        for env_var, value in os_env:
+        for env_var, value in os.environ.items():
             if env_var.startswith(env_prefix):
-                param_name = env_var[len(env_prefix):].lower()
-                env_argv.append('-'+param_name)
-                if '-'+param_name not in params.alone_args:
-                    env_argv.append(value)
-        
-        # Combine environment args with command line args
-        combined_argv = env_argv + sys_argv
-        params.parseArguments(combined_argv)
+                option = '-' + env_var[len(env_prefix):].lower()
+                yield option
+                if option not in self.alone_args:
+                    yield value
+
+    def _expandArguments(self, args: Iterable[str]) -> Iterator[str]:
+        """Yield command line arguments, streaming in tokens from @file, --tokens-from and -0."""
+        args = iter(args)
+        for arg in args:
+            if arg == '-0':
+                yield from read_tokens(sys.stdin, '\0')
+            elif arg == '--tokens-from':
+                source = next(args, None)
+                if source is None:
+                    raise Exception("Parameter --tokens-from requires a value.")
+                yield from self._tokensFrom(source)
+            elif arg.startswith('@@'):
+                yield arg[1:]
+            elif arg.startswith('@') and len(arg) > 1:
+                yield from self._tokensFrom(arg[1:])
+            else:
+                yield arg
 
-        return params
-    
-    def parseArguments(self, args: List[str]) -> None:
-        """Parse a list of arguments to populate the TuibleParams fields."""
-        i, self.col_pos = 0, -1
-       
-        while i < len(args):
-            arg = args[i]
+    @staticmethod
+    def _tokensFrom(source: str) -> Iterator[str]:
+        """Yield newline-delimited tokens from a file, or from stdin for '-'."""
+        if source == '-':
+            yield from read_tokens(sys.stdin)
+            return
+        with open(source, encoding='utf-8') as handle:
+            yield from read_tokens(handle)
+
+    def parseArguments(self, args: Iterable[str]) -> None:
+        """Parse arguments to populate the TuibleParams fields.
+
+        The arguments are consumed in a single pass, so any iterable of
+        tokens works. Columns keep only the lines they were given; missing
+        lines of shorter columns are rendered as blank cells.
+        """
+        self.col_pos = -1
+        tokens = iter(args)
+
+        for arg in tokens:
             if not arg.startswith('-'):
                 # Handle commands and items
-                valid_modes = ["body", "head", "top", "bot", "idx"]
-                
-                if arg in valid_modes:
+                mode = MODES.get(arg)
+                if mode is not None:
                     # It's a command/mode switch
-                    self.current_mode = arg
+                    self.current_mode = mode
                     self._validateCommandPosition(self.current_mode)
                     self.mode_stack.append(self.current_mode)
                     self.is_index_mode = (self.current_mode == 'idx')
 
-                    if self.current_mode not in self.mode_columns:
-                        self.mode_columns[self.current_mode] = []
-                    
-                    self.columns = self.mode_columns[self.current_mode]
+                    self.columns = self.mode_columns.setdefault(self.current_mode, [])
                     self.col_pos = -1 # reset column position
                     if self.current_mode == 'idx':
                         self.index_auto_numbering = True
@@ -215,48 +374,44 @@ Use -h or --help for this message.
                 else:
                     # It's an item for the current mode
                     if self.current_mode == '':
-                        raise Exception(f"First argument must be one of {', '.join(valid_modes)}, got: {arg}")
-                    
-                    self._extractItems([arg])
+                        raise Exception(f"First argument must be one of {', '.join(MODES)}, got: {arg}")
+
+                    self._extractItems(arg)
             else:
                 # It's a parameter
-                param_len = self._extractParameters(args[i:])
-                i += param_len - 1 # -1 because the loop will increment i
-            
-            i += 1
-        
+                self._extractParameters(arg, tokens)
+
+        self._normalizeColumns()
+
+    def _normalizeColumns(self) -> None:
+        """Set the column count and add the missing columns of every mode.
+
+        Columns are not padded to the height of the tallest column: a mode
+        stays sparse, each column holding only its own lines, so a tall
+        multi-row cell costs no empty strings in the other columns.
+        """
         # Set column count if not explicitly set - use max column count from all modes
         if self.column_count is None:
-            max_cols = 0
-            for mode, columns in self.mode_columns.items():
-                if mode == 'idx':
-                    # idx is a single column prepended to body
-                    continue
-                max_cols = max(max_cols, len(columns))
+            max_cols = max((len(columns) for mode, columns in self.mode_columns.items() if mode != 'idx'),
+                           default=0)
             # If idx is present, add 1 for the idx column
             if 'idx' in self.mode_columns:
                 max_cols += 1
             if max_cols > 0:
                 self.column_count = max_cols
-        
+
         # Ensure all modes have the same number of columns (add empty columns if needed)
+        target_cols = 0
         if self.column_count:
-            for mode, columns in self.mode_columns.items():
-                if mode == 'idx':
-                    # idx is special, don't add empty columns
-                    continue
-                target_cols = self.column_count - (1 if 'idx' in self.mode_columns else 0)
-                while len(columns) < target_cols:
-                    columns.append([])  # add empty column
-        
-        # After parsing: fill all columns for each mode to the same height
+            target_cols = self.column_count - (1 if 'idx' in self.mode_columns else 0)
+
         for mode, columns in self.mode_columns.items():
-            if columns:
-                max_rows = max(len(col) for col in columns) if columns else 0
-                for col in columns:
-                    while len(col) < max_rows:
-                        col.append("")  # fill with empty strings
-    
+            if mode == 'idx':
+                # idx is special, don't add empty columns
+                continue
+            if len(columns) < target_cols:
+                columns.extend([] for _ in range(target_cols - len(columns)))
+
     def _validateCommandPosition(self, command: str) -> None:
         """Validate that commands are in a valid order.
         
@@ -272,17 +427,15 @@ Use -h or --help for this message.
         if 'head' in self.mode_stack or 'body' in self.mode_stack:
             raise Exception("'idx' command must come before 'head' or 'body' commands")
     
-    def _extractItems(self, args: List[str]) -> bool:
-        """Extract items for the current mode. Returns True if an item was processed."""
-        arg = args[0]
-
+    def _extractItems(self, arg: str) -> None:
+        """Add one item to the current mode."""
         # index mode handles labels differently
         if self.is_index_mode:
             if len(self.columns) == 0:
                 self.columns.append([])
 
             if arg.startswith(':'):
-                value = arg[1:] if len(arg) > 1 else ""
+                value = arg[1:]
                 self.index_body_values.append(value)
             else:
                 value = arg
@@ -290,94 +443,50 @@ Use -h or --help for this message.
 
             self.columns[0].append(value)
             self.index_auto_numbering = False
-            return True
+            return
 
         # handle continuation in current column (starts with ':')
         if arg.startswith(':'):
             if self.col_pos < 0:
                 raise Exception('":" not allowed before any column is started')
             # remove ':' prefix and add to current column
-            self.columns[self.col_pos].append(arg[1:] if len(arg) > 1 else "")
-        
-        # handle single space " " as empty column start
-        elif arg == " ":
-            self.col_pos += 1
-            if self.col_pos >= len(self.columns):
-                self.columns.append([])
-            self.columns[self.col_pos].append("")
-        
-        # handle normal text (starts a new column in head/body mode)
-        else:
-            self.col_pos += 1
-            if self.col_pos >= len(self.columns):
-                self.columns.append([])
-            self.columns[self.col_pos].append(arg)
-        return True
+            self.columns[self.col_pos].append(arg[1:])
+            return
 
-    def _extractParameters(self, args: List[str]) -> int:
-        """Extract parameters and return the number of arguments consumed."""
-        arg = args[0]
-        
+        # handle normal text (starts a new column in head/body mode),
+        # a single space " " starts an empty column
+        self.col_pos += 1
+        if self.col_pos >= len(self.columns):
+            self.columns.append([])
+        self.columns[self.col_pos].append("" if arg == " " else arg)
+
+    def _extractParameters(self, arg: str, tokens: Iterator[str]) -> None:
+        """Apply one parameter, taking its value from tokens when it needs one."""
         # Handle standalone arguments (no value needed)
         if arg in self.alone_args:
-            if arg == '-nb':
-                self.no_border = True
-            elif arg == '-nhi':
-                self.no_header_index = True
-            elif arg == '-nib':
-                self.no_index_border = True
-            elif arg == '-fhc':
-                self.format_head['align'] = 'center'
-            elif arg == '-fhl':
-                self.format_head['align'] = 'left'
-            elif arg == '-fhr':
-                self.format_head['align'] = 'right'
-            elif arg == '-fbc':
-                self.format_body['align'] = 'center'
-            elif arg == '-fbl':
-                self.format_body['align'] = 'left'
-            elif arg == '-fbr':
-                self.format_body['align'] = 'right'
-            elif arg == '-fic':
-                self.format_index['align'] = 'center'
-            elif arg == '-fil':
-                self.format_index['align'] = 'left'
-            elif arg == '-fir':
-                self.format_index['align'] = 'right'
-            return 1  # consumed 1 argument
+            option = ALONE_OPTIONS.get(arg)
+            if option is not None:
+                self._setOption(option[0], option[1], option[2])
+            return
+
+        # Handle parameters that require a value
+        value = next(tokens, None)
+        if value is None:
+            raise Exception(f"Parameter {arg} requires a value.")
+
+        if arg in VALUE_OPTIONS:
+            name, key, convert = VALUE_OPTIONS[arg]
+            self._setOption(name, key, convert(value))
+        elif arg == '-fe':    # edge characters (8 chars expected)
+            if len(value) >= 8:
+                for symbol, char in zip(EDGE_SYMBOLS, value):
+                    self.format_edge[symbol] = char
         else:
-            # Handle parameters that require a value
-            if len(args) < 2:
-                raise Exception(f"Parameter {arg} requires a value.")
-            value = args[1]
-            
-            if arg == '-ce':      # edge color
-                self.format_edge['color'] = value
-            elif arg == '-cb':    # body color
-                self.format_body['color'] = value
-            elif arg == '-ch':    # head color
-                self.format_head['color'] = value
-            elif arg == '-ci':    # index color
-                self.format_index['color'] = value
-            elif arg == '-fb':    # body format/escape codes
-                self.format_body['esc'] = value
-            elif arg == '-fh':    # head format/escape codes
-                self.format_head['esc'] = value
-            elif arg == '-fi':    # index format/escape codes
-                self.format_index['esc'] = value
-            elif arg == '-fe':    # edge characters (8 chars expected)
-                if len(value) >= 8:
-                    self.format_edge['symbol_leftright'] = value[0]
-                    self.format_edge['symbol_topbottom'] = value[1]
-                    self.format_edge['symbol_topleft'] = value[2]
-                    self.format_edge['symbol_topright'] = value[3]
-                    self.format_edge['symbol_bottomleft'] = value[4]
-                    self.format_edge['symbol_bottomright'] = value[5]
-                    self.format_edge['symbol_topmiddle'] = value[6]
-                    self.format_edge['symbol_bottommiddle'] = value[7]
-            elif arg == '-size':  # column width
-                self.size = int(value)
-            else:
-                print(f"Warning: Unknown parameter {arg}")
-            
-            return 2  # consumed 2 arguments (parameter + value)
+            print(f"Warning: Unknown parameter {arg}")
+
+    def _setOption(self, name: str, key: Optional[str], value: Any) -> None:
+        """Set a field, or a key of a format dict field."""
+        if key is None:
+            setattr(self, name, value)
+        else:
+            getattr(self, name)[key] = value
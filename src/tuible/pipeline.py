@@ -0,0 +1,91 @@
+"""Pipelined output: rendering overlaps with writes from a background thread."""
+
+import queue
+import threading
+from typing import Any, Optional, TextIO
+
+
+# Lines rendered into one chunk before it is handed to the writer thread
+CHUNK_LINES = 256
+
+# Chunks waiting for the writer before rendering blocks (backpressure)
+QUEUE_CHUNKS = 8
+
+# Queue item that tells the writer thread to finish
+_CLOSE = object()
+
+
+class PipelinedWriter:
+    """Write text chunks to a stream from a background thread.
+
+    ``write()`` only puts a chunk on a bounded ``queue.Queue``; a writer
+    thread takes the chunks off and writes and flushes each one. A slow
+    sink (a terminal or an SSH pipe) blocks in the writer thread, where the
+    GIL is released during the system call, so the caller keeps rendering
+    the next chunks meanwhile. When ``max_chunks`` chunks are waiting,
+    ``write()`` blocks until the writer catches up, which bounds memory.
+
+    Args:
+        stream: Output stream.
+        max_chunks: Chunks queued before ``write()`` blocks.
+
+    Usage:
+        with PipelinedWriter(sys.stdout) as writer:
+            for chunk in table.iter_chunks(CHUNK_LINES):
+                writer.write(chunk)
+    """
+
+    def __init__(self, stream: TextIO, max_chunks: int = QUEUE_CHUNKS):
+        self.stream = stream
+        self.chunks_written = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue(max(1, max_chunks))
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name='tuible-pipeline', daemon=True)
+        self._thread.start()
+
+    def write(self, chunk: str) -> None:
+        """Queue a chunk for writing, blocking while the queue is full.
+
+        Errors raised in the writer thread are re-raised here.
+        """
+        self._raise_error()
+        while True:
+            try:
+                self._queue.put(chunk, timeout=0.1)
+                return
+            except queue.Full:
+                if not self._thread.is_alive():
+                    self._raise_error()
+                    raise Exception("The pipeline writer stopped.")
+
+    def close(self) -> None:
+        """Write the queued chunks and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(_CLOSE)
+            self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        """Re-raise an error of the writer thread once."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def __enter__(self) -> "PipelinedWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        """Writer thread: write and flush the chunks until told to close."""
+        try:
+            while True:
+                chunk = self._queue.get()
+                if chunk is _CLOSE:
+                    return
+                self.stream.write(chunk)
+                self.stream.flush()
+                self.chunks_written += 1
+        except BaseException as error:
+            self._error = error
@@ -0,0 +1,145 @@
+"""Rate-limited redrawing of a table that is updated at high frequency."""
+
+import io
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
+
+from .core import print_table
+from .table import stream_is_terminal, stream_supports_color
+
+
+class RefreshScheduler:
+    """Redraw a table at most ``max_fps`` times per second.
+
+    ``update()`` only stores the latest table state, so producers may call it
+    thousands of times per second from any thread. A drawing thread renders
+    the latest state once per frame interval; updates replaced before they
+    were drawn are coalesced into the next frame. ``close()`` always draws
+    the final state.
+
+    On a terminal each frame replaces the previous one in place; on other
+    streams frames are written one after another.
+
+    Counters:
+        frames_drawn: Frames written.
+        updates_coalesced: Updates replaced by a newer one before drawing.
+        frames_dropped: Frame intervals missed because drawing a frame took
+            longer than the interval.
+
+    Args:
+        max_fps: Maximum number of frames per second.
+        table_options: Keyword arguments for ``print_table`` (e.g. colsize).
+        in_place: Redraw frames in place (None: when the stream is a terminal).
+        plain: Force plain output without ANSI escapes (True) or colored output
+            (False). None detects it from the stream and NO_COLOR.
+        stream: Output stream (default: sys.stdout).
+
+    Usage:
+        with RefreshScheduler(max_fps=10) as screen:
+            for state in updates:
+                screen.update(['name', 'value'], state)
+    """
+
+    def __init__(
+        self,
+        max_fps: float = 30.0,
+        table_options: Optional[Dict[str, Any]] = None,
+        in_place: Optional[bool] = None,
+        plain: Optional[bool] = None,
+        stream: Optional[TextIO] = None
+    ):
+        if max_fps <= 0:
+            raise Exception("max_fps must be positive.")
+        self.interval = 1.0 / max_fps
+        self.table_options = dict(table_options or {})
+        self.stream = stream if stream is not None else sys.stdout
+        self.in_place = stream_is_terminal(self.stream) if in_place is None else in_place
+        self.plain = not stream_supports_color(self.stream) if plain is None else plain
+        self.frames_drawn = 0
+        self.updates_coalesced = 0
+        self.frames_dropped = 0
+        self._condition = threading.Condition()
+        self._state: Optional[Tuple[Optional[List[str]], Optional[Iterable[Sequence[Any]]]]] = None
+        self._pending = False
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._frame_lines = 0
+        self._thread = threading.Thread(target=self._run, name='tuible-refresh', daemon=True)
+        self._thread.start()
+
+    def update(self, heads: Optional[List[str]] = None, body: Optional[Iterable[Sequence[Any]]] = None) -> None:
+        """Replace the table state shown by the next frame; safe from any thread.
+
+        The body is rendered later by the drawing thread, so it must not be
+        modified after it was passed in.
+        """
+        with self._condition:
+            if self._closed:
+                raise Exception("Cannot update a closed refresh scheduler.")
+            if self._pending:
+                self.updates_coalesced += 1
+            self._state = (heads, body)
+            self._pending = True
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Draw the latest state if it was not drawn yet and stop the drawing thread.
+
+        Errors raised in the drawing thread are re-raised here.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def __enter__(self) -> "RefreshScheduler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        """Drawing thread: draw the latest state at most once per interval."""
+        try:
+            next_frame = time.monotonic()
+            while True:
+                with self._condition:
+                    while not self._pending and not self._closed:
+                        self._condition.wait()
+                    if not self._pending:
+                        return
+                    # wait for the frame slot; close() cuts the wait short
+                    delay = next_frame - time.monotonic()
+                    while delay > 0 and not self._closed:
+                        self._condition.wait(delay)
+                        delay = next_frame - time.monotonic()
+                    state = self._state
+                    self._pending = False
+
+                self._draw(state)
+                now = time.monotonic()
+                next_frame += self.interval
+                if now > next_frame:
+                    self.frames_dropped += int((now - next_frame) / self.interval)
+                    next_frame = now
+        except BaseException as error:
+            self._error = error
+
+    def _draw(self, state: Tuple[Optional[List[str]], Optional[Iterable[Sequence[Any]]]]) -> None:
+        """Render a frame and write it with a single call."""
+        heads, body = state
+        buffer = io.StringIO()
+        print_table(heads=heads, body=body, plain=self.plain, file=buffer, **self.table_options)
+        frame = buffer.getvalue()
+        if self.in_place and self._frame_lines:
+            # move to the first line of the previous frame and clear below
+            frame = f"\x1b[{self._frame_lines}F\x1b[J" + frame
+        self.stream.write(frame)
+        self.stream.flush()
+        self._frame_lines = frame.count('\n')
+        self.frames_drawn += 1
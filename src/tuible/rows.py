@@ -0,0 +1,192 @@
+"""Row stages applied before layout: sorting, limiting and selecting rows."""
+
+import heapq
+import pickle
+import tempfile
+from collections import deque
+from itertools import islice
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+def typed_key(value: Any) -> Tuple[int, Any]:
+    """Sort key that orders numbers numerically and before text."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value)
+    try:
+        return (0, float(value))
+    except (TypeError, ValueError):
+        return (1, str(value))
+
+
+def top_key(value: Any) -> Tuple[int, Any]:
+    """Key for ``top``: numbers by value, ranked above text and empty cells."""
+    rank, part = typed_key(value)
+    return (1 - rank, part)
+
+
+def limit_rows(
+    rows: Iterable[Sequence[Any]],
+    head: Optional[int] = None,
+    tail: Optional[int] = None,
+    top: Optional[int] = None,
+    by: int = 1
+) -> List[Tuple[int, Sequence[Any]]]:
+    """Select the rows to display, keeping only O(N) rows in memory.
+
+    ``top`` keeps the largest rows by column ``by`` (bounded heap, largest
+    first; empty and text cells rank below every number), then ``head`` keeps the first rows (stops reading the input
+    early) and ``tail`` the last ones (bounded deque).
+
+    Args:
+        rows: Iterable of rows.
+        head: Number of leading rows to keep.
+        tail: Number of trailing rows to keep.
+        top: Number of largest rows to keep.
+        by: Column number (starting at 1) compared for ``top``.
+
+    Returns:
+        List of (original position, row) pairs in display order.
+    """
+    numbered: Iterable[Tuple[int, Sequence[Any]]] = enumerate(rows)
+    if top is not None:
+        col = by - 1
+        numbered = heapq.nlargest(top, numbered,
+                                  key=lambda item: top_key(item[1][col] if col < len(item[1]) else ""))
+    if head is not None:
+        numbered = islice(numbered, head)
+    if tail is not None:
+        numbered = deque(numbered, maxlen=tail)
+    return list(numbered)
+
+
+# Maximum number of spilled runs merged at once; more runs are merged in levels
+MERGE_FAN_IN = 64
+
+
+class _Descending:
+    """Wrap a sort key to invert its ordering."""
+    __slots__ = ('key',)
+
+    def __init__(self, key: Any):
+        self.key = key
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.key < self.key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.key == other.key
+
+
+def parse_sort_spec(spec: str) -> List[int]:
+    """Parse a sort specification like '2,-3' into signed column numbers.
+
+    Columns start at 1; a minus sign sorts that column in descending order.
+    """
+    try:
+        columns = [int(part) for part in spec.split(',') if part.strip()]
+    except ValueError:
+        raise Exception(f"Invalid sort specification: {spec}")
+    if not columns or 0 in columns:
+        raise Exception(f"Invalid sort specification: {spec}")
+    return columns
+
+
+def sort_key(columns: Sequence[int]) -> Callable[[Sequence[Any]], tuple]:
+    """Build a typed sort key from signed column numbers (see parse_sort_spec)."""
+    order = [(abs(column) - 1, column < 0) for column in columns]
+
+    def key(row: Sequence[Any]) -> tuple:
+        parts = []
+        for col, descending in order:
+            part = typed_key(row[col] if col < len(row) else "")
+            parts.append(_Descending(part) if descending else part)
+        return tuple(parts)
+    return key
+
+
+def spill_rows(rows: Iterable[Sequence[Any]]) -> BinaryIO:
+    """Write rows to an anonymous temporary file."""
+    run = tempfile.TemporaryFile()
+    pickler = pickle.Pickler(run, pickle.HIGHEST_PROTOCOL)
+    for row in rows:
+        pickler.dump(row)
+        pickler.clear_memo()
+    return run
+
+
+def read_spilled_rows(run: BinaryIO) -> Iterator[Sequence[Any]]:
+    """Read spilled rows back one at a time."""
+    run.seek(0)
+    unpickler = pickle.Unpickler(run)
+    while True:
+        try:
+            row = unpickler.load()
+        except EOFError:
+            return
+        unpickler.memo.clear()
+        yield row
+
+
+def sort_rows(
+    rows: Iterable[Sequence[Any]],
+    columns: Sequence[int],
+    buffer_rows: int = 100000
+) -> Iterator[Sequence[Any]]:
+    """Sort rows by typed column keys with bounded memory.
+
+    Inputs of up to ``buffer_rows`` rows are sorted in memory. Larger inputs
+    are sorted in runs of ``buffer_rows`` that are spilled to temporary files
+    and lazily k-way merged with ``heapq.merge``, so at most ``buffer_rows``
+    rows are held at once. Runs are merged in levels: ``MERGE_FAN_IN`` runs
+    of one level are merged into a run of the next level, so each row is
+    rewritten once per level. The sort is stable.
+
+    Args:
+        rows: Iterable of rows.
+        columns: Signed column numbers (see parse_sort_spec).
+        buffer_rows: Maximum number of rows sorted in memory.
+
+    Yields:
+        Rows in sorted order.
+    """
+    key = sort_key(columns)
+    rows = iter(rows)
+    # levels[i] holds the runs merged i times, oldest first
+    levels: List[List[BinaryIO]] = [[]]
+
+    def merge(runs: List[BinaryIO]) -> BinaryIO:
+        merged = spill_rows(heapq.merge(*map(read_spilled_rows, runs), key=key))
+        for run in runs:
+            run.close()
+        return merged
+
+    try:
+        while True:
+            chunk = list(islice(rows, buffer_rows))
+            if not levels[0] and len(levels) == 1 and len(chunk) < buffer_rows:
+                # everything fits in memory
+                chunk.sort(key=key)
+                yield from chunk
+                return
+            if not chunk:
+                break
+            chunk.sort(key=key)
+            levels[0].append(spill_rows(chunk))
+            del chunk
+            level = 0
+            while len(levels[level]) >= MERGE_FAN_IN:
+                if level + 1 == len(levels):
+                    levels.append([])
+                levels[level + 1].append(merge(levels[level]))
+                levels[level] = []
+                level += 1
+        # higher levels hold earlier rows; merging them first keeps the sort stable
+        runs = [run for level_runs in reversed(levels) for run in level_runs]
+        levels = [runs]
+        while len(runs) > MERGE_FAN_IN:
+            runs[:MERGE_FAN_IN] = [merge(runs[:MERGE_FAN_IN])]
+        yield from heapq.merge(*map(read_spilled_rows, runs), key=key)
+    finally:
+        for level_runs in levels:
+            for run in level_runs:
+                run.close()
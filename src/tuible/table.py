@@ -1,7 +1,322 @@
 """Tuible table rendering logic."""
 
-from typing import List, Set
+import copy
+import dataclasses
+import io
+import operator
+import os
+import shutil
+import sys
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, TextIO
+from collections import Counter, OrderedDict
+from functools import lru_cache, partial
+from itertools import chain, islice, zip_longest
+from .aggregate import ColumnAggregate
+from .backends import TextBackend, create_backend, parse_output_format
+from .encoding import EncodedColumn
+from .index import RowIndex
+from .lazy import LazyColumn
+from .instrumentation import CacheInfo, register_cache
+from .layout import ColumnStats, TableLayout, solve_layout
+from .numeric import format_column, number_formatter
 from .params import TuibleParams
+from .pipeline import CHUNK_LINES, PipelinedWriter
+from .rows import limit_rows, sort_rows
+
+
+RESET = "\x1b[0m"
+
+# SGR codes that turn off an attribute or a color without a full reset
+SGR_OFF = {'1': '22', '2': '22', '3': '23', '4': '24', '21': '24', '5': '25', '6': '25',
+           '7': '27', '8': '28', '9': '29', 'fg': '39', 'bg': '49'}
+
+# Entries kept by each process-wide style cache
+STYLE_CACHE_SIZE = 1024
+
+
+def stream_supports_color(stream: TextIO) -> bool:
+    """Decide whether ANSI escapes should be written to a stream.
+
+    Colors are disabled when ``NO_COLOR`` is set or when the stream is a real
+    file descriptor that is not a TTY (files, pipes, CI logs). Streams without
+    a descriptor (in-memory captures, notebooks) keep their colors.
+    """
+    if os.environ.get('NO_COLOR'):
+        return False
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        return True
+    return os.isatty(fd)
+
+
+def stream_is_terminal(stream: TextIO) -> bool:
+    """Return True if the stream is backed by an interactive terminal."""
+    try:
+        return os.isatty(stream.fileno())
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        return False
+
+
+def _sgr_groups(params: str) -> List[Tuple[str, str]]:
+    """Split SGR parameters into (kind, code) groups.
+
+    kind is 'fg', 'bg' or 'attr'. Extended colors (38;5;n, 48;2;r;g;b) are
+    kept together as a single group.
+    """
+    tokens = [token for token in params.split(';') if token]
+    groups = []
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token in ('38', '48'):
+            length = 3 if i + 1 < len(tokens) and tokens[i + 1] == '5' else 5
+            groups.append(('fg' if token == '38' else 'bg', ';'.join(tokens[i:i + length])))
+            i += length
+            continue
+        value = int(token) if token.isdigit() else -1
+        if 30 <= value <= 39 or 90 <= value <= 97:
+            groups.append(('fg', token))
+        elif 40 <= value <= 49 or 100 <= value <= 107:
+            groups.append(('bg', token))
+        else:
+            groups.append(('attr', token))
+        i += 1
+    return groups
+
+
+@lru_cache(maxsize=STYLE_CACHE_SIZE)
+def sgr_transition(current: str, target: str) -> str:
+    """Return the escape sequence that switches between two SGR states.
+
+    States are SGR parameter strings ('' is the terminal default). Nothing is
+    emitted when the state does not change. Otherwise the difference is
+    sent: dropped attributes and colors are turned off with their own codes
+    (22, 23, 24, ..., 39, 49), new ones are added. A reset followed by the
+    full target is sent instead when it is shorter, or when a dropped
+    attribute has no turn-off code.
+    """
+    if current == target:
+        return ""
+    if not target:
+        return RESET
+    if not current:
+        return f"\x1b[{target}m"
+
+    current_groups = _sgr_groups(current)
+    target_groups = _sgr_groups(target)
+    current_attrs = {code for kind, code in current_groups if kind == 'attr'}
+    target_attrs = {code for kind, code in target_groups if kind == 'attr'}
+    current_colors = {kind: code for kind, code in current_groups if kind != 'attr'}
+    target_colors = {kind: code for kind, code in target_groups if kind != 'attr'}
+
+    reset = f"\x1b[0;{target}m"
+    dropped = [code for code in current_attrs - target_attrs] + [
+        kind for kind in current_colors if kind not in target_colors]
+    if '0' in target_attrs or any(code not in SGR_OFF for code in dropped):
+        return reset
+    off = sorted({SGR_OFF[code] for code in dropped}, key=int)
+    # attributes sharing a turn-off code with a dropped one (22 ends bold and dim) are sent again
+    cleared = {code for code in current_attrs if SGR_OFF.get(code) in off}
+    codes = off + [code for kind, code in target_groups
+                   if (code not in current_attrs or code in cleared if kind == 'attr'
+                       else current_colors.get(kind) != code)]
+    if not codes:
+        return ""
+    difference = f"\x1b[{';'.join(codes)}m"
+    return difference if len(difference) <= len(reset) else reset
+
+
+def stack_sgr(base: str, style: str) -> str:
+    """Return the SGR state of ``style`` sent on top of the state ``base``.
+
+    Attributes add up and the colors of ``style`` replace those of
+    ``base``, as on a terminal; a style containing a reset stands alone.
+    """
+    if not base or not style:
+        return base or style
+    groups = _sgr_groups(style)
+    if ('attr', '0') in groups:
+        return style
+    kinds = {kind for kind, _ in groups if kind != 'attr'}
+    codes = {code for kind, code in groups if kind == 'attr'}
+    kept = [code for kind, code in _sgr_groups(base) if kind not in kinds and code not in codes]
+    return ';'.join(kept + [code for _, code in groups])
+
+
+def _coalesced_pieces(segments: List[Tuple[str, str]], escape: bool = False) -> List[str]:
+    """Return one string per segment (transition + text) plus the final reset."""
+    state = ""
+    pieces = []
+    for style, text in segments:
+        transition = sgr_transition(state, style)
+        pieces.append((_brace_escape(transition) if escape else transition) + text)
+        state = style
+    pieces.append(sgr_transition(state, ""))
+    return pieces
+
+
+def coalesce_segments(segments: List[Tuple[str, str]], escape: bool = False) -> str:
+    """Join (sgr_state, text) segments, emitting only the needed SGR transitions.
+
+    The result always ends in the default state. With ``escape`` the emitted
+    sequences are brace-escaped for use inside a format template.
+    """
+    return ''.join(_coalesced_pieces(segments, escape))
+
+
+def _brace_escape(text: str) -> str:
+    """Escape literal braces so text can be embedded in a format template."""
+    return text.replace('{', '{{').replace('}', '}}')
+
+
+def align_text(text: str, width: int, alignment: str) -> str:
+    """Truncate and align text within a given width."""
+    text_len = len(text)
+    if text_len >= width:
+        return text[:width]
+    if alignment == 'center':
+        left_pad = (width - text_len) // 2
+        return ' ' * left_pad + text + ' ' * (width - text_len - left_pad)
+    if alignment == 'right':
+        return ' ' * (width - text_len) + text
+    return text + ' ' * (width - text_len)
+
+
+@lru_cache(maxsize=STYLE_CACHE_SIZE)
+def aligner(alignment: str, truncate: bool = True) -> Callable[[str, int], str]:
+    """Return a shared callable that aligns text to a width.
+
+    Text longer than the width is truncated, or kept whole (overflowing its
+    column) when ``truncate`` is False.
+    """
+    if not truncate:
+        if alignment == 'left':
+            return str.ljust
+        if alignment == 'right':
+            return str.rjust
+        return lambda text, width: text if len(text) >= width else align_text(text, width, alignment)
+    if alignment == 'left':
+        return lambda text, width: text[:width].ljust(width)
+    if alignment == 'right':
+        return lambda text, width: text[:width].rjust(width)
+    return lambda text, width: align_text(text, width, alignment)
+
+
+def _apply_aligner(align: Callable[[str, int], str], text: str, width: int) -> str:
+    return align(text, width)
+
+
+def cell_aligner(
+    alignments: Tuple[str, ...],
+    overflow: Tuple[bool, ...] = ()
+) -> Callable[[Sequence[str], Sequence[int]], Iterator[str]]:
+    """Return a callable aligning the cells of a row to their widths.
+
+    Rows with a single aligner map it over the cells; rows with per-column
+    alignments (e.g. right-aligned numeric columns) or with columns whose
+    cells are never truncated (``overflow``) apply the aligner of each column.
+    """
+    aligners = tuple(aligner(alignment, not (position < len(overflow) and overflow[position]))
+                     for position, alignment in enumerate(alignments))
+    if len(set(aligners)) <= 1:
+        return partial(map, aligners[0] if aligners else aligner('left'))
+    return partial(map, _apply_aligner, aligners)
+
+
+def row_segments(
+    edge: Tuple[str, str],
+    index_style: Optional[str],
+    cell_style: str,
+    col_count: int,
+    border: bool,
+    left_border: bool
+) -> List[Tuple[str, str]]:
+    """Describe a row as (sgr_state, text) segments with '{}' cell placeholders.
+
+    A cell drawn right after an edge keeps the edge attributes its own
+    style does not replace (a head cell with only a background keeps the
+    edge foreground), as each cell style is sent on top of the edge.
+
+    Args:
+        edge: (SGR state, brace-escaped symbol) of the vertical edges.
+        index_style: SGR state of the index cell (None without index column).
+        cell_style: SGR state of the data cells.
+        col_count: Number of data cells.
+        border: Draw separators between cells.
+        left_border: Draw the left border.
+    """
+    segments = []
+    if left_border:
+        segments.append(edge)
+    if index_style is not None:
+        segments.append((stack_sgr(edge[0], index_style) if left_border else index_style, "{}"))
+        if border:
+            segments.append(edge)
+    body_cell = (stack_sgr(edge[0], cell_style) if border else cell_style, "{}")
+    for _ in range(col_count):
+        segments.append(body_cell)
+        if border:
+            segments.append(edge)
+    return segments
+
+
+@lru_cache(maxsize=STYLE_CACHE_SIZE)
+def compile_row_template(
+    edge: Tuple[str, str],
+    index_style: Optional[str],
+    cell_style: str,
+    col_count: int,
+    border: bool,
+    left_border: bool,
+    widths: Tuple[int, ...],
+    alignments: Tuple[str, ...],
+    overflow: Tuple[bool, ...] = ()
+) -> tuple:
+    """Build the str.format templates of a row from a normalized style spec.
+
+    Borders and escape sequences are baked into the templates once, so
+    rendering a row is a ``format`` call over the aligned cells. Only SGR
+    transitions between differently styled segments are emitted; plain
+    specs (empty styles) have no escape sequences at all. The row is split
+    into the index prefix (left border, index cell and its separator) and the
+    data part, so the data part can be cached independently of the index.
+    Compiled templates are shared by all tables of the process. Cells of
+    the ``overflow`` columns are never truncated.
+
+    Returns:
+        (index prefix template, data template, data column widths,
+        cell aligner called with the cells and the widths)
+    """
+    segments = row_segments(edge, index_style, cell_style, col_count, border, left_border)
+    pieces = _coalesced_pieces(segments, escape=True)
+    split = len(segments) - col_count * (2 if border else 1)
+    return ''.join(pieces[:split]), ''.join(pieces[split:]), widths, cell_aligner(alignments, overflow)
+
+
+@lru_cache(maxsize=STYLE_CACHE_SIZE)
+def border_line(
+    edge_style: str,
+    fill: str,
+    left: str,
+    middle: str,
+    right: str,
+    widths: Tuple[int, ...],
+    blank: int
+) -> str:
+    """Return a horizontal border line over columns of the given widths.
+
+    ``blank`` leading spaces replace the index column when it has no border.
+    """
+    line = left + middle.join(fill * width for width in widths) + right
+    segments = [("", ' ' * blank)] if blank else []
+    segments.append((edge_style, line))
+    return coalesce_segments(segments)
+
+
+for _name, _cached in (('sgr_transition', sgr_transition), ('aligner', aligner),
+                       ('row_template', compile_row_template), ('border_line', border_line)):
+    register_cache(_name, _cached)
 
 
 class TuibleTable:
@@ -17,6 +332,20 @@ class TuibleTable:
     - Dynamic column width calculation based on content
     - ANSI color and style support for visual formatting
     - Support for no-border mode for compact output
+    - Plain (escape-free) output for pipes, files and NO_COLOR environments
+    - Fitting column widths into the terminal width
+    - Column windows that render only the columns fitting the terminal
+    - Bounded LRU cache of rendered rows for repetitive tables
+    - Head/tail/top-K row limits applied before widths are measured
+    - Sorting by typed column keys, spilling to temporary files for large inputs
+    - Streaming body rows after a sample that determines the column widths
+    - Footer aggregates (sum/min/max/mean/count) computed while rows are read
+    - Typed numeric columns with precompiled formatters, aligned right by default
+    - Dictionary-encoded body columns measured and aligned once per distinct value
+    - Lazy, memoized conversion of body cells to text when measured or rendered
+    - Index labels addressed by global row position for chunked or paged output
+    - ANSI, plain, Markdown and HTML backends emitting the same layout
+    - Pull-based output with ``iter_lines()`` / ``iter_chunks(n)`` generators
     - Multi-row cells within columns using colon prefix syntax
 
     Colon Mechanics:
@@ -38,15 +367,80 @@ class TuibleTable:
     modes in any combination, allowing flexible table composition.
     """
 
-    def __init__(self, params: TuibleParams):
-        """Initialize TuibleTable with parameters."""
+    def __init__(self, params: TuibleParams, body_stream: Optional[Iterable[Sequence[Any]]] = None,
+                 file: Optional[TextIO] = None):
+        """Initialize TuibleTable with parameters.
+
+        Args:
+            params: Table parameters.
+            body_stream: Body rows rendered one at a time after the body rows
+                in params. Column widths are measured on params only, so
+                streamed rows never have to be held in memory.
+            file: Output stream (default: the current sys.stdout).
+        """
         self.params = params
+        self.body_stream = body_stream
+        # widths measured on the leading rows only: later streamed rows can be wider
+        self._sampled = body_stream is not None and params.stream_lengths is None
+        self.file = file
+        output = file if file is not None else sys.stdout
         self.format_index = params.format_index
-        if self.params.size == -1 or 'idx' in self.params.mode_columns:
+        self.output_format = parse_output_format(params.output_format) if params.output_format else None
+        text_output = self.output_format in (None, 'ansi', 'plain')
+        if self.output_format in ('ansi', 'plain'):
+            self.plain = self.output_format == 'plain'
+        elif params.plain is None:
+            self.plain = not stream_supports_color(output)
+        else:
+            self.plain = params.plain
+        if params.fit is None:
+            self.fit = params.max_width is not None or (
+                params.size == -1 and text_output and stream_is_terminal(output))
+        else:
+            self.fit = params.fit
+        self.backend = create_backend(self.output_format, self)
+        self._row_templates: Dict[Tuple[bool, int], tuple] = {}
+        self._row_cache: "OrderedDict[Tuple[bool, Tuple[str, ...]], str]" = OrderedDict()
+        self._row_cache_hits = 0
+        self._row_cache_misses = 0
+        self._layout_signature: Optional[tuple] = None
+        self._total_width: Optional[int] = None
+        self.column_stats: List[ColumnStats] = []
+        self.visible_columns: Optional[List[int]] = None
+        self.aggregates: List[Tuple[int, ColumnAggregate]] = [
+            (column - 1, ColumnAggregate(function)) for column, function in params.aggregates or []]
+        if params.stream_aggregates is not None:
+            # fed with the streamed rows by the two-pass engine; copied, as params are not changed
+            self.aggregates = [(col, copy.copy(aggregate)) for col, aggregate in params.stream_aggregates]
+        head = params.mode_columns.get('head')
+        self.row_index = RowIndex(
+            params.index_auto_numbering, head_rows=max(map(len, head)) if head else 0,
+            header_values=params.index_header_values, body_values=params.index_body_values,
+            start=params.index_start, step=params.index_step, no_header_index=params.no_header_index)
+        if params.sort_columns:
+            self.params = self._sort_body_rows(self.params)
+        if params.limit_head is not None or params.limit_tail is not None or params.limit_top is not None:
+            self.params = self._limit_body_rows(self.params)
+        self.column_formatters: Dict[int, Callable[[Any], str]] = {}
+        self._column_types = {column - 1: (kind, precision) for column, kind, precision in params.column_types or []}
+        self._typed_cells: Dict[int, Tuple[Any, Optional[int]]] = {}
+        if self.aggregates:
+            self.params = self._aggregate_body_rows(self.params)
+        if params.window_start is not None:
+            self.params = self._column_window(self.params)
+        if params.column_types:
+            self.params = self._format_typed_columns(self.params)
+        if params.encode_columns:
+            self.params = self._encode_body_columns(self.params)
+        if self.params.size == -1 or 'idx' in self.params.mode_columns or self.fit:
             self.calculate_dynamic_widths()
 
     def calculate_dynamic_widths(self) -> None:
-        """Calculate dynamic column widths based on the widest element in each column."""
+        """Calculate dynamic column widths based on the widest element in each column.
+
+        Width statistics of every data column are kept in ``column_stats``
+        and used to fit the table into the terminal when fitting is enabled.
+        """
         if not self.params.column_count:
             return
 
@@ -55,212 +449,714 @@ class TuibleTable:
 
         # Handle index column first if present
         if 'idx' in self.params.mode_columns:
-            if self.params.index_auto_numbering:
-                idx_width = max(3, self.params.format_index.get('size', 3))
-            else:
-                index_entries = self.params.index_header_values + self.params.index_body_values
-                max_width = max((len(cell) for cell in index_entries), default=0)
-                idx_width = max(1, max_width)
-            self.params.column_widths[0] = idx_width
+            self.params.column_widths[0] = self._natural_index_width()
+
+        # Offset for other columns if index is present
+        offset = 1 if 'idx' in self.params.mode_columns else 0
+        lengths: List[Counter] = [Counter() for _ in range(self.params.column_count - offset)]
 
         # Iterate through other modes and find the max width for each column
         for mode, columns in self.params.mode_columns.items():
             if mode == 'idx':
                 continue  # Already handled above
 
-            # Offset for other columns if index is present
-            offset = 1 if 'idx' in self.params.mode_columns else 0
+            known = self.params.body_widths if mode == 'body' else {}
+            height = max(map(len, columns), default=0)
             for col_idx, column in enumerate(columns):
-                max_width = max((len(cell) for cell in column), default=0)
+                column_lengths = self._length_counts(column, known.get(col_idx))
+                if len(column) < height:
+                    # lines missing from a shorter column count as empty cells
+                    column_lengths = dict(column_lengths)
+                    column_lengths[0] = column_lengths.get(0, 0) + height - len(column)
+                if col_idx < len(lengths):
+                    lengths[col_idx].update(column_lengths)
+                max_width = max(column_lengths, default=0)
                 if self.params.size != -1:
                     max_width = max(max_width, self.params.size)
                 if col_idx + offset < len(self.params.column_widths):
                     self.params.column_widths[col_idx + offset] = max(self.params.column_widths[col_idx + offset], max_width)
 
+        # Streamed rows measured ahead (two-pass engine)
+        for col_idx, column_lengths in enumerate(self.params.stream_lengths or []):
+            if col_idx < len(lengths):
+                lengths[col_idx].update(column_lengths)
+            if col_idx + offset < len(self.params.column_widths):
+                self.params.column_widths[col_idx + offset] = max(
+                    self.params.column_widths[col_idx + offset], max(column_lengths, default=0))
+
         # Ensure minimum width of 1 for empty columns
         self.params.column_widths = [max(1, w) for w in self.params.column_widths]
-    
+
+        self.column_stats = [ColumnStats.from_counts(column_lengths) for column_lengths in lengths]
+        if self.fit:
+            self._fit_to_width()
+
+    @staticmethod
+    def _length_counts(column: Sequence[str], known_width: Optional[int] = None) -> Dict[int, int]:
+        """Count the cells of each length; encoded columns count over their distinct values."""
+        if known_width is not None:
+            return {known_width: len(column)} if len(column) else {}
+        if isinstance(column, EncodedColumn):
+            return column.length_counts()
+        return Counter(map(len, column))
+
+    def _natural_index_width(self) -> int:
+        """Width the index column needs for its labels (or auto-numbering)."""
+        if self.params.index_auto_numbering:
+            return self.row_index.width(self._index_row_count(), max(3, self.params.format_index.get('size', 3)))
+        return self.row_index.width(0)
+
+    def _index_row_count(self) -> int:
+        """Known or estimated number of numbered body rows, counted from global position 0.
+
+        Streamed rows count with their length hint (exact for lists) or with
+        ``expected_rows``, so no rows are scanned.
+        """
+        params = self.params
+        if params.body_positions:
+            return params.index_offset + max(params.body_positions) + 1
+        body = params.mode_columns.get('body')
+        count = max(map(len, body)) if body else 0
+        if self.body_stream is not None:
+            count += operator.length_hint(self.body_stream, 0)
+        return params.index_offset + max(count, params.expected_rows or 0)
+
+    def _measure_column(self, params: TuibleParams, col_idx: int) -> int:
+        """Natural width of one data column, following calculate_dynamic_widths."""
+        dynamic = params.size == -1 or 'idx' in params.mode_columns
+        if not dynamic:
+            return params.size
+        width = 0
+        for mode, columns in params.mode_columns.items():
+            if mode == 'body' and col_idx in params.body_widths:
+                width = max(width, params.body_widths[col_idx] if len(columns[col_idx]) else 0)
+            elif mode != 'idx' and col_idx < len(columns):
+                column = columns[col_idx]
+                if mode == 'body' and col_idx in self._column_types:
+                    column, known = self._typed_column(col_idx, column)
+                    if known is not None:
+                        width = max(width, known if len(column) else 0)
+                        continue
+                if isinstance(column, EncodedColumn):
+                    width = max(width, column.max_length())
+                else:
+                    width = max(width, max((len(cell) for cell in column), default=0))
+        if params.stream_lengths and col_idx < len(params.stream_lengths):
+            width = max(width, max(params.stream_lengths[col_idx], default=0))
+        if params.size != -1:
+            width = max(width, params.size)
+        return max(1, width)
+
+    def _column_window(self, params: TuibleParams) -> TuibleParams:
+        """Restrict the table to the columns that fit the width budget.
+
+        The index column and the first ``frozen_columns`` data columns are
+        always shown; after them come the columns starting at
+        ``window_start`` for as long as they fit (at least one). A start past
+        the last column shows the last column. Columns are
+        measured one at a time while the window is filled, so columns outside
+        the window are never measured or rendered.
+
+        Returns:
+            A copy of params holding only the visible columns.
+        """
+        idx_enabled = 'idx' in params.mode_columns
+        offset = 1 if idx_enabled else 0
+        data_count = max(0, (params.column_count or 0) - offset)
+        frozen = list(range(min(params.frozen_columns, data_count)))
+        start = max(min(params.window_start, data_count - 1), len(frozen))
+        separator = 0 if params.no_border else 1
+
+        used = 0 if params.no_border or (params.no_index_border and idx_enabled) else 1
+        if idx_enabled:
+            used += self._natural_index_width() + separator
+        total = self._width_budget()
+
+        visible: List[int] = []
+        scrolled = 0
+        for col_idx in frozen + list(range(start, data_count)):
+            width = self._measure_column(params, col_idx) + separator
+            if col_idx >= start:
+                if scrolled and used + width > total:
+                    break
+                scrolled += 1
+            visible.append(col_idx)
+            used += width
+        self.visible_columns = visible
+
+        mode_columns = {
+            mode: columns if mode == 'idx' else [columns[i] for i in visible if i < len(columns)]
+            for mode, columns in params.mode_columns.items()
+        }
+        body_widths = {position: params.body_widths[col_idx] for position, col_idx in enumerate(visible)
+                       if col_idx in params.body_widths}
+        stream_lengths = params.stream_lengths and [
+            params.stream_lengths[col_idx] for col_idx in visible if col_idx < len(params.stream_lengths)]
+        return dataclasses.replace(params, mode_columns=mode_columns, body_widths=body_widths,
+                                   stream_lengths=stream_lengths,
+                                   column_count=len(visible) + offset, column_widths=[])
+
+    def _sort_body_rows(self, params: TuibleParams) -> TuibleParams:
+        """Sort the body rows by ``sort_columns``.
+
+        Returns:
+            A copy of params with the sorted body rows.
+        """
+        columns = params.mode_columns.get('body')
+        if not columns:
+            return params
+        rows = sort_rows(zip_longest(*columns, fillvalue=""), params.sort_columns, params.sort_buffer)
+        body = [list(column) for column in zip(*rows)] or [[] for _ in columns]
+        return dataclasses.replace(params, mode_columns=dict(params.mode_columns, body=body))
+
+    def _limit_body_rows(self, params: TuibleParams) -> TuibleParams:
+        """Keep only the body rows selected by the head/tail/top limits.
+
+        Returns:
+            A copy of params with the selected body rows and their original
+            positions in ``body_positions``.
+        """
+        columns = params.mode_columns.get('body')
+        if not columns:
+            return params
+        selected = limit_rows(zip_longest(*columns, fillvalue=""), head=params.limit_head,
+                              tail=params.limit_tail, top=params.limit_top, by=params.limit_by)
+        body = [list(column) for column in zip(*(row for _, row in selected))] or [[] for _ in columns]
+        mode_columns = dict(params.mode_columns, body=body)
+        return dataclasses.replace(params, mode_columns=mode_columns,
+                                   body_positions=[position for position, _ in selected])
+
+    def _aggregate_body_rows(self, params: TuibleParams) -> TuibleParams:
+        """Feed the body rows into the aggregates and add the footer for measuring.
+
+        Returns:
+            A copy of params whose ``foot`` mode holds the current footer
+            cells, so their widths count like any other row.
+        """
+        body = params.mode_columns.get('body') or []
+        for col, aggregate in self.aggregates:
+            if col < len(body):
+                # lazy columns are aggregated from their raw values
+                column = body[col]
+                for cell in column.cells if isinstance(column, LazyColumn) else column:
+                    aggregate.add(cell)
+        offset = 1 if 'idx' in params.mode_columns else 0
+        foot = [[cell] for cell in self._footer_cells((params.column_count or 0) - offset)]
+        return dataclasses.replace(params, mode_columns=dict(params.mode_columns, foot=foot))
+
+    def _typed_column(self, col_idx: int, column: Any) -> Tuple[Any, Optional[int]]:
+        """Format the body cells of a typed column once.
+
+        The column window measures typed columns with their formatted cells,
+        and rendering reuses them, so no column is formatted twice.
+
+        Returns:
+            (formatted column, width of the widest cell or None if not known)
+        """
+        if col_idx not in self._typed_cells:
+            kind, precision = self._column_types[col_idx]
+            if isinstance(column, EncodedColumn):
+                values, width = format_column(column.values, kind, precision, self.params.thousands)
+                self._typed_cells[col_idx] = EncodedColumn(values=values, codes=column.codes), width
+            else:
+                self._typed_cells[col_idx] = format_column(column, kind, precision, self.params.thousands)
+        return self._typed_cells[col_idx]
+
+    def _format_typed_columns(self, params: TuibleParams) -> TuibleParams:
+        """Format the body cells of the typed numeric columns.
+
+        Runs after sorting, limiting and the aggregates, which all work on
+        the raw values, and after the column window, so only the visible
+        columns are formatted. The formatters are kept for the streamed
+        rows, and columns whose width is known from digit counts skip
+        measuring.
+
+        Returns:
+            A copy of params with the formatted body cells and their known
+            widths in ``body_widths``.
+        """
+        body = list(params.mode_columns.get('body') or [])
+        body_widths = dict(params.body_widths)
+        visible = self.visible_columns
+        for col, (kind, precision) in self._column_types.items():
+            self.column_formatters[col] = number_formatter(kind, precision, params.thousands)
+            position = col if visible is None else visible.index(col) if col in visible else len(body)
+            if position < len(body):
+                body[position], width = self._typed_column(col, body[position])
+                if width is not None:
+                    body_widths[position] = width
+        self._typed_cells = {}
+        mode_columns = dict(params.mode_columns, body=body) if 'body' in params.mode_columns else params.mode_columns
+        return dataclasses.replace(params, mode_columns=mode_columns, body_widths=body_widths)
+
+    def _encode_body_columns(self, params: TuibleParams) -> TuibleParams:
+        """Dictionary-encode the body columns that are not encoded yet.
+
+        Returns:
+            A copy of params whose body columns are ``EncodedColumn``s.
+        """
+        body = params.mode_columns.get('body')
+        if not body:
+            return params
+        body = [column if isinstance(column, EncodedColumn) else EncodedColumn(column) for column in body]
+        return dataclasses.replace(params, mode_columns=dict(params.mode_columns, body=body))
+
+    def _footer_cells(self, data_count: int) -> List[str]:
+        """Return the aggregate results for every data column ('' elsewhere)."""
+        cells = [""] * data_count
+        for col, aggregate in self.aggregates:
+            if col < data_count:
+                cells[col] = aggregate.result()
+        return cells
+
+    def _width_budget(self) -> int:
+        """Total table width: ``max_width`` or the terminal width (read once)."""
+        if self.params.max_width:
+            return self.params.max_width
+        if self._total_width is None:
+            self._total_width = shutil.get_terminal_size().columns
+        return self._total_width
+
+    def _border_overhead(self) -> int:
+        """Number of border characters drawn in each row."""
+        if self.params.no_border:
+            return 0
+        left = 0 if self.params.no_index_border and 'idx' in self.params.mode_columns else 1
+        return left + self.params.column_count
+
+    def _fit_to_width(self) -> None:
+        """Fit the data columns into the terminal (or ``max_width``) with the layout solver.
+
+        The index column keeps its width; it and the borders are subtracted
+        from the budget first.
+        """
+        offset = 1 if 'idx' in self.params.mode_columns else 0
+        budget = self._width_budget() - self._border_overhead() - sum(self.params.column_widths[:offset])
+        self.params.column_widths[offset:] = solve_layout(self.column_stats, budget)
+
     def _align_text(self, text: str, width: int, alignment: str) -> str:
         """Align text within a given width."""
-        text_len = len(text)
-        if text_len >= width:
-            return text[:width]
-        
-        if alignment == 'center':
-            left_pad = (width - text_len) // 2
-            right_pad = width - text_len - left_pad
-            return ' ' * left_pad + text + ' ' * right_pad
-        elif alignment == 'right':
-            return ' ' * (width - text_len) + text
-        else:  # left
-            return text + ' ' * (width - text_len)
-    
-    def render_top(self) -> None:
-        """Render the top border of the table."""
-        if self.params.no_border:
-            return
+        return align_text(text, width, alignment)
 
-        edge_color = f"\x1b[{self.params.format_edge['color']}m"
-        reset = "\x1b[0m"
+    def _edge_style(self) -> str:
+        """Return the SGR state used for edges ('' in plain mode)."""
+        if self.plain:
+            return ""
+        return self.params.format_edge['color']
 
-        # Get column count
-        col_count = self.params.column_count if self.params.column_count else len(self.params.columns)
+    def _cell_style(self, format_dict: dict) -> str:
+        """Return the SGR state for a formatted cell ('' in plain mode)."""
+        if self.plain:
+            return ""
+        return f"{format_dict['esc']}{format_dict['color']}"
 
-        # Build top border
-        if self.params.no_index_border and 'idx' in self.params.mode_columns:
-            idx_width = self.params.column_widths[0] if self.params.column_widths else self.params.size
-            line = ' ' * idx_width + edge_color + self.params.format_edge['symbol_topleft']
-            start_i = 1
-        else:
-            line = edge_color + self.params.format_edge['symbol_topleft']
-            start_i = 0
-        for i in range(start_i, col_count):
-            width = self.params.column_widths[i] if self.params.column_widths else self.params.size
-            line += self.params.format_edge['symbol_topbottom'] * width
-            if i < col_count - 1:
-                line += self.params.format_edge['symbol_topmiddle']
-        line += self.params.format_edge['symbol_topright'] + reset
-        print(line)
-    
-    def render_bottom(self) -> None:
-        """Render the bottom border of the table."""
+    def _format_border(self, left: str, middle: str, right: str) -> Optional[str]:
+        """Return a horizontal border line (None without borders)."""
         if self.params.no_border:
-            return
-
-        edge_color = f"\x1b[{self.params.format_edge['color']}m"
-        reset = "\x1b[0m"
+            return None
 
         # Get column count
         col_count = self.params.column_count if self.params.column_count else len(self.params.columns)
-
-        # Build bottom border
+        widths = [self.params.column_widths[i] if self.params.column_widths else self.params.size
+                  for i in range(col_count)]
+        blank = 0
         if self.params.no_index_border and 'idx' in self.params.mode_columns:
-            idx_width = self.params.column_widths[0] if self.params.column_widths else self.params.size
-            line = ' ' * idx_width + edge_color + self.params.format_edge['symbol_bottomleft']
-            start_i = 1
+            blank = widths.pop(0)
+        return border_line(self._edge_style(), self.params.format_edge['symbol_topbottom'],
+                           left, middle, right, tuple(widths), blank)
+
+    def _emit(self, text: Optional[str]) -> None:
+        """Write backend output (None writes nothing)."""
+        if text is not None:
+            print(text, file=self.file)
+
+    def layout(self) -> TableLayout:
+        """Return the resolved widths and alignments consumed by the backends."""
+        offset = 1 if 'idx' in self.params.mode_columns else 0
+        col_count = (self.params.column_count or 0) - offset
+        if self.params.column_widths:
+            widths = list(self.params.column_widths[offset:offset + col_count])
         else:
-            line = edge_color + self.params.format_edge['symbol_bottomleft']
-            start_i = 0
-        for i in range(start_i, col_count):
-            width = self.params.column_widths[i] if self.params.column_widths else self.params.size
-            line += self.params.format_edge['symbol_topbottom'] * width
-            if i < col_count - 1:
-                line += self.params.format_edge['symbol_bottommiddle']
-        line += self.params.format_edge['symbol_bottomright'] + reset
-        print(line)
-    
+            widths = [self.params.size] * col_count
+        body_align = self.params.format_body['align']
+        column_align = {position: align for position, align in
+                        enumerate(self._column_alignments((body_align,) * col_count)) if align != body_align}
+        return TableLayout(
+            widths=widths, index_width=self._index_width() if offset else 0,
+            head_align=self.params.format_head['align'], body_align=body_align,
+            foot_align=self.params.format_foot['align'], index_align=self.format_index['align'],
+            column_align=column_align)
+
+    def render_top(self) -> None:
+        """Render the top border of the table."""
+        self._emit_all(self._top_output())
+
+    def render_bottom(self) -> None:
+        """Render the bottom border of the table."""
+        self._emit_all(self._bottom_output())
+
     def render_head(self) -> None:
         """Render head rows from columns."""
+        self._emit_all(self._head_output())
+
+    def render_body(self) -> None:
+        """Render body rows from columns, followed by the streamed body rows."""
+        self._emit_all(self._body_output())
+
+    def _emit_all(self, texts: Iterable[Optional[str]]) -> None:
+        """Write every backend output of a generator."""
+        for text in texts:
+            self._emit(text)
+
+    def _top_output(self) -> Iterator[Optional[str]]:
+        """Yield the backend output of the top border."""
+        self._check_layout()
+        yield self.backend.top()
+
+    def _bottom_output(self) -> Iterator[Optional[str]]:
+        """Yield the backend output of the bottom border."""
+        self._check_layout()
+        yield self.backend.bottom()
+
+    def _head_output(self) -> Iterator[Optional[str]]:
+        """Yield the backend output of the head rows, one row at a time."""
         if 'head' not in self.params.mode_columns or not self.params.mode_columns['head']:
             return
+        self._check_layout()
 
         columns = self.params.mode_columns['head']
-        max_rows = len(columns[0]) if columns else 0
-        idx_enabled = 'idx' in self.params.mode_columns
-        offset = 1 if idx_enabled else 0
 
-        for row_idx in range(max_rows):
+        sparse = self._sparse_rows(columns, is_head=True)
+        if sparse is not None:
+            prefix, template = self._row_template(True, len(columns))[:2]
+            for row_idx, cells in enumerate(sparse):
+                index_cell = self._get_index_value(row_idx, is_head=True)
+                yield self._index_prefix(prefix, index_cell) + template.format(*cells)
+            return
+
+        head_row = self.backend.head_row
+        for row_idx, cells in enumerate(zip_longest(*columns, fillvalue="")):
             index_cell = self._get_index_value(row_idx, is_head=True)
-            self._render_row(row_idx, columns, is_head=True, index_cell=index_cell, offset=offset)
+            yield head_row(cells, index_cell)
 
-    def render_body(self) -> None:
-        """Render body rows from columns."""
-        if 'body' not in self.params.mode_columns or not self.params.mode_columns['body']:
+    def _body_output(self) -> Iterator[Optional[str]]:
+        """Yield the backend output of the body rows and then the streamed rows, one row at a time."""
+        columns = self.params.mode_columns.get('body') or []
+        if not columns and self.body_stream is None:
             return
+        self._check_layout()
 
-        columns = self.params.mode_columns['body']
-        max_rows = len(columns[0]) if columns else 0
+        rows: Iterable[Tuple[str, ...]] = zip_longest(*columns, fillvalue="")
+        start = 0
+        aligned = self._encoded_rows(columns) or self._sparse_rows(columns, is_head=False)
+        if aligned is not None:
+            prefix, template = self._row_template(False, len(columns))[:2]
+            for row_idx, cells in enumerate(aligned):
+                index_cell = self._get_index_value(row_idx, is_head=False)
+                yield self._index_prefix(prefix, index_cell) + template.format(*cells)
+            rows, start = (), max(map(len, columns))
+        if self.body_stream is not None:
+            rows = chain(rows, self._stream_cells(self.body_stream))
+            self.body_stream = None
 
-        # Determine how many index cells were already used by the header
-        head_rows = len(self.params.mode_columns['head'][0]) if 'head' in self.params.mode_columns and self.params.mode_columns['head'] else 0
-        idx_enabled = 'idx' in self.params.mode_columns
-        offset = 1 if idx_enabled else 0
+        body_row = self.backend.body_row
+        for row_idx, cells in enumerate(rows, start):
+            index_cell = self._get_index_value(row_idx, is_head=False)
+            yield body_row(cells, index_cell)
+
+    def _encoded_rows(self, columns: List[Sequence[str]]) -> Optional[Iterator[Tuple[str, ...]]]:
+        """Return the aligned cells of dictionary-encoded body rows for text output.
 
-        for row_idx in range(max_rows):
-            index_cell = self._get_index_value(row_idx, is_head=False, head_rows=head_rows)
-            self._render_row(row_idx, columns, is_head=False, index_cell=index_cell, offset=offset)
-    
-    def _render_row(self, row_idx: int, columns: List[List[str]], is_head: bool = False, index_cell: str = "", offset: int = 0) -> None:
-        """Render a single row of body."""
-        format_dict = self.params.format_head if is_head else self.params.format_body
+        Each distinct value is aligned once per column; rows are assembled by
+        looking up their codes. None unless every body column is encoded.
+        """
+        if (not columns or not isinstance(self.backend, TextBackend)
+                or not all(isinstance(column, EncodedColumn) for column in columns)
+                or len(set(map(len, columns))) != 1):
+            return None
+        widths = self._row_template(False, len(columns))[2]
+        alignments = self._column_alignments((self.params.format_body['align'],) * len(columns))
+        typed = self._overflow_positions(len(columns)) or (False,) * len(columns)
+        return zip(*(column.aligned_cells(width, aligner(alignment, not keep))
+                     for column, width, alignment, keep in zip(columns, widths, alignments, typed)))
 
-        edge_color = f"\x1b[{self.params.format_edge['color']}m"
-        body_color = f"\x1b[{format_dict['esc']}{format_dict['color']}m"
-        index_color = f"\x1b[{self.format_index['esc']}{self.format_index['color']}m"
-        reset = "\x1b[0m"
+    def _sparse_rows(self, columns: List[Sequence[str]], is_head: bool) -> Optional[Iterator[Tuple[str, ...]]]:
+        """Return the aligned cells of a mode whose columns differ in height, for text output.
 
-        # Start with left border
-        if not self.params.no_border and not (self.params.no_index_border and 'idx' in self.params.mode_columns):
-            print(edge_color + self.params.format_edge['symbol_leftright'], end='')
+        Lines a shorter column does not have (next to a multi-row cell) are
+        filled with a blank cell precomputed once per column width instead
+        of aligning an empty string per line. None when all columns have
+        the same height.
+        """
+        heights = list(map(len, columns))
+        if not columns or not isinstance(self.backend, TextBackend) or len(set(heights)) == 1:
+            return None
+        widths = self._row_template(is_head, len(columns))[2]
+        if is_head:
+            alignments = (self.params.format_head['align'],) * len(columns)
+            typed = (False,) * len(columns)
+        else:
+            alignments = self._column_alignments((self.params.format_body['align'],) * len(columns))
+            typed = self._overflow_positions(len(columns)) or (False,) * len(columns)
+        aligners = [aligner(alignment, not keep) for alignment, keep in zip(alignments, typed)]
+        cells = list(zip(columns, heights, widths, [' ' * width for width in widths], aligners))
+        return (tuple([align(column[row_idx], width) if row_idx < height else blank
+                       for column, height, width, blank, align in cells])
+                for row_idx in range(max(heights)))
+
+    def _stream_cells(self, rows: Iterable[Sequence[Any]]) -> Iterator[Tuple[str, ...]]:
+        """Convert streamed rows into string cells of the visible data columns.
 
-        # Print index cell if index is present
+        Every row also updates the footer aggregates, unless the two-pass
+        engine fed them already.
+        """
+        offset = 1 if 'idx' in self.params.mode_columns else 0
+        visible = self.visible_columns
+        if visible is None:
+            visible = list(range((self.params.column_count or 0) - offset))
+        aggregates = self.aggregates if self.params.stream_aggregates is None else []
+        converters = [(i, self.column_formatters.get(i, str)) for i in visible]
+        for row in rows:
+            count = len(row)
+            for col, aggregate in aggregates:
+                aggregate.add(row[col] if col < count else "")
+            yield tuple([convert(row[i]) if i < count else "" for i, convert in converters])
+
+    def render_footer(self) -> None:
+        """Render the aggregate footer."""
+        self._emit_all(self._footer_output())
+
+    def _footer_output(self) -> Iterator[Optional[str]]:
+        """Yield the backend output of the aggregate footer."""
+        if not self.aggregates:
+            return
+        self._check_layout()
+        offset = 1 if 'idx' in self.params.mode_columns else 0
+        if self.visible_columns is None:
+            cells = self._footer_cells((self.params.column_count or 0) - offset)
+        else:
+            footer = self._footer_cells(max(self.visible_columns, default=-1) + 1)
+            cells = [footer[i] for i in self.visible_columns]
+        yield self.backend.footer(cells)
+
+    def _format_footer(self, cells: Sequence[str]) -> str:
+        """Return the footer row below a middle rule as text lines.
+
+        With sampled widths the aggregates of the streamed rows can outgrow
+        their columns; footer cells then overflow instead of being truncated.
+        """
+        edge = self.params.format_edge
+        rule = self._format_border(edge['symbol_middleleft'], edge['symbol_middle'], edge['symbol_middleright'])
+        prefix, template, widths, align_cells = self._compile_row_template(
+            False, len(cells), self.params.format_foot, truncate=not self._sampled_widths())
         if 'idx' in self.params.mode_columns:
-            if self.params.column_widths:
-                width = self.params.column_widths[0]
-            elif self.params.index_auto_numbering:
-                width = max(3, self.format_index.get('size', 3))
-            else:
-                width = self.params.size
-            text = index_cell[:width]  # truncate to width
-            aligned_text = self._align_text(text, width, self.format_index['align'])
-            print(index_color + aligned_text + reset, end='')
-            if not self.params.no_border:
-                if self.params.no_index_border:
-                    # Print the left border for the data section
-                    print(edge_color + self.params.format_edge['symbol_leftright'], end='')
-                else:
-                    # Print separator after index
-                    print(edge_color + self.params.format_edge['symbol_leftright'], end='')
+            prefix = prefix.format(' ' * self._index_width())
+        else:
+            prefix = prefix.format()
+        line = prefix + template.format(*align_cells(cells, widths))
+        return line if rule is None else rule + '\n' + line
+
+    def _index_width(self) -> int:
+        """Width of the index column."""
+        if self.params.column_widths:
+            return self.params.column_widths[0]
+        if self.params.index_auto_numbering:
+            return self._natural_index_width()
+        return self.params.size
+
+    def _check_layout(self) -> None:
+        """Drop compiled templates and cached rows when widths or styles changed."""
+        params = self.params
+        signature = (
+            tuple(params.column_widths), params.size, self.plain, params.no_border, params.no_index_border,
+            tuple(params.format_head.items()), tuple(params.format_body.items()),
+            tuple(params.format_edge.items()), tuple(self.format_index.items()), params.number_align,
+        )
+        if signature != self._layout_signature:
+            self._layout_signature = signature
+            self._row_templates.clear()
+            self._row_cache.clear()
+
+    def row_cache_info(self) -> CacheInfo:
+        """Report hits, misses and size of the rendered-row cache."""
+        return CacheInfo(self._row_cache_hits, self._row_cache_misses,
+                         self.params.row_cache_size, len(self._row_cache))
+
+    def _row_template(self, is_head: bool, col_count: int) -> tuple:
+        """Return the precompiled (index prefix, data template, widths, cell aligner) for a row shape."""
+        key = (is_head, col_count)
+        template = self._row_templates.get(key)
+        if template is None:
+            template = self._compile_row_template(is_head, col_count)
+            self._row_templates[key] = template
+        return template
 
-        # Print each column's cell for this row
-        for col_idx, column in enumerate(columns):
-            cell_text = column[row_idx] if row_idx < len(column) else ""
-            # Use dynamic width if available, otherwise use fixed size
-            width = self.params.column_widths[col_idx + offset] if self.params.column_widths else self.params.size
-            text = cell_text[:width]  # truncate to width
-            aligned_text = self._align_text(text, width, format_dict['align'])
+    def _row_style(self, is_head: bool, col_count: int, format_dict: Optional[dict] = None) -> tuple:
+        """Normalize the row style into the arguments of ``row_segments``."""
+        if format_dict is None:
+            format_dict = self.params.format_head if is_head else self.params.format_body
+        idx_enabled = 'idx' in self.params.mode_columns
+        border = not self.params.no_border
+        edge = (self._edge_style(), _brace_escape(self.params.format_edge['symbol_leftright']))
+        index_style = self._cell_style(self.format_index) if idx_enabled else None
+        left_border = border and not (self.params.no_index_border and idx_enabled)
+        return edge, index_style, self._cell_style(format_dict), col_count, border, left_border
+
+    def _row_segments(self, is_head: bool, col_count: int, format_dict: Optional[dict] = None) -> List[Tuple[str, str]]:
+        """Describe a row as (sgr_state, text) segments with '{}' cell placeholders."""
+        return row_segments(*self._row_style(is_head, col_count, format_dict))
+
+    def _compile_row_template(self, is_head: bool, col_count: int, format_dict: Optional[dict] = None,
+                              truncate: bool = True) -> tuple:
+        """Look up the precompiled templates of a row in the process-wide style cache.
+
+        With ``truncate`` False no cell of the row is truncated.
+
+        Returns:
+            (index prefix template, data template, data column widths, cell aligner)
+        """
+        if format_dict is None:
+            format_dict = self.params.format_head if is_head else self.params.format_body
+        offset = 1 if 'idx' in self.params.mode_columns else 0
+        if self.params.column_widths:
+            widths = tuple(self.params.column_widths[offset:offset + col_count])
+        else:
+            widths = (self.params.size,) * col_count
+        alignments = (format_dict['align'],) * col_count
+        overflow: Tuple[bool, ...] = ()
+        if not is_head:
+            alignments = self._column_alignments(alignments)
+            overflow = self._overflow_positions(col_count) if truncate else (True,) * col_count
+        return compile_row_template(*self._row_style(is_head, col_count, format_dict), widths, alignments, overflow)
 
-            print(body_color + aligned_text + reset, end='')
+    def _sampled_widths(self) -> bool:
+        """True when the column widths were measured on a sample of the rows."""
+        return self._sampled and bool(self.params.column_widths)
 
-            # Print column separator if not the last column
-            if not self.params.no_border and col_idx < len(columns) - 1:
-                print(edge_color + self.params.format_edge['symbol_leftright'], end='')
-            elif not self.params.no_border:
-                # Print right border for last column (only if not no_border)
-                print(edge_color + self.params.format_edge['symbol_leftright'], end='')
+    def _overflow_positions(self, col_count: int) -> Tuple[bool, ...]:
+        """Flag the displayed typed numeric columns whose cells overflow instead of being truncated.
 
-        print()  # newline after row
+        Only widths measured on a sample let typed cells overflow; fixed and
+        fully measured widths truncate them like any other cell.
+        """
+        if not self.column_formatters or not self._sampled_widths():
+            return ()
+        visible = self.visible_columns
+        return tuple((visible[position] if visible is not None and position < len(visible) else position)
+                     in self.column_formatters for position in range(col_count))
 
-    def _get_index_value(self, row_idx: int, is_head: bool = False, head_rows: int = 0) -> str:
+    def _column_alignments(self, alignments: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Replace the alignment of the displayed typed numeric columns with ``number_align``."""
+        if not self.column_formatters:
+            return alignments
+        visible = self.visible_columns
+        aligned = list(alignments)
+        for position in range(len(aligned)):
+            column = visible[position] if visible is not None and position < len(visible) else position
+            if column in self.column_formatters:
+                aligned[position] = self.params.number_align
+        return tuple(aligned)
+
+    def _format_cells(self, cells: Tuple[str, ...], is_head: bool = False, index_cell: str = "") -> str:
+        """Return the line of one row from its cell values.
+
+        The data part of the line is looked up in the row cache by the raw
+        cell values; the index cell is formatted separately so numbered rows
+        with equal data still hit the cache.
+        """
+        prefix, template, widths, align_cells = self._row_template(is_head, len(cells))
+        key = (is_head, cells)
+        data = self._row_cache.get(key)
+        if data is None:
+            self._row_cache_misses += 1
+            data = template.format(*align_cells(cells, widths))
+            cache_size = self.params.row_cache_size
+            if cache_size > 0:
+                self._row_cache[key] = data
+                if len(self._row_cache) > cache_size:
+                    self._row_cache.popitem(last=False)
+        else:
+            self._row_cache_hits += 1
+            self._row_cache.move_to_end(key)
+        return self._index_prefix(prefix, index_cell) + data
+
+    def _index_prefix(self, prefix: str, index_cell: str) -> str:
+        """Fill the index prefix template of a row with its aligned index cell.
+
+        Row numbers are never truncated: when streamed rows outgrow the
+        estimated row count, the label overflows the index column.
+        """
+        if 'idx' in self.params.mode_columns:
+            align = aligner(self.format_index['align'], not self.params.index_auto_numbering)
+            return prefix.format(align(index_cell, self._index_width()))
+        return prefix.format()
+
+    def _get_index_value(self, row_idx: int, is_head: bool = False) -> str:
+        """Return the index label of a rendered head or body row.
+
+        Body rows are labelled by their global position: ``index_offset``
+        plus their original position (limited rows) or their row number.
+        """
         if 'idx' not in self.params.mode_columns:
             return ""
-        if self.params.index_auto_numbering:
-            if is_head:
-                if self.params.no_header_index:
-                    return ""
-                return str(row_idx)
-            start = head_rows if head_rows > 0 else 1
-            return str(start + row_idx)
         if is_head:
-            return self.params.index_header_values[row_idx] if row_idx < len(self.params.index_header_values) else ""
-        if row_idx < len(self.params.index_body_values):
-            return self.params.index_body_values[row_idx]
-        extra_index = head_rows + row_idx
-        if extra_index < len(self.params.index_header_values):
-            return self.params.index_header_values[extra_index]
-        return ""
+            return self.row_index.head_label(row_idx)
+        position = self.params.body_positions[row_idx] if self.params.body_positions is not None else row_idx
+        return self.row_index.body_label(self.params.index_offset + position)
 
     def execute(self) -> None:
-        """Execute all modes in the mode stack, calling each render method only once."""
+        """Execute all modes in the mode stack, calling each render method only once.
+
+        With ``params.pipelined`` the lines are rendered in chunks that a
+        ``PipelinedWriter`` thread writes while the next chunks are rendered.
+        """
+        if not self.params.pipelined:
+            self._emit_all(self._output())
+            return
+        with PipelinedWriter(self.file if self.file is not None else sys.stdout) as writer:
+            for chunk in self.iter_chunks(CHUNK_LINES):
+                writer.write(chunk)
+
+    def _output(self) -> Iterator[Optional[str]]:
+        """Yield the backend output of every mode in the mode stack, each mode once."""
         executed_modes: Set[str] = set()
         for mode in self.params.mode_stack:
             if mode not in executed_modes:
                 executed_modes.add(mode)
                 if mode == 'top':
-                    self.render_top()
+                    yield from self._top_output()
                 elif mode == 'bot':
-                    self.render_bottom()
+                    yield from self._bottom_output()
                 elif mode == 'head':
-                    self.render_head()
+                    yield from self._head_output()
                 elif mode == 'body':
-                    self.render_body()
+                    yield from self._body_output()
+                    yield from self._footer_output()
+        yield self.backend.finish()
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield the finished lines of the table lazily, in mode stack order.
+
+        Each row is formatted only when its line is requested, so
+        ``itertools.islice(table.iter_lines(), 10)`` renders ten lines and
+        leaves the remaining (and streamed) rows untouched. Lines have no
+        trailing newline. Like ``execute()``, a table is rendered once.
+        """
+        for text in self._output():
+            if text is not None:
+                yield from text.split('\n')
+
+    def iter_chunks(self, size: int) -> Iterator[str]:
+        """Yield the finished lines in chunks of up to ``size`` lines.
+
+        Every chunk is a single newline-terminated string, ready for one
+        write to a sink.
+        """
+        if size < 1:
+            raise Exception("Chunk size must be at least 1.")
+        lines = self.iter_lines()
+        while True:
+            chunk = list(islice(lines, size))
+            if not chunk:
+                return
+            yield '\n'.join(chunk) + '\n'
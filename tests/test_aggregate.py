@@ -0,0 +1,64 @@
+"""Unit tests for footer aggregates in tuible."""
+
+import pytest
+from unittest.mock import patch
+from io import StringIO
+from tuible.aggregate import ColumnAggregate, parse_agg_spec
+from tuible.core import print_table
+from tuible.params import TuibleParams
+from tuible.table import TuibleTable
+
+
+class TestColumnAggregate:
+    """Test cases for ColumnAggregate and parse_agg_spec."""
+
+    def test_functions(self):
+        cells = ['5', '50', '7.5', 'n/a', '']
+        results = {}
+        for function in ('sum', 'min', 'max', 'mean', 'count'):
+            aggregate = ColumnAggregate(function)
+            for cell in cells:
+                aggregate.add(cell)
+            results[function] = aggregate.result()
+        assert results == {'sum': '62.5', 'min': '5', 'max': '50', 'mean': '20.8333', 'count': '4'}
+
+    def test_no_numbers(self):
+        aggregate = ColumnAggregate('sum')
+        aggregate.add('text')
+        assert aggregate.result() == ''
+
+    def test_parse_spec(self):
+        assert parse_agg_spec('2:sum,3:Mean') == [(2, 'sum'), (3, 'mean')]
+        with pytest.raises(Exception):
+            parse_agg_spec('2:median')
+        with pytest.raises(Exception):
+            parse_agg_spec('0:sum')
+
+
+class TestFooter:
+    """Test cases for the aggregate footer row."""
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_cli_footer_above_bottom(self, mock_stdout):
+        params = TuibleParams()
+        params.parseArguments(['top', 'head', 'n', 'v', 'body', 'a', '5', 'body', 'b', '50', 'bot',
+                               '-agg', '2:sum', '-nc', '-size', '-1'])
+        TuibleTable(params).execute()
+        assert mock_stdout.getvalue().splitlines() == [
+            '┏━┳━━┓', '┃n┃v ┃', '┃a┃5 ┃', '┃b┃50┃', '┣━╋━━┫', '┃ ┃55┃', '┗━┻━━┛']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_footer_width_counts(self, mock_stdout):
+        print_table(heads=['v'], body=[['9'] for _ in range(200)], agg='1:sum', plain=True)
+        lines = mock_stdout.getvalue().splitlines()
+        assert lines[-2] == '┃1800┃'
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_streamed_rows_are_aggregated(self, mock_stdout):
+        body = ([str(i), 'x'] for i in range(1, 101))
+        print_table(heads=['number', 'count'], body=body, sample=3, agg=[(1, 'max'), (2, 'count')],
+                    index=True, plain=True)
+        lines = mock_stdout.getvalue().splitlines()
+        assert len(lines) == 105
+        assert lines[-3] == '┣━━━╋━━━━━━╋━━━━━┫'
+        assert lines[-2] == '┃   ┃100   ┃100  ┃'
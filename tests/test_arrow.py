@@ -0,0 +1,72 @@
+"""Unit tests for Apache Arrow input in tuible."""
+
+import pytest
+from io import StringIO
+from unittest.mock import patch
+from tuible.arrow import arrow_batches, arrow_rows, is_arrow, length_counts, text_column
+from tuible.core import print_arrow, print_table
+
+pyarrow = pytest.importorskip('pyarrow')
+
+
+def sample_table():
+    return pyarrow.table({'name': ['a', 'bbb', None, 'dddd'], 'n': [1, 22, 333, None]})
+
+
+class TestArrowHelpers:
+    """Test cases for the Arrow helpers."""
+
+    def test_is_arrow(self):
+        table = sample_table()
+        assert is_arrow(table)
+        assert is_arrow(table.to_batches()[0])
+        assert not is_arrow([['a']])
+
+    def test_batches_are_sliced_to_head(self):
+        table = pyarrow.concat_tables([sample_table(), sample_table()])
+        schema, batches, num_rows = arrow_batches(table, head=5)
+        assert schema.names == ['name', 'n']
+        assert num_rows == 5
+        assert sum(batch.num_rows for batch in batches) == 5
+
+    def test_reader_is_read_once(self):
+        table = sample_table()
+        reader = pyarrow.RecordBatchReader.from_batches(table.schema, table.to_batches(max_chunksize=1))
+        _, batches, num_rows = arrow_batches(reader)
+        assert num_rows == 4
+
+    def test_text_column_fills_nulls_and_falls_back(self):
+        assert text_column(pyarrow.array([1, None])).to_pylist() == ['1', '']
+        assert text_column(pyarrow.array([[1, 2], None])).to_pylist() == ['[1, 2]', '']
+
+    def test_length_counts(self):
+        _, batches, _ = arrow_batches(sample_table())
+        assert length_counts(batches, 2) == [{1: 1, 3: 1, 0: 1, 4: 1}, {1: 1, 2: 1, 3: 1, 0: 1}]
+
+    def test_rows_are_converted_one_batch_at_a_time(self):
+        batches = sample_table().to_batches(max_chunksize=2)
+        with patch('tuible.arrow.text_column', side_effect=text_column) as converted:
+            rows = arrow_rows(batches, lambda: [1])
+            assert next(rows) == ('', '1')
+            assert converted.call_count == 1
+            assert list(rows) == [('', '22'), ('', '333'), ('', '')]
+
+
+class TestPrintArrow:
+    """Test cases for print_arrow."""
+
+    def test_matches_print_table(self):
+        output = StringIO()
+        print_arrow(sample_table(), plain=True, index=True, file=output)
+        expected = StringIO()
+        print_table(['name', 'n'], [['a', 1], ['bbb', 22], ['', 333], ['dddd', '']], plain=True, index=True,
+                    types='2:int', file=expected)
+        assert output.getvalue() == expected.getvalue()
+
+    def test_head_and_heads(self):
+        output = StringIO()
+        print_arrow(sample_table(), heads=['Name', 'Number'], head=2, plain=True, file=output)
+        lines = output.getvalue().splitlines()
+        assert lines[1] == '┃Name┃Number┃'
+        assert lines[-2] == '┃bbb ┃    22┃'
+        assert len(lines) == 5
@@ -0,0 +1,52 @@
+"""Unit tests for the output backends in tuible."""
+
+import pytest
+from unittest.mock import patch
+from io import StringIO
+from tuible.backends import parse_output_format
+from tuible.core import print_block, print_table
+from tuible.params import TuibleParams
+from tuible.table import TuibleTable
+
+
+class TestBackends:
+    """Test cases for the ANSI, plain, Markdown and HTML backends."""
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_markdown(self, mock_stdout):
+        print_table(heads=['name', 'n'], body=[['a|b', 5], ['c', 50]], index=True, output_format='markdown')
+        assert mock_stdout.getvalue().splitlines() == [
+            '|   0 | name |  n  |',
+            '| --: | :--- | --: |',
+            '|   1 | a\\|b |   5 |',
+            '|   2 | c    |  50 |']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_markdown_widths_count_pipe_escapes(self, mock_stdout):
+        print_table(heads=['x'], body=[['a||b'], ['cdef']], output_format='markdown')
+        assert mock_stdout.getvalue().splitlines() == [
+            '|   x    |', '| :----- |', '| a\\|\\|b |', '| cdef   |']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_markdown_without_head_gets_empty_header(self, mock_stdout):
+        print_table(body=[['x']], output_format='markdown')
+        assert mock_stdout.getvalue().splitlines() == ['|     |', '| :-- |', '| x   |']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_html_sections_and_escaping(self, mock_stdout):
+        print_block([['h'], ['<b>'], ['2']], agg='1:sum', output_format='html')
+        assert mock_stdout.getvalue().splitlines() == [
+            '<table>', '<thead>', '<tr><th style="text-align: center">h</th></tr>', '</thead>',
+            '<tbody>', '<tr><td>&lt;b&gt;</td></tr>', '<tr><td>2</td></tr>', '</tbody>',
+            '<tfoot>', '<tr><td>2</td></tr>', '</tfoot>', '</table>']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_cli_format_selector(self, mock_stdout):
+        params = TuibleParams()
+        params.parseArguments(['top', 'head', 'h', 'body', 'x', 'bot', '-format', 'plain', '-size', '-1'])
+        TuibleTable(params).execute()
+        assert mock_stdout.getvalue().splitlines() == ['┏━┓', '┃h┃', '┃x┃', '┗━┛']
+
+    def test_unknown_format(self):
+        with pytest.raises(Exception):
+            parse_output_format('pdf')
@@ -84,6 +84,65 @@ class TestCLI:
         assert '\x1b[31m' in output # Edge color
         assert '\x1b[32m' in output # body color
 
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_cli_usage_without_mode(self, mock_stdout):
+        """Test usage message when no mode is given."""
+        test_args = ['tuible', '-nb', '-size', '5']
+        with patch('sys.argv', test_args):
+            main()
+        assert 'Usage: tuible' in mock_stdout.getvalue()
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_cli_environment_defaults(self, mock_stdout):
+        """Test TUIBLE_ environment variables are parsed before argv."""
+        test_args = ['tuible', 'body', 'test']
+        with patch('sys.argv', test_args), patch.dict('os.environ', {'TUIBLE_nc': '1', 'TUIBLE_size': '-1'}):
+            main()
+        assert mock_stdout.getvalue() == '┃test┃\n'
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_cli_argument_file(self, mock_stdout, tmp_path):
+        """Test @file arguments are read one token per line."""
+        token_file = tmp_path / 'tokens.txt'
+        token_file.write_text('head\nH1\nH2\nbody\na\n:a2\n\n:b2\n')
+        test_args = ['tuible', 'top', f'@{token_file}', 'bot', '-nc', '-size', '-1']
+        with patch('sys.argv', test_args):
+            main()
+        assert mock_stdout.getvalue().splitlines() == [
+            '┏━━┳━━┓', '┃H1┃H2┃', '┃a ┃  ┃', '┃a2┃b2┃', '┗━━┻━━┛']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_cli_nul_delimited_stdin(self, mock_stdout):
+        """Test -0 reads NUL-delimited tokens from stdin."""
+        test_args = ['tuible', '-0', '-nc', '-size', '-1']
+        with patch('sys.argv', test_args), patch('sys.stdin', StringIO('body\0line\none\0x\0')):
+            main()
+        assert mock_stdout.getvalue() == '┃line\none┃x┃\n'
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_cli_tokens_from_stdin(self, mock_stdout):
+        """Test --tokens-from - reads newline-delimited tokens from stdin."""
+        test_args = ['tuible', 'body', '@@user', '--tokens-from', '-', '-nc', '-size', '-1']
+        with patch('sys.argv', test_args), patch('sys.stdin', StringIO('x\n:y\n')):
+            main()
+        assert mock_stdout.getvalue().splitlines() == ['┃@user┃x┃', '┃     ┃y┃']
+
+    def test_read_tokens_across_chunks(self):
+        """Test tokens split over chunk boundaries are joined."""
+        from tuible.params import read_tokens
+        tokens = list(read_tokens(StringIO('alpha\0beta\0\0gamma'), '\0', chunk_size=3))
+        assert tokens == ['alpha', 'beta', '', 'gamma']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_cli_plain_output(self, mock_stdout):
+        """Test -nc forces plain output without escape sequences."""
+        test_args = ['tuible', 'top', 'body', 'test', 'bot', '-size', '-1', '-nc']
+        with patch('sys.argv', test_args):
+            main()
+        output = mock_stdout.getvalue()
+        assert '\x1b' not in output
+        assert output.splitlines() == ['┏━━━━┓', '┃test┃', '┗━━━━┛']
+
     @patch('sys.stdout', new_callable=StringIO)
     def test_cli_dynamic_size(self, mock_stdout):
         """Test dynamic sizing."""
@@ -0,0 +1,47 @@
+"""Unit tests for the thread-safe table in tuible."""
+
+import threading
+import pytest
+from io import StringIO
+from tuible.concurrent import ConcurrentTable
+
+
+class TestConcurrentTable:
+    """Test cases for ConcurrentTable."""
+
+    def test_rows_from_many_threads_never_interleave(self):
+        output = StringIO()
+        with ConcurrentTable(['worker', 'n'], colsize=[6, 4], batch_size=16, plain=True, stream=output) as table:
+            def produce(worker):
+                for n in range(200):
+                    table.submit_row([f'w{worker}', n])
+            threads = [threading.Thread(target=produce, args=(w,)) for w in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        lines = output.getvalue().splitlines()
+        assert lines[0] == '┏━━━━━━┳━━━━┓'
+        assert lines[1] == '┃worker┃ n  ┃'
+        assert lines[-1] == '┗━━━━━━┻━━━━┛'
+        body = lines[2:-1]
+        assert len(body) == 1600 and table.rows_written == 1600
+        assert all(len(line) == 13 and line.startswith('┃w') for line in body)
+        # each producer's rows keep their relative order
+        assert [line for line in body if line.startswith('┃w3 ')] == [f'┃w3    ┃{n:<4}┃' for n in range(200)]
+
+    def test_sequence_order(self):
+        output = StringIO()
+        with ConcurrentTable(['v'], colsize=3, order='sequence', index=True, plain=True, stream=output) as table:
+            for seq in (2, 0, 3, 1, 5):
+                table.submit_row([f'r{seq}'], seq=seq)
+        assert output.getvalue().splitlines()[2:-1] == [
+            '┃  1┃r0 ┃', '┃  2┃r1 ┃', '┃  3┃r2 ┃', '┃  4┃r3 ┃', '┃  6┃r5 ┃']
+
+    def test_submit_after_close(self):
+        table = ConcurrentTable(['v'], plain=True, stream=StringIO())
+        table.close()
+        with pytest.raises(Exception):
+            table.submit_row(['x'])
+        with pytest.raises(Exception):
+            ConcurrentTable(['v'], order='random')
@@ -4,7 +4,7 @@ import pytest
 import re
 from unittest.mock import patch, MagicMock
 from io import StringIO
-from tuible.core import print_line, print_block, print_table
+from tuible.core import print_line, print_block, print_cursor, print_table
 from tuible.params import TuibleParams
 from tuible.table import TuibleTable
 
@@ -293,6 +293,46 @@ class TestTuibleParamsIdx:
         assert params.no_index_border == True
 
 
+class TestTuibleParamsParsing:
+    """Test cases for the single-pass argument parser."""
+
+    def test_parse_from_generator(self):
+        """Test that any iterable of tokens can be parsed."""
+        params = TuibleParams()
+        params.parseArguments(token for token in ['body', 'a', ':a2', 'b', '-size', '-1'])
+        assert params.mode_columns['body'] == [['a', 'a2'], ['b']]
+        assert params.size == -1
+
+    def test_missing_columns_are_added_and_rows_stay_sparse(self):
+        params = TuibleParams()
+        params.parseArguments(['head', 'H1', 'H2', 'H3', 'body', 'x', ':y', ':z'])
+        assert params.mode_columns['head'] == [['H1'], ['H2'], ['H3']]
+        assert params.mode_columns['body'] == [['x', 'y', 'z'], [], []]
+
+    def test_alone_args_share_option_table(self):
+        from tuible.params import ALONE_OPTIONS
+        assert TuibleParams().alone_args == list(ALONE_OPTIONS)
+        assert {'-nhi', '-nib', '-nc', '-fit'} <= set(ALONE_OPTIONS)
+
+    def test_index_alias(self):
+        params = TuibleParams()
+        params.parseArguments(['index', ':i1', 'body', 'b1'])
+        assert params.mode_stack == ['idx', 'body']
+        assert params.index_body_values == ['i1']
+
+    def test_value_option_missing_value(self):
+        params = TuibleParams()
+        with pytest.raises(Exception) as exc_info:
+            params.parseArguments(['body', 'x', '-size'])
+        assert 'requires a value' in str(exc_info.value)
+
+    def test_edge_symbols_option(self):
+        params = TuibleParams()
+        params.parseArguments(['body', 'x', '-fe', '|-++++++'])
+        assert params.format_edge['symbol_leftright'] == '|'
+        assert params.format_edge['symbol_bottommiddle'] == '+'
+
+
 class TestTuibleTableIdx:
     """Test cases for TuibleTable idx rendering."""
 
@@ -582,3 +622,390 @@ class TestTuibleTableIdx:
         assert '┃1' not in output  # should not have left border before index
 
 
+
+
+class TestPlainMode:
+    """Test cases for plain (escape-free) output."""
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_plain_api_argument_has_no_escapes(self, mock_stdout):
+        """Test that plain=True produces aligned text without ANSI codes."""
+        print_table(heads=['H1', 'Head2'], body=[['a', 'b'], ['ccc', 'd']], plain=True)
+        output = mock_stdout.getvalue()
+        assert '\x1b' not in output
+        lines = output.splitlines()
+        assert lines[0] == '┏━━━┳━━━━━┓'
+        assert lines[1] == '┃H1 ┃Head2┃'
+        assert lines[2] == '┃a  ┃b    ┃'
+        assert lines[4] == '┗━━━┻━━━━━┛'
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_plain_false_forces_colors(self, mock_stdout):
+        """Test that plain=False keeps colors even when NO_COLOR is set."""
+        with patch.dict('os.environ', {'NO_COLOR': '1'}):
+            print_line(['x'], plain=False)
+        assert '\x1b[' in mock_stdout.getvalue()
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_no_color_environment_enables_plain(self, mock_stdout):
+        """Test that NO_COLOR switches to plain output automatically."""
+        with patch.dict('os.environ', {'NO_COLOR': '1'}):
+            print_block([['H'], ['x']])
+        assert '\x1b' not in mock_stdout.getvalue()
+
+    def test_stream_supports_color_detection(self, tmp_path):
+        """Test TTY detection for real descriptors and in-memory streams."""
+        from tuible.table import stream_supports_color
+        with patch.dict('os.environ', {}, clear=True):
+            with open(tmp_path / 'out.txt', 'w') as handle:
+                assert not stream_supports_color(handle)
+            assert stream_supports_color(StringIO())
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_plain_with_index_and_braces(self, mock_stdout):
+        """Test plain template with index column and literal braces in cells."""
+        params = TuibleParams()
+        params.parseArguments(['idx', 'head', '{h}', 'body', '{0}', '-nc', '-size', '-1'])
+        TuibleTable(params).execute()
+        lines = mock_stdout.getvalue().splitlines()
+        assert lines == ['┃  0┃{h}┃', '┃  1┃{0}┃']
+
+
+def styled_chars(text):
+    """Simulate a terminal and return (char, attrs, fg, bg) for each printed char."""
+    from tuible.table import SGR_OFF, _sgr_groups
+    attrs, colors, result = set(), {}, []
+    for chunk in re.split(r'(\x1b\[[0-9;]*m)', text):
+        if chunk.startswith('\x1b['):
+            params = chunk[2:-1]
+            if params in ('', '0'):
+                attrs, colors = set(), {}
+                continue
+            for kind, code in _sgr_groups(params):
+                if code == '0':
+                    attrs, colors = set(), {}
+                elif code in ('39', '49'):
+                    colors.pop('fg' if code == '39' else 'bg', None)
+                elif code in SGR_OFF.values():
+                    attrs -= {attr for attr, off in SGR_OFF.items() if off == code}
+                elif kind == 'attr':
+                    attrs.add(code)
+                else:
+                    colors[kind] = code
+        else:
+            for char in chunk:
+                result.append((char, frozenset(attrs), colors.get('fg'), colors.get('bg')))
+    return result
+
+
+class TestSgrCoalescing:
+    """Test cases for ANSI escape-sequence coalescing."""
+
+    def test_transition_same_state_is_empty(self):
+        from tuible.table import sgr_transition
+        assert sgr_transition('93', '93') == ''
+        assert sgr_transition('', '') == ''
+
+    def test_transition_color_swap_without_reset(self):
+        from tuible.table import sgr_transition
+        assert sgr_transition('93', '96') == '\x1b[96m'
+        assert sgr_transition('93', '1;96') == '\x1b[1;96m'
+        assert sgr_transition('3;31', '1;3;4;33') == '\x1b[1;4;33m'
+
+    def test_transition_dropping_attributes_resets_when_shorter(self):
+        from tuible.table import sgr_transition
+        assert sgr_transition('1;96', '93') == '\x1b[0;93m'
+        assert sgr_transition('93', '4;104') == '\x1b[0;4;104m'
+        assert sgr_transition('96', '') == '\x1b[0m'
+        assert sgr_transition('10;96', '96') == '\x1b[0;96m'
+
+    def test_transition_turns_off_dropped_attributes(self):
+        from tuible.table import sgr_transition
+        assert sgr_transition('1;38;5;208', '38;5;208') == '\x1b[22m'
+        assert sgr_transition('1;2;4;96', '2;4;96') == '\x1b[22;2m'
+        assert sgr_transition('3;38;5;208;48;5;17', '38;5;208') == '\x1b[23;49m'
+
+    def test_cells_are_stacked_on_the_edge(self):
+        from tuible.table import stack_sgr
+        assert stack_sgr('93', '1;3;4;104') == '93;1;3;4;104'
+        assert stack_sgr('93', '96') == '96'
+        assert stack_sgr('1;93', '0;41') == '0;41'
+        assert stack_sgr('', '96') == '96'
+
+    def test_extended_colors_are_single_groups(self):
+        from tuible.table import _sgr_groups
+        assert _sgr_groups('1;38;5;208;48;2;1;2;3') == [
+            ('attr', '1'), ('fg', '38;5;208'), ('bg', '48;2;1;2;3')]
+
+    @pytest.mark.parametrize('args', [
+        ['top', 'head', 'H1', 'H2', 'body', 'a', ':aa', 'b', 'bot'],
+        ['top', 'idx', 'head', 'H1', 'body', 'x', 'bot', '-ci', '38;5;208'],
+        ['top', 'idx', 'head', 'H1', 'body', 'x', 'bot', '-nib', '-ci', '38;5;208'],
+        ['head', 'a', 'b', 'body', 'c', 'd', '-nb', '-fb', '1;', '-cb', '41'],
+        ['head', 'a', 'b', 'body', 'c', 'd', '-fh', '1;', '-ch', '104', '-ce', '3;93'],
+    ])
+    def test_output_visually_identical_and_smaller(self, args):
+        """Coalesced rows must look like the rows of the per-cell renderer they replace.
+
+        That renderer sent the edge color before every edge, and each cell
+        style on top of it followed by a reset.
+        """
+        params = TuibleParams()
+        params.parseArguments(args + ['-size', '-1'])
+        table = TuibleTable(params)
+        col_count = params.column_count - (1 if 'idx' in params.mode_columns else 0)
+        for is_head in (True, False):
+            edge, index_style, cell_style, _, border, left_border = table._row_style(is_head, col_count)
+            edge = f"\x1b[{edge[0]}m{edge[1]}"
+            legacy = [edge] if left_border else []
+            if index_style is not None:
+                legacy += [f"\x1b[{index_style}m{{}}\x1b[0m"] + ([edge] if border else [])
+            legacy += ([f"\x1b[{cell_style}m{{}}\x1b[0m"] + ([edge] if border else [])) * col_count
+            coalesced = ''.join(table._row_template(is_head, col_count)[:2])
+            assert styled_chars(coalesced) == styled_chars(''.join(legacy))
+            assert len(coalesced) < len(''.join(legacy))
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_head_cells_keep_the_edge_color(self, mock_stdout):
+        params = TuibleParams()
+        params.parseArguments(['head', 'a', 'b', '-size', '-1'])
+        params.plain = False
+        TuibleTable(params).execute()
+        assert mock_stdout.getvalue() == '\x1b[93m┃\x1b[1;3;4;104ma\x1b[0;93m┃\x1b[1;3;4;104mb\x1b[0;93m┃\x1b[0m\n'
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_rows_end_in_default_state(self, mock_stdout):
+        """Test that every rendered line ends with a reset."""
+        print_table(heads=['H'], body=[['x'], ['y']])
+        for line in mock_stdout.getvalue().splitlines():
+            assert line.endswith('\x1b[0m')
+
+
+class TestRowCache:
+    """Test cases for the rendered-row cache."""
+
+    def _params(self, *args):
+        params = TuibleParams()
+        params.parseArguments(list(args) + ['-nc', '-size', '-1'])
+        return params
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_repeated_rows_hit_cache_with_auto_index(self, mock_stdout):
+        params = self._params('idx', 'body', 'ok', 'up', 'body', 'ok', 'up', 'body', 'ok', 'up')
+        table = TuibleTable(params)
+        table.execute()
+        info = table.row_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+        assert info.hit_rate == pytest.approx(2 / 3)
+        assert mock_stdout.getvalue().splitlines() == ['┃  1┃ok┃up┃', '┃  2┃ok┃up┃', '┃  3┃ok┃up┃']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_head_and_body_do_not_share_entries(self, mock_stdout):
+        params = self._params('head', 'x', 'body', 'x', '-fbr')
+        table = TuibleTable(params)
+        table.execute()
+        assert table.row_cache_info().misses == 2
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_width_change_invalidates_cache(self, mock_stdout):
+        params = self._params('body', 'ab', 'body', 'ab')
+        table = TuibleTable(params)
+        table.render_body()
+        params.column_widths = [4]
+        table.render_body()
+        lines = mock_stdout.getvalue().splitlines()
+        assert lines == ['┃ab┃', '┃ab┃', '┃ab  ┃', '┃ab  ┃']
+        assert table.row_cache_info().misses == 2
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_cache_is_bounded(self, mock_stdout):
+        params = self._params(*[token for i in range(10) for token in ('body', str(i))])
+        params.row_cache_size = 3
+        table = TuibleTable(params)
+        table.execute()
+        table.execute()
+        info = table.row_cache_info()
+        assert info.currsize == 3
+        assert info.hits == 0
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_cache_disabled(self, mock_stdout):
+        params = self._params('body', 'a', 'body', 'a')
+        params.row_cache_size = 0
+        table = TuibleTable(params)
+        table.execute()
+        assert table.row_cache_info().currsize == 0
+        assert mock_stdout.getvalue().count('┃a┃') == 2
+
+
+class TestStyleCache:
+    """Test cases for the process-wide style cache."""
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_tables_share_compiled_templates(self, mock_stdout):
+        from tuible.instrumentation import clear_style_caches, style_cache_info
+        clear_style_caches()
+        for i in range(5):
+            print_table(heads=['h'], body=[['x']], colsize=3, plain=False)
+        info = style_cache_info()
+        assert info['row_template'].misses == 2
+        assert info['row_template'].hits == 8
+        assert info['border_line'].hit_rate == 0.8
+        assert info['sgr_transition'].maxsize == 1024
+        lines = mock_stdout.getvalue().splitlines()
+        assert lines[:4] == lines[4:8]
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_style_change_compiles_new_template(self, mock_stdout):
+        from tuible.instrumentation import clear_style_caches, style_cache_info
+        clear_style_caches()
+        print_line(['a'], colsize=3, color2='35', plain=False)
+        print_line(['a'], colsize=3, color2='32', plain=False)
+        assert style_cache_info()['row_template'].misses == 2
+        assert mock_stdout.getvalue().splitlines()[1] == '\x1b[36m┃\x1b[32ma  \x1b[36m┃\x1b[0m'
+
+
+class TestIterLines:
+    """Test cases for pull-based line generators."""
+
+    def _table(self, rows, **options):
+        params = TuibleParams()
+        params.parseArguments(['top', 'head', 'n', 'body', 'bot', '-nc', '-size', '3'])
+        return TuibleTable(params, body_stream=rows, **options)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_lines_match_execute(self, mock_stdout):
+        self._table(iter([['1'], ['2']])).execute()
+        lines = list(self._table(iter([['1'], ['2']])).iter_lines())
+        assert lines == mock_stdout.getvalue().splitlines()
+        assert lines == ['┏━━━┓', '┃ n ┃', '┃1  ┃', '┃2  ┃', '┗━━━┛']
+
+    def test_only_requested_rows_are_rendered(self):
+        pulled = []
+
+        def rows():
+            for i in range(1000000):
+                pulled.append(i)
+                yield [str(i)]
+
+        from itertools import islice
+        lines = list(islice(self._table(rows()).iter_lines(), 10))
+        assert lines[-1] == '┃7  ┃'
+        assert len(pulled) == 8
+
+    def test_chunks(self):
+        chunks = list(self._table(iter([[str(i)] for i in range(5)])).iter_chunks(3))
+        assert [chunk.count('\n') for chunk in chunks] == [3, 3, 2]
+        assert chunks[-1].endswith('┗━━━┛\n')
+        with pytest.raises(Exception):
+            next(self._table(iter([])).iter_chunks(0))
+
+
+class TestPrintCursor:
+    """Test cases for print_cursor."""
+
+    class LineSink:
+        """Output stream that only counts lines."""
+
+        def __init__(self):
+            self.lines = 0
+
+        def write(self, text):
+            self.lines += text.count('\n')
+
+        def flush(self):
+            pass
+
+    @staticmethod
+    def _connection(rows):
+        import sqlite3
+        connection = sqlite3.connect(':memory:')
+        connection.execute('create table t (name text, n integer)')
+        connection.executemany('insert into t values (?, ?)', ((f'name {i}', i) for i in range(rows)))
+        return connection
+
+    def test_heads_from_description(self):
+        cursor = self._connection(3).execute('select name, n as number from t')
+        output = StringIO()
+        print_cursor(cursor, batch_size=2, plain=True, file=output)
+        lines = output.getvalue().splitlines()
+        assert 'number' in lines[1]
+        assert lines[-2] == '┃name 2┃     2┃'
+        assert len(lines) == 6
+
+    def test_rows_are_fetched_in_batches(self):
+        cursor = MagicMock()
+        cursor.description = [('a',)]
+        cursor.rowcount = -1
+        cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+        output = StringIO()
+        print_cursor(cursor, batch_size=2, plain=True, index=True, file=output)
+        assert all(call.args == (2,) for call in cursor.fetchmany.call_args_list)
+        assert output.getvalue().count('\n') == 6
+
+    def test_index_labels_outgrow_the_first_batch(self):
+        cursor = self._connection(1500).execute('select n from t')
+        output = StringIO()
+        print_cursor(cursor, batch_size=500, plain=True, index=True, file=output)
+        assert output.getvalue().splitlines()[-2] == '┃1500┃1499┃'
+
+    def test_footer_outgrows_the_first_batch(self):
+        cursor = self._connection(1500).execute('select n from t')
+        output = StringIO()
+        print_cursor(cursor, batch_size=500, agg='1:sum', plain=True, file=output)
+        assert output.getvalue().splitlines()[-2] == '┃1124250┃'
+
+    def test_memory_stays_bounded(self):
+        import tracemalloc
+
+        def peak(rows):
+            cursor = self._connection(rows).execute('select * from t')
+            sink = self.LineSink()
+            tracemalloc.start()
+            print_cursor(cursor, batch_size=500, plain=True, file=sink)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            assert sink.lines == rows + 3
+            return peak
+
+        assert peak(30000) < 2 * peak(3000)
+
+    def test_cursor_without_result_set(self):
+        cursor = self._connection(0).execute('delete from t')
+        with pytest.raises(Exception):
+            print_cursor(cursor)
+
+
+class TestSparseRows:
+    """Test cases for modes whose columns differ in height."""
+
+    @staticmethod
+    def _render(params):
+        output = StringIO()
+        TuibleTable(params, file=output).execute()
+        return output.getvalue()
+
+    @pytest.mark.parametrize('plain', [True, False])
+    def test_sparse_columns_render_like_padded_columns(self, plain):
+        args = ['idx', 'head', 'H1', ':h2', 'H2', 'body', 'x', ':y', ':z', '1', '-fbc', '-size', '-1']
+        sparse = TuibleParams()
+        sparse.parseArguments(args)
+        sparse.plain = plain
+        padded = TuibleParams()
+        padded.parseArguments(args)
+        padded.plain = plain
+        for columns in (padded.mode_columns['head'], padded.mode_columns['body']):
+            height = max(map(len, columns))
+            for column in columns:
+                column.extend([''] * (height - len(column)))
+
+        assert sparse.mode_columns['body'] == [['x', 'y', 'z'], ['1']]
+        assert self._render(sparse) == self._render(padded)
+
+    def test_missing_lines_count_as_empty_cells(self):
+        params = TuibleParams()
+        params.parseArguments(['body', 'x', ':y', ':z', 'long', '-nc', '-size', '-1'])
+        table = TuibleTable(params, file=StringIO())
+        assert table.column_stats[1].max == 4
+        assert table.column_stats[1].p90 == 4
+        assert table.column_stats[1].min == 0
@@ -0,0 +1,66 @@
+"""Unit tests for dictionary-encoded columns in tuible."""
+
+from unittest.mock import patch
+from io import StringIO
+from tuible.core import print_table
+from tuible.encoding import EncodedColumn
+from tuible.layout import ColumnStats
+from tuible.params import TuibleParams
+from tuible.table import TuibleTable
+
+
+class TestEncodedColumn:
+    """Test cases for EncodedColumn."""
+
+    def test_distinct_values_and_codes(self):
+        column = EncodedColumn(['north', 'south', 'north', 'east', 'north'])
+        assert column.values == ['north', 'south', 'east']
+        assert list(column.codes) == [0, 1, 0, 2, 0]
+        assert column.codes.itemsize == 4
+        assert list(column) == ['north', 'south', 'north', 'east', 'north']
+        assert (len(column), column[3], column[1:3]) == (5, 'east', ['south', 'north'])
+
+    def test_types_stay_apart(self):
+        column = EncodedColumn([1, 1.0, True, [1], '1'])
+        assert column.values == [1, 1.0, True, '[1]', '1']
+
+    def test_length_counts_match_stats(self):
+        cells = ['a', 'bbb', 'a', 'cc', 'a', 'bbb'] * 7
+        column = EncodedColumn(cells)
+        assert column.length_counts() == {1: 21, 3: 14, 2: 7}
+        assert ColumnStats.from_counts(column.length_counts()) == ColumnStats.from_lengths(map(len, cells))
+
+    def test_aligned_values_are_cached(self):
+        calls = []
+
+        def align(text, width):
+            calls.append(text)
+            return text.rjust(width)
+
+        column = EncodedColumn(['x', 'yy', 'x', 'x'])
+        assert list(column.aligned_cells(3, align)) == ['  x', ' yy', '  x', '  x']
+        list(column.aligned_cells(3, align))
+        assert calls == ['x', 'yy']
+
+
+class TestEncodedTable:
+    """Test cases for rendering dictionary-encoded tables."""
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_output_matches_unencoded(self, mock_stdout):
+        body = [[f'region{i % 3}', ['open', 'closed'][i % 2], i % 4] for i in range(30)]
+        for encode in (False, True):
+            print_table(heads=['region', 'status', 'n'], body=body, index=True, agg='3:sum', encode=encode)
+        output = mock_stdout.getvalue()
+        half = len(output) // 2
+        assert output[:half] == output[half:]
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_cli_encoding(self, mock_stdout):
+        params = TuibleParams()
+        params.parseArguments(['head', 'type', 'body', 'a', 'body', 'bb', 'body', 'a', '-enc', '-nc', '-size', '-1',
+                               '-fbr'])
+        table = TuibleTable(params)
+        assert isinstance(table.params.mode_columns['body'][0], EncodedColumn)
+        table.execute()
+        assert mock_stdout.getvalue().splitlines() == ['┃type┃', '┃   a┃', '┃  bb┃', '┃   a┃']
@@ -0,0 +1,135 @@
+"""Unit tests for layout engine selection in tuible."""
+
+import pytest
+from io import StringIO
+from tuible.aggregate import ColumnAggregate
+from tuible.core import print_block, print_table
+from tuible.engine import EngineChoice, SpilledRows, choose_engine
+from tuible.instrumentation import last_engine_choice
+
+
+def rows(count, width=3):
+    for i in range(count):
+        yield ['x' * width, i]
+
+
+class TestChooseEngine:
+    """Test cases for choose_engine."""
+
+    def test_input_that_fits_the_probe_stays_in_memory(self):
+        choice, probe, rest = choose_engine(rows(5), memory_budget=1, probe_rows=10)
+        assert (choice.engine, choice.reason, choice.rows) == ('memory', 'input fits in the probe', 5)
+        assert len(probe) == 5
+        assert list(rest) == []
+
+    def test_known_length_within_budget_stays_in_memory(self):
+        data = [['abc', i] for i in range(100)]
+        choice, probe, rest = choose_engine(data, memory_budget=10 ** 9, probe_rows=10)
+        assert choice.engine == 'memory'
+        assert choice.rows == 100
+        assert choice.estimated_bytes == 100 * choice.row_bytes
+        assert len(probe) + len(list(rest)) == 100
+
+    def test_known_length_over_budget_uses_two_passes(self):
+        data = [['abc', i] for i in range(100)]
+        choice, _, _ = choose_engine(data, memory_budget=100, probe_rows=10)
+        assert (choice.engine, choice.reason) == ('two-pass', 'estimated size exceeds the memory budget')
+
+    def test_unknown_length_with_budget_uses_two_passes(self):
+        choice, _, _ = choose_engine(rows(100), memory_budget=10 ** 9, probe_rows=10)
+        assert choice.engine == 'two-pass'
+        assert choice.rows is None
+
+    def test_expected_rows_size_unknown_input(self):
+        choice, _, _ = choose_engine(rows(100), memory_budget=10 ** 9, expected_rows=100, probe_rows=10)
+        assert (choice.engine, choice.rows) == ('memory', 100)
+
+    def test_file_size_estimates_row_count(self, tmp_path):
+        path = tmp_path / 'rows.txt'
+        path.write_text('abcd\n' * 100)
+        with open(path) as handle:
+            choice, _, _ = choose_engine(handle, memory_budget=10 ** 9, probe_rows=10)
+        assert choice.rows == 100
+
+    def test_interactive_latency_streams_a_sample(self):
+        choice, probe, _ = choose_engine(rows(100), latency='interactive', probe_rows=10)
+        assert choice.engine == 'sample'
+        assert len(probe) == 10
+
+    def test_explicit_engine_overrides(self):
+        choice, _, _ = choose_engine(rows(100), memory_budget=1, engine='memory', probe_rows=10)
+        assert (choice.engine, choice.reason) == ('memory', 'requested')
+
+    def test_invalid_engine_and_latency(self):
+        with pytest.raises(Exception, match="Invalid engine"):
+            choose_engine([], engine='parallel')
+        with pytest.raises(Exception, match="Invalid latency"):
+            choose_engine([], latency='fast')
+
+
+class TestSpilledRows:
+    """Test cases for SpilledRows."""
+
+    def test_counts_lengths_and_reads_rows_back(self):
+        spilled = SpilledRows(iter([['a', 1], ['bbb', 22], ['cc']]), [str, str])
+        assert len(spilled) == 3
+        assert spilled.length_counts[0] == {1: 1, 3: 1, 2: 1}
+        assert spilled.length_counts[1] == {1: 1, 2: 1, 0: 1}
+        assert list(spilled) == [['a', 1], ['bbb', 22], ['cc']]
+
+    def test_feeds_aggregates_in_the_first_pass(self):
+        total = ColumnAggregate('sum')
+        spilled = SpilledRows(iter([['a', 1], ['bbb', 22], ['cc']]), [str, str], [(1, total)])
+        assert total.result() == '23'
+        assert len(list(spilled)) == 3
+
+
+class TestEngineSelection:
+    """Test cases for engine selection in print_table and print_block."""
+
+    def render(self, body, **kwargs):
+        output = StringIO()
+        print_table(['Name', 'N'], body, plain=True, file=output, **kwargs)
+        return output.getvalue().splitlines()
+
+    def test_default_is_in_memory(self):
+        self.render(rows(3))
+        assert last_engine_choice() == EngineChoice('memory', 'no memory budget', 3)
+
+    def test_two_pass_layout_matches_memory_layout(self):
+        def body():
+            for i in range(1500):
+                yield ['x' * (1 if i < 1200 else 12), i]
+
+        expected = self.render(body())
+        lines = self.render(body(), memory_budget=1000)
+        assert last_engine_choice().engine == 'two-pass'
+        assert lines == expected
+
+    def test_two_pass_measures_typed_columns(self):
+        lines = self.render(([str(i), i * 1000] for i in range(1200)), engine='two-pass', thousands=True,
+                            index=True)
+        assert lines == self.render(([str(i), i * 1000] for i in range(1200)), thousands=True, index=True)
+        assert '1,199,000' in lines[-2]
+
+    def test_two_pass_footer_is_measured_with_all_rows(self):
+        lines = self.render(([str(i), i] for i in range(5000)), engine='two-pass', agg='2:sum')
+        assert lines == self.render([[str(i), i] for i in range(5000)], agg='2:sum')
+        assert lines[-2] == '┃    ┃12497500┃'
+
+    def test_interactive_latency_measures_first_rows_only(self):
+        lines = self.render((['x' * (1 if i < 1000 else 12), i] for i in range(1001)), latency='interactive')
+        assert last_engine_choice().engine == 'sample'
+        assert lines[-3] == '┃x   ┃999┃'
+        # text cells are cut to the sampled width, numbers are never cut
+        assert lines[-2] == '┃xxxx┃1000┃'
+
+    def test_limits_stay_in_memory(self):
+        self.render(rows(10), head=2, engine='two-pass')
+        assert (last_engine_choice().engine, last_engine_choice().reason) == ('memory', 'row limits')
+
+    def test_print_block_two_pass(self):
+        output = StringIO()
+        print_block(iter([['h'], ['a'], ['bbbb']]), plain=True, engine='two-pass', file=output)
+        assert last_engine_choice().engine == 'two-pass'
+        assert 'bbbb' in output.getvalue()
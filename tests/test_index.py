@@ -0,0 +1,70 @@
+"""Unit tests for the index column in tuible."""
+
+from unittest.mock import patch
+from io import StringIO
+from tuible.core import print_table
+from tuible.index import RowIndex, label_width
+from tuible.params import TuibleParams
+from tuible.table import TuibleTable
+
+
+class TestRowIndex:
+    """Test cases for RowIndex."""
+
+    def test_label_width(self):
+        assert [label_width(n) for n in (0, 9, 10, 999, 1000, -5, -10)] == [1, 1, 2, 3, 4, 2, 3]
+
+    def test_global_positions(self):
+        index = RowIndex(True, head_rows=1, start=100, step=10)
+        assert index.head_label(0) == '0'
+        assert index.body_label(0) == '100'
+        assert index.body_label(5000) == '50100'
+        assert index.width(5001) == 5
+
+    def test_default_start_continues_after_head(self):
+        assert RowIndex(True, head_rows=2).body_label(0) == '2'
+        assert RowIndex(True).body_label(0) == '1'
+
+    def test_explicit_labels(self):
+        index = RowIndex(False, head_rows=1, header_values=['ih', 'extra'], body_values=['i1'])
+        assert [index.head_label(0), index.body_label(0), index.body_label(1), index.body_label(2)] == [
+            'ih', 'i1', '', '']
+        index = RowIndex(False, head_rows=1, header_values=['ih', 'extra'])
+        assert index.body_label(0) == 'extra'
+        assert index.width(0) == 5
+
+
+class TestIndexColumn:
+    """Test cases for rendering the index column."""
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_width_grows_past_999(self, mock_stdout):
+        print_table(heads=['v'], body=[['x'] for _ in range(1200)], index=True, plain=True)
+        lines = mock_stdout.getvalue().splitlines()
+        assert lines[1] == '┃   0┃v┃'
+        assert lines[-2] == '┃1200┃x┃'
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_streamed_rows_use_expected_rows(self, mock_stdout):
+        body = (['x'] for _ in range(20))
+        print_table(heads=['v'], body=body, sample=2, index=True, plain=True,
+                    index_start=0, index_step=1000, expected_rows=20)
+        lines = mock_stdout.getvalue().splitlines()
+        assert lines[2] == '┃    0┃x┃'
+        assert lines[-2] == '┃19000┃x┃'
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_chunks_continue_from_offset(self, mock_stdout):
+        for offset in (0, 2):
+            params = TuibleParams()
+            params.parseArguments(['idx', 'body', 'a', ':b', '-nc', '-size', '-1', '-istart', '10', '-istep', '5'])
+            params.index_offset = offset
+            TuibleTable(params).execute()
+        assert mock_stdout.getvalue().splitlines() == ['┃ 10┃a┃', '┃ 15┃b┃', '┃ 20┃a┃', '┃ 25┃b┃']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_streamed_labels_are_never_truncated(self, mock_stdout):
+        print_table(heads=['v'], body=(['x'] for _ in range(5000)), sample=10, index=True, plain=True)
+        lines = mock_stdout.getvalue().splitlines()
+        assert lines[2] == '┃  1┃x┃'
+        assert lines[-2] == '┃5000┃x┃'
@@ -0,0 +1,166 @@
+"""Unit tests for the layout solver in tuible."""
+
+import pytest
+from unittest.mock import patch
+from io import StringIO
+from tuible.layout import ColumnStats, solve_layout
+from tuible.numeric import format_column
+from tuible.params import TuibleParams
+from tuible.table import TuibleTable
+
+
+class TestColumnStats:
+    """Test cases for ColumnStats."""
+
+    def test_from_lengths(self):
+        stats = ColumnStats.from_lengths(list(range(1, 101)))
+        assert stats.min == 1
+        assert stats.max == 100
+        assert stats.p90 == 90
+
+    def test_from_lengths_empty(self):
+        assert ColumnStats.from_lengths([]) == ColumnStats(0, 0, 0)
+
+
+class TestSolveLayout:
+    """Test cases for solve_layout."""
+
+    def test_natural_widths_when_they_fit(self):
+        stats = [ColumnStats(1, 5, 4), ColumnStats(2, 8, 6)]
+        assert solve_layout(stats, 20) == [5, 8]
+
+    def test_tails_share_leftover_budget(self):
+        stats = [ColumnStats(1, 50, 10), ColumnStats(1, 20, 10)]
+        widths = solve_layout(stats, 40)
+        assert sum(widths) == 40
+        assert widths[0] > widths[1] >= 10
+
+    def test_shrinks_towards_floors(self):
+        stats = [ColumnStats(2, 30, 20), ColumnStats(2, 30, 10)]
+        widths = solve_layout(stats, 20)
+        assert sum(widths) == 20
+        assert all(w >= 2 for w in widths)
+        assert widths[0] <= 20 and widths[1] <= 10
+
+    def test_grows_towards_min_first(self):
+        stats = [ColumnStats(30, 30, 30), ColumnStats(10, 10, 10)]
+        assert solve_layout(stats, 21) == [16, 5]
+
+    def test_width_one_when_budget_too_small(self):
+        stats = [ColumnStats(3, 9, 5), ColumnStats(0, 4, 2)]
+        assert solve_layout(stats, 1) == [1, 1]
+
+    def test_never_exceeds_budget(self):
+        stats = [ColumnStats(1, m, m // 2) for m in (7, 13, 29, 3, 101)]
+        for budget in range(5, 160):
+            widths = solve_layout(stats, budget)
+            assert sum(widths) <= max(budget, 5)
+            assert all(w >= 1 for w in widths)
+
+
+class TestTableFit:
+    """Test cases for fitting tables into a width budget."""
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_width_budget_includes_index_and_borders(self, mock_stdout):
+        params = TuibleParams()
+        params.parseArguments(['top', 'idx', 'head', 'A', 'B', 'body', 'x' * 60, 'y' * 60, 'bot',
+                               '-width', '40', '-nc'])
+        TuibleTable(params).execute()
+        lines = mock_stdout.getvalue().splitlines()
+        assert all(len(line) == 40 for line in lines)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_fit_shrinks_fixed_size_columns(self, mock_stdout):
+        params = TuibleParams()
+        params.parseArguments(['body', 'a', 'b', '-fit', '-nc'])
+        TuibleTable(params).execute()
+        assert mock_stdout.getvalue() == '┃a┃b┃\n'
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_no_automatic_fit_without_terminal(self, mock_stdout):
+        params = TuibleParams()
+        params.parseArguments(['body', 'x' * 300, '-size', '-1', '-nc'])
+        TuibleTable(params).execute()
+        assert 'x' * 300 in mock_stdout.getvalue()
+
+    def test_automatic_fit_on_terminal(self):
+        params = TuibleParams()
+        params.parseArguments(['body', 'x' * 300, '-size', '-1'])
+        with patch('tuible.table.stream_is_terminal', return_value=True), \
+                patch('shutil.get_terminal_size', return_value=__import__('os').terminal_size((50, 20))):
+            table = TuibleTable(params)
+        assert params.column_widths == [48]
+
+
+class TestColumnWindow:
+    """Test cases for the column window mode."""
+
+    def _wide_params(self, *extra):
+        params = TuibleParams()
+        params.parseArguments(['idx', 'head'] + [f'h{i:03d}' for i in range(200)]
+                              + ['body'] + [f'v{i:03d}' for i in range(200)]
+                              + ['-size', '-1', '-nc'] + list(extra))
+        return params
+
+    def test_window_selects_fitting_columns(self):
+        params = self._wide_params('-win', '10', '-width', '30')
+        table = TuibleTable(params)
+        # 1 border + 3 index + 1 separator, then 5 columns of 4 chars + 1 separator
+        assert table.visible_columns == [10, 11, 12, 13, 14]
+        assert table.params.column_count == 6
+        assert params.column_count == 201
+
+    def test_frozen_columns_stay_visible(self):
+        params = self._wide_params('-win', '100', '-frz', '2', '-width', '30')
+        table = TuibleTable(params)
+        assert table.visible_columns == [0, 1, 100, 101, 102]
+
+    def test_columns_outside_window_are_not_measured(self):
+        params = self._wide_params('-win', '5', '-width', '30')
+        with patch.object(TuibleTable, '_measure_column', autospec=True,
+                          side_effect=lambda self, params, col: 4) as measure:
+            TuibleTable(params)
+        measured = [call.args[2] for call in measure.call_args_list]
+        assert measured == [5, 6, 7, 8, 9, 10]
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_typed_columns_outside_window_are_not_formatted(self, mock_stdout):
+        from tuible.core import print_table
+        body = [[i * 0.5 + j for j in range(200)] for i in range(100)]
+        with patch('tuible.table.format_column', side_effect=format_column) as formatted:
+            print_table(heads=[f'h{i}' for i in range(200)], body=body, plain=True, window_start=10)
+        lines = mock_stdout.getvalue().splitlines()
+        assert lines[1].startswith('┃h10 ┃h11 ┃')
+        assert lines[3].startswith('┃10.5┃11.5┃')
+        # the visible columns plus the one that did not fit
+        assert formatted.call_count == lines[1].count('┃')
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_window_renders_only_visible_columns(self, mock_stdout):
+        from tuible.core import print_table
+        print_table(heads=[f'h{i}' for i in range(50)], body=[[f'v{i}' for i in range(50)]],
+                    plain=True, window_start=40, frozen_columns=1)
+        lines = mock_stdout.getvalue().splitlines()
+        assert lines[1].startswith('┃h0┃h40┃h41┃')
+        assert 'h39' not in lines[1]
+
+    def test_start_past_last_column_shows_last_column(self):
+        params = self._wide_params('-win', '500', '-width', '30')
+        table = TuibleTable(params)
+        assert table.visible_columns == [199]
+        params = self._wide_params('-win', '500', '-frz', '2', '-width', '30')
+        assert TuibleTable(params).visible_columns == [0, 1, 199]
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_out_of_range_window_keeps_rows(self, mock_stdout):
+        params = TuibleParams()
+        params.parseArguments(['top', 'idx', 'head', 'a', 'b', 'body', 'x', 'y', 'bot', '-win', '5', '-nc', '-size', '-1'])
+        TuibleTable(params).execute()
+        assert mock_stdout.getvalue().splitlines() == ['┏━━━┳━┓', '┃  0┃b┃', '┃  1┃y┃', '┗━━━┻━┛']
+
+    def test_at_least_one_scrolled_column(self):
+        params = TuibleParams()
+        params.parseArguments(['body', 'x' * 100, 'y', '-size', '-1', '-win', '0', '-width', '20'])
+        table = TuibleTable(params)
+        assert table.visible_columns == [0]
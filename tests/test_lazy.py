@@ -0,0 +1,61 @@
+"""Unit tests for lazy cell conversion in tuible."""
+
+from collections import Counter
+from unittest.mock import patch
+from io import StringIO
+from tuible.core import print_table
+from tuible.lazy import BLOCK_SIZE, LazyColumn
+
+
+class Expensive:
+    """Cell whose conversions to text are counted."""
+    calls: Counter = Counter()
+
+    def __init__(self, name):
+        self.name = name
+
+    def __str__(self):
+        Expensive.calls[self.name] += 1
+        return self.name
+
+
+class TestLazyColumn:
+    """Test cases for LazyColumn."""
+
+    def setup_method(self):
+        Expensive.calls.clear()
+
+    def test_cells_convert_once(self):
+        column = LazyColumn([Expensive('a'), 'b', 3])
+        assert column[0] == 'a' and column[0] == 'a'
+        assert list(column) == ['a', 'b', '3']
+        assert list(column) == ['a', 'b', '3']
+        assert Expensive.calls == {'a': 1}
+
+    def test_iteration_converts_only_the_blocks_reached(self):
+        column = LazyColumn([Expensive(str(i)) for i in range(BLOCK_SIZE * 3)])
+        iterator = iter(column)
+        assert [next(iterator) for _ in range(5)] == ['0', '1', '2', '3', '4']
+        assert len(Expensive.calls) == BLOCK_SIZE
+
+
+class TestLazyTable:
+    """Test cases for converting only the cells that are shown."""
+
+    def setup_method(self):
+        Expensive.calls.clear()
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_measured_and_rendered_cells_convert_once(self, mock_stdout):
+        print_table(heads=['a', 'b'], body=[[Expensive('x'), Expensive('y')]], plain=True)
+        assert mock_stdout.getvalue().splitlines()[2] == '┃x┃y┃'
+        assert Expensive.calls == {'x': 1, 'y': 1}
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_columns_outside_the_window_are_not_converted(self, mock_stdout):
+        body = [[Expensive(f'{col}{row}') for col in 'abcdef'] for row in range(3)]
+        with patch('shutil.get_terminal_size', return_value=__import__('os').terminal_size((12, 24))):
+            print_table(heads=list('ABCDEF'), body=body, window_start=2, plain=True)
+        assert mock_stdout.getvalue().splitlines()[1] == '┃C ┃D ┃E ┃'
+        assert not {name for name in Expensive.calls if name[0] in 'ab'}
+        assert set(Expensive.calls.values()) == {1}
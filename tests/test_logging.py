@@ -0,0 +1,90 @@
+"""Unit tests for the logging handler in tuible."""
+
+import logging
+from io import StringIO
+from tuible.logging import TableHandler
+
+
+def make_logger(handler):
+    logger = logging.getLogger(f'tuible.test.{id(handler)}')
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    return logger
+
+
+class TestTableHandler:
+    """Test cases for TableHandler."""
+
+    def test_buffers_until_capacity(self):
+        output = StringIO()
+        handler = TableHandler(columns=[('levelname', 5), ('message', None)], capacity=3,
+                               flush_interval=None, plain=True, stream=output)
+        logger = make_logger(handler)
+        logger.info('one')
+        logger.info('second')
+        assert output.getvalue() == ''
+        logger.warning('three')
+        assert output.getvalue().splitlines() == [
+            '┃level┃message┃', '┃INFO ┃one    ┃', '┃INFO ┃second ┃', '┃WARNI┃three  ┃']
+
+    def test_learned_widths_stay_stable(self):
+        output = StringIO()
+        handler = TableHandler(columns=[('message', None)], capacity=1, show_head=False,
+                               plain=True, stream=output)
+        logger = make_logger(handler)
+        logger.info('abc')
+        logger.info('longer message')
+        assert output.getvalue().splitlines() == ['┃abc┃', '┃lon┃']
+
+    def test_flush_level_and_close(self):
+        output = StringIO()
+        handler = TableHandler(columns=[('name', 4), ('message', 6)], show_head=False,
+                               flush_interval=None, plain=True, stream=output)
+        logger = make_logger(handler)
+        logger.info('queued')
+        assert output.getvalue() == ''
+        logger.error('boom')
+        assert len(output.getvalue().splitlines()) == 2
+        logger.info('last')
+        handler.close()
+        assert output.getvalue().splitlines()[-1] == '┃tuib┃last  ┃'
+
+    def test_timer_flushes_without_further_records(self):
+        output = StringIO()
+        handler = TableHandler(columns=[('message', 5)], show_head=False, flush_interval=0.05,
+                               plain=True, stream=output)
+        logger = make_logger(handler)
+        logger.info('alone')
+        assert output.getvalue() == ''
+        timer = handler._timer
+        timer.join(5)
+        assert output.getvalue().splitlines() == ['┃alone┃']
+        assert handler._timer is None
+
+    def test_flush_cancels_the_timer(self):
+        output = StringIO()
+        handler = TableHandler(columns=[('message', 5)], show_head=False, flush_interval=60,
+                               plain=True, stream=output)
+        logger = make_logger(handler)
+        logger.info('first')
+        timer = handler._timer
+        assert timer.is_alive()
+        handler.close()
+        timer.join(5)
+        assert not timer.is_alive()
+        assert output.getvalue().splitlines() == ['┃first┃']
+
+    def test_default_columns_with_exception(self):
+        output = StringIO()
+        handler = TableHandler(plain=True, stream=output)
+        handler.setFormatter(logging.Formatter(datefmt='%Y'))
+        logger = make_logger(handler)
+        try:
+            raise ValueError('bad')
+        except ValueError:
+            logger.exception('failed')
+        lines = output.getvalue().splitlines()
+        assert lines[1].startswith('┃20')
+        assert '┃ERROR   ┃' in lines[1] and lines[1].endswith('┃failed ┃')
+        assert lines[-1] == 'ValueError: bad'
@@ -0,0 +1,119 @@
+"""Unit tests for typed numeric columns in tuible."""
+
+from decimal import Decimal
+
+import pytest
+from unittest.mock import patch
+from io import StringIO
+from tuible.core import print_block, print_table
+from tuible.numeric import detect_type, format_column, int_width, number_formatter, parse_type_spec
+from tuible.params import TuibleParams
+from tuible.table import TuibleTable
+
+
+class TestNumberFormatting:
+    """Test cases for type detection and the precompiled formatters."""
+
+    def test_parse_spec(self):
+        assert parse_type_spec('2:int,3:Float:2,4:percent') == [(2, 'int', None), (3, 'float', 2), (4, 'percent', None)]
+        with pytest.raises(Exception):
+            parse_type_spec('2:money')
+        with pytest.raises(Exception):
+            parse_type_spec('0:int')
+
+    def test_detect_type(self):
+        assert detect_type([1, 2, 3]) == 'int'
+        assert detect_type([1, 2.5]) == 'float'
+        assert detect_type([1, Decimal('2.50')]) == 'decimal'
+        assert detect_type([1, '2']) is None
+        assert detect_type([True, 1]) is None
+        assert detect_type([]) is None
+
+    def test_formatters(self):
+        assert number_formatter('int', thousands=True)(1234567) == '1,234,567'
+        assert number_formatter('float', 2)(3.14159) == '3.14'
+        assert number_formatter('float', 2, True)('1234.5') == '1,234.50'
+        assert number_formatter('decimal', 3)(Decimal('1.5')) == '1.500'
+        assert number_formatter('percent')(0.1234) == '12.3%'
+        assert number_formatter('int')('n/a') == 'n/a'
+
+    def test_int_formatter_keeps_fractions_and_text(self):
+        fmt = number_formatter('int', None, False)
+        assert fmt(3.7) == '3.7'
+        assert fmt('n/a') == 'n/a'
+        assert fmt(2.0) == '2'
+        assert fmt(' 5 ') == '5'
+        assert number_formatter('float', 1, False)('n/a') == 'n/a'
+
+    def test_int_width_from_digits(self):
+        for number in (0, 7, -7, 999, 1000, -1234567, 10 ** 12):
+            assert int_width(number) == len(str(number))
+            assert int_width(number, thousands=True) == len(f'{number:,}')
+        cells, width = format_column([5, -1200, 30], 'int', thousands=True)
+        assert cells == ['5', '-1,200', '30'] and width == 6
+
+    def test_numpy_columns_are_vectorized(self):
+        numpy = pytest.importorskip('numpy')
+        assert format_column(numpy.array([3, -40, 500]), 'int') == (['3', '-40', '500'], 3)
+        assert format_column(numpy.array([0.5, 0.125]), 'percent', 1) == (['50.0%', '12.5%'], None)
+        assert format_column(numpy.array([1.0, 2.25]), 'float', 1)[0] == ['1.0', '2.2']
+
+
+class TestTypedColumns:
+    """Test cases for rendering typed numeric columns."""
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_detected_numbers_align_right(self, mock_stdout):
+        print_block([['name', 'qty', 'price'], ['apple', 3, 1.5], ['melon', 12, 10.25]], plain=True)
+        assert mock_stdout.getvalue().splitlines() == [
+            '┃name ┃qty┃price┃', '┃apple┃  3┃  1.5┃', '┃melon┃ 12┃10.25┃']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_declared_types_with_precision_and_separators(self, mock_stdout):
+        print_table(heads=['item', 'total', 'share'], body=[['a', 1234.5, 0.25], ['b', 98765.0, 0.75]],
+                    types={2: 'float:2', 3: 'percent:0'}, thousands=True, plain=True)
+        assert mock_stdout.getvalue().splitlines()[2:4] == ['┃a   ┃ 1,234.50┃  25%┃', '┃b   ┃98,765.00┃  75%┃']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_aggregates_and_sort_see_raw_values(self, mock_stdout):
+        print_table(heads=['v'], body=[[1000], [20000], [300]], sort='-1', agg='1:sum', thousands=True, plain=True)
+        lines = mock_stdout.getvalue().splitlines()
+        assert lines[2:5] == ['┃20,000┃', '┃ 1,000┃', '┃   300┃']
+        assert lines[-2] == '┃ 21300┃'
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_streamed_rows_use_the_formatters(self, mock_stdout):
+        body = (['r', i / 3] for i in range(1, 6))
+        print_table(heads=['row', 'third'], body=body, sample=2, types='2:float:3', plain=True)
+        lines = mock_stdout.getvalue().splitlines()
+        assert lines[3] == '┃r  ┃0.667┃'
+        assert lines[6] == '┃r  ┃1.667┃'
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_streamed_typed_cells_are_never_cut(self, mock_stdout):
+        print_table(['a'], iter([[1], [2], [3.7], ['n/a'], [12345]]), sample=2, plain=True)
+        assert mock_stdout.getvalue().splitlines()[4:7] == ['┃3.7┃', '┃n/a┃', '┃12345┃']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_fixed_widths_truncate_typed_cells(self, mock_stdout):
+        params = TuibleParams()
+        params.parseArguments(['top', 'head', 'n', 'name', 'body', '123456', ':7', 'abcdef', ':g', 'bot',
+                               '-size', '3', '-types', '1:int', '-nc'])
+        TuibleTable(params).execute()
+        assert mock_stdout.getvalue().splitlines()[2:4] == ['┃123┃abc┃', '┃  7┃g  ┃']
+        print_table(['a'], iter([[1], [2], [12345]]), sample=2, colsize=3, plain=True)
+        assert mock_stdout.getvalue().splitlines()[-2] == '┃123┃'
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_numpy_table(self, mock_stdout):
+        numpy = pytest.importorskip('numpy')
+        print_table(heads=['a', 'b'], body=numpy.array([[1, 250], [30, 4]]), plain=True)
+        assert mock_stdout.getvalue().splitlines()[2:4] == ['┃ 1┃250┃', '┃30┃  4┃']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_cli_types(self, mock_stdout):
+        params = TuibleParams()
+        params.parseArguments(['head', 'n', 'pct', 'body', 'a', '0.5', 'body', 'b', 'x',
+                               '-types', '2:percent', '-fnc', '-nc', '-size', '-1'])
+        TuibleTable(params).execute()
+        assert mock_stdout.getvalue().splitlines() == ['┃n┃ pct ┃', '┃a┃50.0%┃', '┃b┃  x  ┃']
@@ -0,0 +1,81 @@
+"""Unit tests for pipelined output in tuible."""
+
+import threading
+import pytest
+from io import StringIO
+from tuible.core import print_table
+from tuible.params import TuibleParams
+from tuible.pipeline import PipelinedWriter
+
+
+class BlockingStream(StringIO):
+    """Stream whose writes wait until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.release.wait()
+        return super().write(text)
+
+
+class FailingStream(StringIO):
+    def write(self, text):
+        raise OSError("broken pipe")
+
+
+class TestPipelinedWriter:
+    """Test cases for PipelinedWriter."""
+
+    def test_writes_chunks_in_order(self):
+        output = StringIO()
+        with PipelinedWriter(output) as writer:
+            for i in range(100):
+                writer.write(f"{i}\n")
+        assert output.getvalue() == ''.join(f"{i}\n" for i in range(100))
+        assert writer.chunks_written == 100
+
+    def test_full_queue_blocks_the_producer(self):
+        output = BlockingStream()
+        writer = PipelinedWriter(output, max_chunks=2)
+        written = []
+
+        def produce():
+            for i in range(10):
+                writer.write(f"{i}\n")
+                written.append(i)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        producer.join(0.3)
+        # one chunk held by the blocked writer plus two queued
+        assert producer.is_alive()
+        assert len(written) <= 3
+        output.release.set()
+        producer.join()
+        writer.close()
+        assert output.getvalue() == ''.join(f"{i}\n" for i in range(10))
+
+    def test_writer_errors_are_raised(self):
+        writer = PipelinedWriter(FailingStream())
+        writer.write("a\n")
+        with pytest.raises(OSError, match="broken pipe"):
+            writer.close()
+
+
+class TestPipelinedTable:
+    """Test cases for pipelined table output."""
+
+    def test_output_matches_direct_output(self):
+        rows = [[f"row {i}", i] for i in range(1000)]
+        expected = StringIO()
+        print_table(['Name', 'N'], rows, plain=True, index=True, agg='2:sum', file=expected)
+        output = StringIO()
+        print_table(['Name', 'N'], rows, plain=True, index=True, agg='2:sum', pipelined=True, file=output)
+        assert output.getvalue() == expected.getvalue()
+
+    def test_pipe_option(self):
+        params = TuibleParams()
+        params.parseArguments(['-pipe', 'body', 'a', 'b'])
+        assert params.pipelined is True
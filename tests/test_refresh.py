@@ -0,0 +1,38 @@
+"""Unit tests for the refresh scheduler in tuible."""
+
+import pytest
+from io import StringIO
+from tuible.refresh import RefreshScheduler
+
+
+class TestRefreshScheduler:
+    """Test cases for RefreshScheduler."""
+
+    def test_coalesces_updates_and_draws_final_state(self):
+        output = StringIO()
+        with RefreshScheduler(max_fps=5, plain=True, stream=output) as screen:
+            for n in range(1000):
+                screen.update(['n'], [[n]])
+        frames = output.getvalue().split('┏')[1:]
+        assert 1 <= screen.frames_drawn == len(frames) <= 3
+        assert screen.frames_drawn + screen.updates_coalesced == 1000
+        assert '┃999┃' in frames[-1]
+
+    def test_in_place_redraw(self):
+        output = StringIO()
+        screen = RefreshScheduler(max_fps=1000, in_place=True, plain=True, stream=output,
+                                  table_options={'colsize': 3})
+        screen.update(['a'], [['1']])
+        screen.close()
+        screen = RefreshScheduler(max_fps=1000, in_place=True, plain=True, stream=output)
+        screen._frame_lines = 4
+        screen.update(['a'], [['2']])
+        screen.close()
+        assert output.getvalue().endswith('\x1b[4F\x1b[J┏━┓\n┃a┃\n┃2┃\n┗━┛\n')
+        assert output.getvalue().startswith('┏━━━┓\n┃ a ┃\n┃1  ┃\n┗━━━┛\n')
+
+    def test_update_after_close(self):
+        screen = RefreshScheduler(plain=True, stream=StringIO())
+        screen.close()
+        with pytest.raises(Exception):
+            screen.update(['a'], [])
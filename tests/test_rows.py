@@ -0,0 +1,138 @@
+"""Unit tests for row stages in tuible."""
+
+import pytest
+from unittest.mock import patch
+from io import StringIO
+from tuible.core import print_block, print_table
+from tuible.params import TuibleParams
+from tuible.rows import limit_rows, parse_sort_spec, sort_rows, spill_rows, typed_key
+from tuible.table import TuibleTable
+
+
+class TestLimitRows:
+    """Test cases for limit_rows."""
+
+    def test_head_stops_reading_early(self):
+        consumed = []
+
+        def rows():
+            for i in range(1000):
+                consumed.append(i)
+                yield [i]
+
+        assert limit_rows(rows(), head=3) == [(0, [0]), (1, [1]), (2, [2])]
+        assert len(consumed) == 3
+
+    def test_tail_keeps_last_rows(self):
+        assert limit_rows(([i] for i in range(10)), tail=2) == [(8, [8]), (9, [9])]
+
+    def test_top_compares_numbers_numerically(self):
+        rows = [['a', '9'], ['b', '10'], ['c', '2'], ['d', 'n/a']]
+        assert limit_rows(rows, top=2, by=2) == [(1, ['b', '10']), (0, ['a', '9'])]
+        assert typed_key('10') > typed_key('9')
+
+    def test_top_ranks_blank_and_text_cells_lowest(self):
+        rows = [['a', '5'], ['b', ''], ['c', '10'], ['d', '7'], ['e', 'n/a'], ['f']]
+        assert limit_rows(rows, top=2, by=2) == [(2, ['c', '10']), (3, ['d', '7'])]
+        assert [position for position, _ in limit_rows(rows, top=6, by=2)] == [2, 3, 0, 4, 1, 5]
+
+    def test_top_then_head(self):
+        rows = [[i] for i in (5, 1, 9, 3)]
+        assert limit_rows(rows, top=3, head=1) == [(2, [9])]
+
+
+class TestSortRows:
+    """Test cases for sort_rows."""
+
+    def test_typed_multi_key_sort(self):
+        rows = [['b', '10'], ['a', '9'], ['b', '2'], ['a', '10']]
+        assert list(sort_rows(rows, [1, -2])) == [['a', '10'], ['a', '9'], ['b', '10'], ['b', '2']]
+
+    def test_spilled_runs_match_in_memory_sort(self):
+        rows = [[str((i * 7919) % 101), f'r{i}'] for i in range(1000)]
+        expected = list(sort_rows(rows, [-1], buffer_rows=len(rows) + 1))
+        with patch('tuible.rows.MERGE_FAN_IN', 4):
+            assert list(sort_rows(iter(rows), [-1], buffer_rows=30)) == expected
+        # stable: equal keys keep their input order
+        assert [row for row in expected if row[0] == '100'] == [row for row in rows if row[0] == '100']
+
+    def test_runs_are_merged_in_levels(self):
+        written = []
+
+        def counting_spill(rows):
+            def counted():
+                for row in rows:
+                    written.append(row)
+                    yield row
+            return spill_rows(counted())
+
+        rows = [[str((i * 7919) % 1009), f'r{i}'] for i in range(1000)]
+        expected = sorted(rows, key=lambda row: typed_key(row[0]))
+        with patch('tuible.rows.MERGE_FAN_IN', 4), patch('tuible.rows.spill_rows', counting_spill):
+            assert list(sort_rows(iter(rows), [1], buffer_rows=10)) == expected
+        # 100 runs: written once, then once per level of 4-way merges (at most 4 levels)
+        assert len(written) <= 5 * len(rows)
+
+    def test_invalid_spec(self):
+        assert parse_sort_spec('2,-3') == [2, -3]
+        with pytest.raises(Exception):
+            parse_sort_spec('0')
+        with pytest.raises(Exception):
+            parse_sort_spec('a')
+
+
+class TestPrintTableLimits:
+    """Test cases for row limits in the Python API and CLI."""
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_tail_from_generator_with_original_index(self, mock_stdout):
+        body = ([f'row{i}', str(i)] for i in range(500))
+        print_table(heads=['name', 'n'], body=body, tail=2, index=True, plain=True)
+        lines = mock_stdout.getvalue().splitlines()
+        assert lines[1] == '┃  0┃ name ┃ n ┃'
+        assert lines[2] == '┃499┃row498┃498┃'
+        assert lines[3] == '┃500┃row499┃499┃'
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_widths_only_over_shown_rows(self, mock_stdout):
+        body = [['x' * 50], ['short'], ['tiny']]
+        print_block([['h']] + body, tail=2, plain=True)
+        assert mock_stdout.getvalue().splitlines() == ['┃  h  ┃', '┃short┃', '┃tiny ┃']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_cli_top_by_column(self, mock_stdout):
+        params = TuibleParams()
+        params.parseArguments(['idx', 'head', 'name', 'score', 'body', 'a', '5', 'body', 'b', '50',
+                               'body', 'c', '7', '-top', '2', '-by', '2', '-nc', '-size', '-1'])
+        TuibleTable(params).execute()
+        assert mock_stdout.getvalue().splitlines() == [
+            '┃  0┃name┃score┃', '┃  2┃b   ┃50   ┃', '┃  3┃c   ┃7    ┃']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_cli_top_skips_blank_cells(self, mock_stdout):
+        params = TuibleParams()
+        params.parseArguments(['top', 'head', 'name', 'val', 'body', 'a', ':b', ':c', ':d', '5', ':', ':10', ':7',
+                               'bot', '-top', '2', '-by', '2', '-nc', '-size', '-1'])
+        TuibleTable(params).execute()
+        assert mock_stdout.getvalue().splitlines()[2:4] == ['┃c   ┃10 ┃', '┃d   ┃7  ┃']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_cli_sort(self, mock_stdout):
+        params = TuibleParams()
+        params.parseArguments(['head', 'name', 'score', 'body', 'a', '5', 'body', 'b', '50',
+                               'body', 'c', '7', '-sort', '-2', '-nc', '-size', '-1'])
+        TuibleTable(params).execute()
+        assert mock_stdout.getvalue().splitlines() == [
+            '┃name┃score┃', '┃b   ┃50   ┃', '┃c   ┃7    ┃', '┃a   ┃5    ┃']
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_sorted_stream_with_sample(self, mock_stdout):
+        body = ([f'r{i}', str(i % 7)] for i in range(200))
+        print_table(heads=['name', 'n'], body=body, sort='2,1', sort_buffer=16, sample=5,
+                    index=True, plain=True)
+        lines = mock_stdout.getvalue().splitlines()
+        assert len(lines) == 203
+        assert lines[2] == '┃  1┃r0  ┃0┃'
+        assert lines[3] == '┃  2┃r105┃0┃'
+        # widths come from the sampled rows
+        assert lines[-2] == '┃200┃r97 ┃6┃'